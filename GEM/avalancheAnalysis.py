@@ -1,7 +1,11 @@
 import numpy as np 
 import matplotlib.pyplot as plt
 import pandas as pd 
-from scipy.optimize import curve_fit
+from sweepModule import *
+from fitModule import *
+from figureModule import *
+from interpolationModule import *
+from raggedModule import *
 
 
 plt.rcParams.update({
@@ -19,13 +23,15 @@ def readAvalancheData(ar, energy, V, showHists = False, showDistribution = False
 	ne 		 = dataFrame['ne']
 	nIons 	 = dataFrame['nIons']
 
-	tot = dataFrame.groupby('step')['filTot'].sum()
+	events = RaggedEvents.fromDataFrame(dataFrame, 'step', ['filTot', 'ne', 'nIons'])
+
+	tot = pd.Series(events.sum('filTot'), index = events.ids)
 
 	gainAllMean = tot.mean()
 	gainAllStd  = tot.std()
 
-	totMean = dataFrame.groupby('step')['filTot'].mean()
-	totStd = dataFrame.groupby('step')['filTot'].std()
+	totMean = pd.Series(events.mean('filTot'), index = events.ids)
+	totStd = pd.Series(events.std('filTot'), index = events.ids)
 
 	gainAvgMean = totMean.mean()
 	gainAvgStd  = totMean.std()
@@ -36,14 +42,14 @@ def readAvalancheData(ar, energy, V, showHists = False, showDistribution = False
 	ionsAllMean = nIons.mean()
 	ionsAllStd = nIons.std()
 
-	ne = dataFrame.groupby('step')['ne'].sum()
-	nIons = dataFrame.groupby('step')['nIons'].sum()
+	ne = pd.Series(events.sum('ne'), index = events.ids)
+	nIons = pd.Series(events.sum('nIons'), index = events.ids)
 
 	electronsEventMean = ne.mean()
 	electronsEventStd = ne.std()
 
 	ionsEventMean = nIons.mean()
-	ionsEventStd = ne.std()
+	ionsEventStd = nIons.std()
 
 	if(showHists):
 		
@@ -98,353 +104,116 @@ def readAvalancheData(ar, energy, V, showHists = False, showDistribution = False
 		plt.savefig('avalancheGraphs/HistDesGananciaProm.eps', format = 'eps')
 		plt.show()
 
-	return np.array([gainAllMean, gainAllStd, gainAvgMean, gainAvgStd, ne, nIons, electronsAllMean, electronsAllStd, electronsEventMean, electronsEventStd], dtype  = np.dtype('O'))
+	return np.array([gainAllMean, gainAllStd, gainAvgMean, gainAvgStd, ionsEventMean, ionsEventStd, electronsAllMean, electronsAllStd, electronsEventMean, electronsEventStd, len(tot)])
+
+
+#	Figures
+
+AVALANCHE_GRAPHS_PATH = 'avalancheGraphs/'
+
+AVALANCHE_FIXED_V_FIGURES = [
+	FigureSpec('gainAllMean', 'ar', 'energy', r'Ganancia total contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Ganancia total', 'GananciaTot-Ar-E'),
+	FigureSpec('gainAllStd', 'ar', 'energy', r'Desviación ganancia total contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Desviación ganancia total', 'DesGananciaTot-Ar-E'),
+	FigureSpec('gainAvgMean', 'ar', 'energy', r'Ganancia promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Ganancia promedio', 'GananciaProm-Ar-E'),
+	FigureSpec('gainAvgStd', 'ar', 'energy', r'Desviación ganancia promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Desviación ganancia promedio', 'DesGananciaProm-Ar-E'),
+	FigureSpec('electronsAllMean', 'ar', 'energy', r'Número de electrones promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Número de electrones promedio', 'EleNumProm-Ar-E', fit = 'linear'),
+	FigureSpec('electronsAllStd', 'ar', 'energy', r'Desviación del número de electrones promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Desviación número de electrones promedio', 'DesEleNumProm-Ar-E'),
+	FigureSpec('electronsEventMean', 'ar', 'energy', r'Número de electrones totales contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Número de electrones totales', 'EleNumTot-Ar-E'),
+	FigureSpec('electronsEventStd', 'ar', 'energy', r'Desviación del número de electrones totales contra $\%$Ar para $E_{\mu^{-}}$ fijas', 'Desviación número de electrones totales', 'DesEleNumTot-Ar-E'),
+	FigureSpec('gainAllMean', 'energy', 'ar', r'Ganancia total contra energía del muón para $\%$Ar/CO2 fijos', 'Ganancia total', 'GananciaTot-E-Ar', xscale = 'log'),
+	FigureSpec('gainAllStd', 'energy', 'ar', r'Desviación ganancia total contra energía del muón para $\%$Ar/CO2 fijos', 'Desviación ganancia total', 'DesGananciaTot-E-Ar', xscale = 'log'),
+	FigureSpec('gainAvgMean', 'energy', 'ar', r'Ganancia promedio contra energía del muón para $\%$Ar/CO2 fijos', 'Ganancia promedio', 'GananciaProm-E-Ar', xscale = 'log'),
+	FigureSpec('gainAvgStd', 'energy', 'ar', r'Desviación ganacia promedio contra energía del muón para $\%$Ar/CO2 fijos', 'Desviación ganancia promedio', 'DesGananciaProm-E-Ar', xscale = 'log'),
+	FigureSpec('electronsAllMean', 'energy', 'ar', r'Número de electrones promedio contra energía del muón para $\%$Ar/CO2 fijos', 'Número de electrones promedio', 'EleNumProm-E-Ar', xscale = 'log'),
+	FigureSpec('electronsAllStd', 'energy', 'ar', r'Desviación del número de electrones promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos', 'Desviación número de electrones promedio', 'DesEleNumProm-E-Ar', xscale = 'log'),
+	FigureSpec('electronsEventMean', 'energy', 'ar', r'Número de electrones totales contra energía del muón para $\%$Ar/CO2 fijos', 'Número de electrones totales', 'EleNumTot-E-Ar', xscale = 'log'),
+	FigureSpec('electronsEventStd', 'energy', 'ar', r'Desviación del número de electrones totales contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos', 'Desviación número de electrones totales', 'DesEleNumTot-E-Ar', xscale = 'log'),
+]
+
+AVALANCHE_FIXED_E_FIGURES = [
+	FigureSpec('gainAllMean', 'V', 'ar', r'Ganancia total contra voltaje para $\%$ Ar/CO2 fijos', 'Ganancia total', 'GananciaTot-V-Ar'),
+	FigureSpec('gainAllStd', 'V', 'ar', r'Desviación estándar para ganancia total contra voltaje para $\%$ Ar/CO2 fijos', 'Desviación ganancia total', 'DesGananciaTot-V-Ar'),
+	FigureSpec('gainAvgMean', 'V', 'ar', r'Ganancia promedio contra voltaje para $\%$ Ar/CO2 fijos', 'Ganancia promedio', 'GananciaProm-V-Ar'),
+	FigureSpec('gainAvgStd', 'V', 'ar', r'Desviación estándar para ganancia promedio contra voltaje para $\%$ Ar/CO2 fijos', 'Desviación ganancia promedio', 'DesGananciaProm-V-Ar'),
+	FigureSpec('electronsAllMean', 'V', 'ar', r'Número de electrones promedio contra voltaje para $\%$ Ar/CO2 fijos', 'Número de electrones promedio', 'EleNumProm-V-Ar'),
+	FigureSpec('electronsAllStd', 'V', 'ar', r'Desviación del número de promedio totales contra voltaje para $\%$ Ar/CO2 fijos', 'Desviación número de electrones promedio', 'DesEleNumProm-V-Ar'),
+	FigureSpec('electronsEventMean', 'V', 'ar', r'Número de electrones totales contra voltaje para $\%$ Ar/CO2 fijos', 'Número de electrones totales', 'EleNumTot-V-Ar'),
+	FigureSpec('electronsEventStd', 'V', 'ar', r'Desviación del número de electrones totales contra voltaje para $\%$ Ar/CO2 fijos', 'Desviación número de electrones totales', 'DesEleNumTot-V-Ar'),
+	FigureSpec('gainAllMean', 'ar', 'V', r'Ganancia total contra $\%$ Ar para voltajes fijos', 'Ganancia total', 'GananciaTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('gainAllStd', 'ar', 'V', r'Desviación estándar para ganancia total contra $\%$ Ar para voltajes fijos', 'Desviación ganancia total', 'DesGananciaTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('gainAvgMean', 'ar', 'V', r'Ganancia promedio contra $\%$ Ar para voltajes fijos', 'Ganancia promedio', 'GananciaProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('gainAvgStd', 'ar', 'V', r'Desviación estándar para ganancia promedio contra $\%$ Ar para voltajes fijos', 'Desviación ganancia promedio', 'DesGananciaProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('electronsAllMean', 'ar', 'V', r'Número de electrones promedio contra $\%$ Ar para voltajes fijos', 'Número de electrones promedio', 'EleNumProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('electronsAllStd', 'ar', 'V', r'Desviación del número de electrones promedio contra $\%$ Ar para voltajes fijos', 'Desviación número de electrones promedio', 'DesEleNumProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('electronsEventMean', 'ar', 'V', r'Número de electrones totales contra $\%$ Ar para voltajes fijos', 'Número de electrones totales', 'EleNumTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('electronsEventStd', 'ar', 'V', r'Desviación del número de electrones totales contra $\%$ Ar para voltajes fijos', 'Desviación número de electrones totales', 'DesEleNumTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+]
+
+POLYA_FIXED_E_FIGURES = [
+	FigureSpec('polyaGainMean', 'V', 'ar', r'Ganancia media de Polya contra voltaje para $\%$ Ar/CO2 fijos', 'Ganancia media de Polya', 'PolyaGanancia-V-Ar'),
+	FigureSpec('polyaTheta', 'V', 'ar', r'Parámetro $\theta$ de Polya contra voltaje para $\%$ Ar/CO2 fijos', r'$\theta$', 'PolyaTheta-V-Ar'),
+]
 
 def curveFit(x, y, mod = 'linear', guess = None):
 	if(mod == 'linear'):
-		coef, cov = curve_fit(lambda x, m, b: m*x + b, x, y, p0 = guess)
-
-		def f(x):
-			return x*coef[0] + coef[1]
+		coef, cov = fitLinear(x, y)
 
-			
 		print(coef[0], 	np.sqrt(cov)[0, 0])
 		print(coef[1], np.sqrt(cov)[1, 1])
 
-
-		return np.vectorize(f)
+		return modelEvaluator('linear', coef)
 
 	elif(mod == 'exp'):
-		coef, cov = curve_fit(lambda x, a, b, c: a*np.exp(b*x) + c, x, y, p0 = guess)
-
-		def f(x):
-			return coef[0]*np.exp(coef[1]*x) + coef[2]
+		coef, cov = fitNonlinear('exp', x, y, guess, workers = 1)
 
-		return np.vectorize(f)
+		return modelEvaluator('exp', coef)
 
 def fixedEfixedV(V, energy):
-	argons = np.array([60, 65, 70, 75, 80])
-	return np.vectorize(readAvalancheData, excluded=['energy', 'V'], signature = '()->(n)')(energy = energy, V = V, ar = argons)
+	return avalancheCube.get(energy = energy, V = V)
 
 def fixedEfixedAr(ar, energy):
-	voltages = np.array([400, 410, 420, 430, 440, 450, 460, 470, 480, 490, 500])
-	return np.vectorize(readAvalancheData, excluded=['energy', 'ar'], signature = '()->(n)')(ar = ar, V = voltages, energy = energy)
+	return avalancheCube.get(ar = ar, energy = energy)
 	
 def fixedE(energy = 9):
-	voltages = np.array([400, 410, 420, 430, 440, 450, 460, 470, 480, 490, 500])
-	argons = np.array([60, 65, 70, 75, 80])
+	renderFigures(AVALANCHE_FIXED_E_FIGURES, avalancheCube, AVALANCHE_GRAPHS_PATH, energy = energy)
 
-	fixedAr = np.vectorize(fixedEfixedAr, excluded = ['energy'], signature = '()->(n,m)')(ar = argons, energy = energy)
-	
-	gainAllMean, gainAllStd, gainAvgMean, gainAvgStd, ne, nIons, electronsAllMean, electronsAllStd, electronsEventMean, electronsEventStd = fixedAr[:,:,0 ], fixedAr[:,:,1], fixedAr[:,:,2], fixedAr[:,:,3], fixedAr[:,:,4], fixedAr[:,:,5], fixedAr[:,:,6], fixedAr[:,:,7], fixedAr[:,:,8], fixedAr[:,:,9]          
-	
+def polyaFixedE(energy = 9):
+	renderFigures(POLYA_FIXED_E_FIGURES, polyaCube, AVALANCHE_GRAPHS_PATH, energy = energy)
 
-	plt.title(r'Ganancia total contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.scatter(voltages, gainAllMean[0, :], color = 'purple')
-	plt.plot(voltages, gainAllMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.plot(voltages, gainAllMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, gainAllMean[1, :], color = 'red')
-	plt.plot(voltages, gainAllMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, gainAllMean[2, :], color = 'green')
-	plt.plot(voltages, gainAllMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, gainAllMean[3, :], color = 'magenta')
-	plt.plot(voltages, gainAllMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, gainAllMean[4, :], color = 'blue')
-	plt.ylabel('Ganancia total')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación estándar para ganancia total contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, gainAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, gainAllStd[0, :], color = 'purple')
-	plt.plot(voltages, gainAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, gainAllStd[1, :], color = 'red')
-	plt.plot(voltages, gainAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, gainAllStd[2, :], color = 'green')
-	plt.plot(voltages, gainAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, gainAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, gainAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, gainAllStd[4, :], color = 'blue')
-	plt.ylabel('Desviación ganancia total')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Ganancia promedio contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, gainAvgMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, gainAvgMean[0, :], color = 'purple')
-	plt.plot(voltages, gainAvgMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, gainAvgMean[1, :], color = 'red')
-	plt.plot(voltages, gainAvgMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, gainAvgMean[2, :], color = 'green')
-	plt.plot(voltages, gainAvgMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, gainAvgMean[3, :], color = 'magenta')
-	plt.plot(voltages, gainAvgMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, gainAvgMean[4, :], color = 'blue')
-	plt.ylabel('Ganancia promedio')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación estándar para ganancia promedio contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, gainAvgStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, gainAvgStd[0, :], color = 'purple')
-	plt.plot(voltages, gainAvgStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, gainAvgStd[1, :], color = 'red')
-	plt.plot(voltages, gainAvgStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, gainAvgStd[2, :], color = 'green')
-	plt.plot(voltages, gainAvgStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, gainAvgStd[3, :], color = 'magenta')
-	plt.plot(voltages, gainAvgStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, gainAvgStd[4, :], color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones promedio contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, electronsAllMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, electronsAllMean[0, :], color = 'purple')
-	plt.plot(voltages, electronsAllMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, electronsAllMean[1, :], color = 'red')
-	plt.plot(voltages, electronsAllMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, electronsAllMean[2, :], color = 'green')
-	plt.plot(voltages, electronsAllMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, electronsAllMean[3, :], color = 'magenta')
-	plt.plot(voltages, electronsAllMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, electronsAllMean[4, :], color = 'blue')
-	plt.ylabel('Número de electrones promedio')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de promedio totales contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, electronsAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, electronsAllStd[0, :], color = 'purple')
-	plt.plot(voltages, electronsAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, electronsAllStd[1, :], color = 'red')
-	plt.plot(voltages, electronsAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, electronsAllStd[2, :], color = 'green')
-	plt.plot(voltages, electronsAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, electronsAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, electronsAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, electronsAllStd[4, :], color = 'blue')
-	plt.ylabel('Desviación número de electrones promedio')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones totales contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, electronsEventMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, electronsEventMean[0, :], color = 'purple')
-	plt.plot(voltages, electronsEventMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, electronsEventMean[1, :], color = 'red')
-	plt.plot(voltages, electronsEventMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, electronsEventMean[2, :], color = 'green')
-	plt.plot(voltages, electronsEventMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, electronsEventMean[3, :], color = 'magenta')
-	plt.plot(voltages, electronsEventMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, electronsEventMean[4, :], color = 'blue')
-	plt.ylabel('Número de electrones totales')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones totales contra voltaje para $\%$ Ar/CO2 fijos')
-	plt.plot(voltages, electronsEventStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, electronsEventStd[0, :], color = 'purple')
-	plt.plot(voltages, electronsEventStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, electronsEventStd[1, :], color = 'red')
-	plt.plot(voltages, electronsEventStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, electronsEventStd[2, :], color = 'green')
-	plt.plot(voltages, electronsEventStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, electronsEventStd[3, :], color = 'magenta')
-	plt.plot(voltages, electronsEventStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, electronsEventStd[4, :], color = 'blue')
-	plt.ylabel('Desviación número de electrones totales')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-
-	"""
-	plt.title(r'Distribución electrones por evento para $\%$ Ar/CO2 fijos a ')
-	plt.hist(gainAvgStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.hist(gainAvgStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.hist(gainAvgStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.hist(gainAvgStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.hist(gainAvgStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel('V')
-	plt.legend()
-	plt.tight_layout()
-	plt.show()
-
-	"""
-
-	plt.title(r'Ganancia total contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, gainAllMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, gainAllMean[:, 0], color = 'purple')
-	plt.plot(argons, gainAllMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, gainAllMean[:, 2], color = 'red')
-	plt.plot(argons, gainAllMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, gainAllMean[:, 4], color = 'green')
-	plt.plot(argons, gainAllMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, gainAllMean[:, 6], color = 'magenta')
-	plt.plot(argons, gainAllMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, gainAllMean[:, 8], color = 'blue')
-	plt.ylabel('Ganancia total')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación estándar para ganancia total contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, gainAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, gainAllStd[:, 0], color = 'purple')
-	plt.plot(argons, gainAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, gainAllStd[:, 2], color = 'red')
-	plt.plot(argons, gainAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, gainAllStd[:, 4], color = 'green')
-	plt.plot(argons, gainAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, gainAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, gainAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, gainAllStd[:, 8], color = 'blue')
-	plt.ylabel('Desviación ganancia total')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Ganancia promedio contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, gainAvgMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, gainAvgMean[:, 0], color = 'purple')
-	plt.plot(argons, gainAvgMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, gainAvgMean[:, 2], color = 'red')
-	plt.plot(argons, gainAvgMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, gainAvgMean[:, 4], color = 'green')
-	plt.plot(argons, gainAvgMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, gainAvgMean[:, 6], color = 'magenta')
-	plt.plot(argons, gainAvgMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, gainAvgMean[:, 8], color = 'blue')
-	plt.ylabel('Ganancia promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación estándar para ganancia promedio contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, gainAvgStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, gainAvgStd[:, 0], color = 'purple')
-	plt.plot(argons, gainAvgStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, gainAvgStd[:, 2], color = 'red')
-	plt.plot(argons, gainAvgStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, gainAvgStd[:, 4], color = 'green')
-	plt.plot(argons, gainAvgStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, gainAvgStd[:, 6], color = 'magenta')
-	plt.plot(argons, gainAvgStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, gainAvgStd[:, 8], color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones promedio contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, electronsAllMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, electronsAllMean[:, 0], color = 'purple')
-	plt.plot(argons, electronsAllMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, electronsAllMean[:, 2], color = 'red')
-	plt.plot(argons, electronsAllMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, electronsAllMean[:, 4], color = 'green')
-	plt.plot(argons, electronsAllMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, electronsAllMean[:, 6], color = 'magenta')
-	plt.plot(argons, electronsAllMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, electronsAllMean[:, 8], color = 'blue')
-	plt.ylabel('Número de electrones promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones promedio contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, electronsAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, electronsAllStd[:, 0], color = 'purple')
-	plt.plot(argons, electronsAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, electronsAllStd[:, 2], color = 'red')
-	plt.plot(argons, electronsAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, electronsAllStd[:, 4], color = 'green')
-	plt.plot(argons, electronsAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, electronsAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, electronsAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, electronsAllStd[:, 8], color = 'blue')
-	plt.ylabel('Desviación número de electrones promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones totales contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, electronsEventMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, electronsEventMean[:, 0], color = 'purple')
-	plt.plot(argons, electronsEventMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, electronsEventMean[:, 2], color = 'red')
-	plt.plot(argons, electronsEventMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, electronsEventMean[:, 4], color = 'green')
-	plt.plot(argons, electronsEventMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, electronsEventMean[:, 6], color = 'magenta')
-	plt.plot(argons, electronsEventMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, electronsEventMean[:, 8], color = 'blue')
-	plt.ylabel('Número de electrones totales')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones totales contra $\%$ Ar para voltajes fijos')
-	plt.plot(argons, electronsEventStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, electronsEventStd[:, 0], color = 'purple')
-	plt.plot(argons, electronsEventStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, electronsEventStd[:, 2], color = 'red')
-	plt.plot(argons, electronsEventStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, electronsEventStd[:, 2], color = 'green')
-	plt.plot(argons, electronsEventStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, electronsEventStd[:, 6], color = 'magenta')
-	plt.plot(argons, electronsEventStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, electronsEventStd[:, 8], color = 'blue')
-	plt.ylabel('Desviación número de electrones totales')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
+def gainVoltageInterpolated(energy = 9):
+
+	# Measured gains with their standard errors and the interpolated curve with its propagated band
+
+	gainInterpolator = SweepInterpolator(avalancheCube, 'gainAllMean', 'gainAllStd', 'events', method = 'spline', logScale = True, energy = energy)
+
+	voltagesCont = np.linspace(avalancheCube.voltages[0], avalancheCube.voltages[-1], 1000)
+
+	fig = plt.figure(figsize=(6, 6))
+
+	for ar, color in zip(avalancheCube.argons, SERIES_COLORS):
+
+		gains 		= avalancheCube.getField('gainAllMean', ar = ar, energy = energy)
+		errorGains 	= avalancheCube.getField('gainAllStd', ar = ar, energy = energy)/np.sqrt(avalancheCube.getField('events', ar = ar, energy = energy))
+
+		gainsCont, errorGainsCont = gainInterpolator(ar = ar, V = voltagesCont)
+
+		plt.errorbar(avalancheCube.voltages, gains, yerr = errorGains, fmt = '.', color = color)
+		plt.plot(voltagesCont, gainsCont, color = color, label = 'Ar/CO2 = {}/{}'.format(ar, 100 - ar))
+		plt.fill_between(voltagesCont, gainsCont - errorGainsCont, gainsCont + errorGainsCont, color = color, alpha = 0.3)
+
+	plt.ylabel('Ganancia')
+	plt.xlabel('Voltaje (V)')
+	plt.legend(loc = 'upper left')
 	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumTot-Ar-V.eps', format = 'eps')
-	plt.show()
+	plt.savefig(AVALANCHE_GRAPHS_PATH + 'GananciaInterpolada-V-Ar.eps', format = 'eps')
+	plt.close(fig)
 
+avalancheCube = getAvalancheCube()
+polyaCube = getPolyaCube()
 
 fixedE()
+polyaFixedE()
+gainVoltageInterpolated()
 
 readAvalancheData(60, 9, 400, showHists = True, showDistribution = True)
 
@@ -492,326 +261,13 @@ plt.show()
 """
 
 def fixedVfixedE(energy, V):
-	argons = np.array([60, 65, 70, 75, 80])
-	return np.vectorize(readAvalancheData, excluded=['energy', 'V'], signature = '()->(n)')(energy = energy, V = V, ar = argons)
+	return avalancheCube.get(energy = energy, V = V)
 
 def fixedVfixedAr(ar, V):
-	energies= np.array([7, 8, 9, 10, 11])
-	return np.vectorize(readAvalancheData, excluded=['ar', 'V'], signature = '()->(n)')(ar = ar, V = V, energy = energies)
+	return avalancheCube.get(ar = ar, V = V)
 	
 def fixedV(V = 400):
-	energies= np.array([7, 8, 9, 10, 11])
-	argons = np.array([60, 65, 70, 75, 80])
-
-	fixedE = np.vectorize(fixedVfixedE, excluded = ['V'], signature = '()->(n,m)')(V = V, energy = energies)
-	
-	#gainAllMean, gainAllStd, gainAvgMean, gainAvgStd, electronsAllMean, electronsAllStd, electronsEventMean, electronsEventStd, yAvgMean, yAvgStd = fixedE[:, :, 0], fixedE[:, :, 1], fixedE[:, :, 2], fixedE[:, :, 3], fixedE[:, :, 4], fixedE[:, :, 5], fixedE[:, :, 6], fixedE[:, :, 7], fixedE[:, :, 8], fixedE[:, :, 9]
-	gainAllMean, gainAllStd, gainAvgMean, gainAvgStd, ne, nIons, electronsAllMean, electronsAllStd, electronsEventMean, electronsEventStd = fixedE[:, :, 0], fixedE[:, :, 1], fixedE[:, :, 2], fixedE[:, :, 3], fixedE[:, :, 4], fixedE[:, :, 5], fixedE[:, :, 6], fixedE[:, :, 7], fixedE[:, :, 8], fixedE[:, :, 9]
-
-
-	# Intentar gráfica de fluctuaciones
-	plt.title(r'Ganancia total contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, gainAllMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, gainAllMean[0, :], color = 'purple')
-	plt.plot(argons, gainAllMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, gainAllMean[1, :], color = 'red')
-	plt.plot(argons, gainAllMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, gainAllMean[2, :], color = 'green')
-	plt.plot(argons, gainAllMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, gainAllMean[3, :], color = 'magenta')
-	plt.plot(argons, gainAllMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, gainAllMean[4, :], color = 'blue')
-	plt.ylabel('Ganancia total')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación ganancia total contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, gainAllStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, gainAllStd[0, :], color = 'purple')
-	plt.plot(argons, gainAllStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, gainAllStd[1, :], color = 'red')
-	plt.plot(argons, gainAllStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, gainAllStd[2, :], color = 'green')
-	plt.plot(argons, gainAllStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, gainAllStd[3, :], color = 'magenta')
-	plt.plot(argons, gainAllStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, gainAllStd[4, :], color = 'blue')
-	plt.ylabel('Desviación ganancia total')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Ganancia promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, gainAvgMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, gainAvgMean[0, :], color = 'purple')
-	plt.plot(argons, gainAvgMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, gainAvgMean[1, :], color = 'red')
-	plt.plot(argons, gainAvgMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, gainAvgMean[2, :], color = 'green')
-	plt.plot(argons, gainAvgMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, gainAvgMean[3, :], color = 'magenta')
-	plt.plot(argons, gainAvgMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, gainAvgMean[4, :], color = 'blue')
-	plt.ylabel('Ganancia promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación ganancia promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, gainAvgStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, gainAvgStd[0, :], color = 'purple')
-	plt.plot(argons, gainAvgStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, gainAvgStd[1, :], color = 'red')
-	plt.plot(argons, gainAvgStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, gainAvgStd[2, :], color = 'green')
-	plt.plot(argons, gainAvgStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, gainAvgStd[3, :], color = 'magenta')
-	plt.plot(argons, gainAvgStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, gainAvgStd[4, :], color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-
-	argonsCont = np.linspace(np.min(argons), np.max(argons), 1000)
-	fitArgonsCont = curveFit(argons, electronsAllMean[0, :])(argonsCont)
-
-	plt.title(r'Número de electrones promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.scatter(argons, electronsAllMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, electronsAllMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, electronsAllMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, electronsAllMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, electronsAllMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.plot(argonsCont, fitArgonsCont, color = 'black')
-	plt.ylabel('Número de electrones promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones promedio contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, electronsAllStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, electronsAllStd[0, :], color = 'purple')
-	plt.plot(argons, electronsAllStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, electronsAllStd[1, :], color = 'red')
-	plt.plot(argons, electronsAllStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, electronsAllStd[2, :], color = 'green')
-	plt.plot(argons, electronsAllStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, electronsAllStd[3, :], color = 'magenta')
-	plt.plot(argons, electronsAllStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, electronsAllStd[4, :], color = 'blue')
-	plt.ylabel('Desviación número de electrones promedio')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones totales contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, electronsEventMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, electronsEventMean[0, :], color = 'purple')
-	plt.plot(argons, electronsEventMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, electronsEventMean[1, :], color = 'red')
-	plt.plot(argons, electronsEventMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, electronsEventMean[2, :], color = 'green')
-	plt.plot(argons, electronsEventMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, electronsEventMean[3, :], color = 'magenta')
-	plt.plot(argons, electronsEventMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, electronsEventMean[4, :], color = 'blue')
-	plt.ylabel('Número de electrones totales')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones totales contra $\%$Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, electronsEventStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, electronsEventStd[0, :], color = 'purple')
-	plt.plot(argons, electronsEventStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, electronsEventStd[1, :], color = 'red')
-	plt.plot(argons, electronsEventStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, electronsEventStd[2, :], color = 'green')
-	plt.plot(argons, electronsEventStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, electronsEventStd[3, :], color = 'magenta')
-	plt.plot(argons, electronsEventStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, electronsEventStd[4, :], color = 'blue')
-	plt.ylabel('Desviación número de electrones totales')
-	plt.xlabel(r'$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumTot-Ar-E.eps', format = 'eps')
-	plt.show()
+	renderFigures(AVALANCHE_FIXED_V_FIGURES, avalancheCube, AVALANCHE_GRAPHS_PATH, V = V)
 
-	
-
-	# Dependencia con la energía
-	
-	# Intentar la gráfica de las fluctuaciones 
-
-	plt.title(r'Ganancia total contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, gainAllMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, gainAllMean[:, 0], color = 'purple')
-	plt.plot(10**energies, gainAllMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, gainAllMean[:, 1], color = 'red')
-	plt.plot(10**energies, gainAllMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, gainAllMean[:, 2], color = 'green')
-	plt.plot(10**energies, gainAllMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, gainAllMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, gainAllMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, gainAllMean[:, 4], color = 'blue')
-	plt.ylabel('Ganancia total')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.legend()
-	plt.xscale('log')
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación ganancia total contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, gainAllStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, gainAllStd[:, 0], color = 'purple')
-	plt.plot(10**energies, gainAllStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, gainAllStd[:, 1], color = 'red')
-	plt.plot(10**energies, gainAllStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, gainAllStd[:, 2], color = 'green')
-	plt.plot(10**energies, gainAllStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, gainAllStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, gainAllStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, gainAllStd[:, 4], color = 'blue')
-	plt.ylabel('Desviación ganancia total')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Ganancia promedio contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, gainAvgMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, gainAvgMean[:, 0], color = 'purple')
-	plt.plot(10**energies, gainAvgMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, gainAvgMean[:, 1], color = 'red')
-	plt.plot(10**energies, gainAvgMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, gainAvgMean[:, 2], color = 'green')
-	plt.plot(10**energies, gainAvgMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, gainAvgMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, gainAvgMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, gainAvgMean[:, 4], color = 'blue')
-	plt.ylabel('Ganancia promedio')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/GananciaProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación ganacia promedio contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, gainAvgStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, gainAvgStd[:, 0], color = 'purple')
-	plt.plot(10**energies, gainAvgStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, gainAvgStd[:, 1], color = 'red')
-	plt.plot(10**energies, gainAvgStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, gainAvgStd[:, 2], color = 'green')
-	plt.plot(10**energies, gainAvgStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, gainAvgStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, gainAvgStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, gainAvgStd[:, 4], color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesGananciaProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones promedio contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, electronsAllMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, electronsAllMean[:, 0], color = 'purple')
-	plt.plot(10**energies, electronsAllMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, electronsAllMean[:, 1], color = 'red')
-	plt.plot(10**energies, electronsAllMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, electronsAllMean[:, 2], color = 'green')
-	plt.plot(10**energies, electronsAllMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, electronsAllMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, electronsAllMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, electronsAllMean[:, 4], color = 'blue')
-	plt.ylabel('Número de electrones promedio')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, electronsAllStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, electronsAllStd[:, 0],  color = 'purple')
-	plt.plot(10**energies, electronsAllStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, electronsAllStd[:, 1],  color = 'red')
-	plt.plot(10**energies, electronsAllStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, electronsAllStd[:, 2],  color = 'green')
-	plt.plot(10**energies, electronsAllStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, electronsAllStd[:, 3],  color = 'magenta')
-	plt.plot(10**energies, electronsAllStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, electronsAllStd[:, 4],  color = 'blue')
-	plt.ylabel('Desviación número de electrones promedio')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Número de electrones totales contra energía del muón para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, electronsEventMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, electronsEventMean[:, 0], color = 'purple')
-	plt.plot(10**energies, electronsEventMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, electronsEventMean[:, 1], color = 'red')
-	plt.plot(10**energies, electronsEventMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, electronsEventMean[:, 2], color = 'green')
-	plt.plot(10**energies, electronsEventMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, electronsEventMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, electronsEventMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, electronsEventMean[:, 4], color = 'blue')
-	plt.ylabel('Número de electrones totales')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/EleNumTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación del número de electrones totales contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, electronsEventStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, electronsEventStd[:, 0], color = 'purple')
-	plt.plot(10**energies, electronsEventStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, electronsEventStd[:, 1], color = 'red')
-	plt.plot(10**energies, electronsEventStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, electronsEventStd[:, 2], color = 'green')
-	plt.plot(10**energies, electronsEventStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, electronsEventStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, electronsEventStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, electronsEventStd[:, 4], color = 'blue')
-	plt.ylabel('Desviación número de electrones totales')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('avalancheGraphs/DesEleNumTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	
 fixedV()
 
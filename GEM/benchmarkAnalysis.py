@@ -0,0 +1,44 @@
+import time
+import numpy as np
+from sweepModule import *
+from interpolationModule import *
+
+#	Sweep loader scaling (serial reference is workers = 1)
+
+WORKERS_LIST = (1, 2, 4, 8, 16, 32)
+
+print('Lectura de electrones')
+print('workers\ttiempo(s)\taceleración')
+
+for workers, seconds, speedup in zip(*benchmarkSweepLoader(readElectronStatistics, ELECTRONS_FILE_FORMAT, WORKERS_LIST)):
+	print('{}\t{:.3f}\t\t{:.2f}'.format(workers, seconds, speedup))
+
+print('Lectura de avalanchas')
+print('workers\ttiempo(s)\taceleración')
+
+for workers, seconds, speedup in zip(*benchmarkSweepLoader(readAvalancheStatistics, AVALANCHES_FILE_FORMAT, WORKERS_LIST)):
+	print('{}\t{:.3f}\t\t{:.2f}'.format(workers, seconds, speedup))
+
+#	Interpolation throughput (random operating points inside the complete energy = 9 slice)
+
+QUERIES = 1000000
+
+avalancheCube = getAvalancheCube()
+
+rng = np.random.default_rng()
+
+ar = rng.uniform(avalancheCube.argons[0], avalancheCube.argons[-1], QUERIES)
+V  = rng.uniform(avalancheCube.voltages[0], avalancheCube.voltages[-1], QUERIES)
+
+print('Interpolación de ganancia')
+print('método\tconsultas/s')
+
+for method in INTERPOLATION_METHODS:
+
+	gainInterpolator = SweepInterpolator(avalancheCube, 'gainAllMean', 'gainAllStd', 'events', method = method, energy = 9)
+
+	start = time.perf_counter()
+	gainInterpolator(ar = ar, V = V)
+	seconds = time.perf_counter() - start
+
+	print('{}\t{:.3g}'.format(method, QUERIES/seconds))
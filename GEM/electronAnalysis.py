@@ -1,7 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd 
-from scipy.optimize import curve_fit
+from sweepModule import *
+from fitModule import *
+from figureModule import *
+from occupancyModule import *
+from raggedModule import *
 
 plt.rcParams.update({
   "text.usetex": True,
@@ -18,9 +22,11 @@ def readElectronData(ar, energy, V, showHists = False, showDistribution = False)
 	zAll = dataFrame['z']
 	eAll = dataFrame['e']
 
-	xAll = xAll[zAll == -0.203000]
-	yAll = yAll[zAll == -0.203000] 
-	eAll = eAll[zAll == -0.203000] 
+	onReadout = onReadoutPlane(zAll)
+
+	xAll = xAll[onReadout]
+	yAll = yAll[onReadout]
+	eAll = eAll[onReadout]
 
 	xAllMean = xAll.mean()
 	xAllStd = xAll.std()
@@ -31,11 +37,13 @@ def readElectronData(ar, energy, V, showHists = False, showDistribution = False)
 	eAllMean = eAll.mean()
 	eAllStd = eAll.std()
 
-	muonMeanX = dataFrame.groupby('step')['x'].mean()
-	muonStdX = dataFrame.groupby('step')['x'].std()
+	events = RaggedEvents.fromDataFrame(dataFrame, 'step', ['x', 'y'])
+
+	muonMeanX = pd.Series(events.mean('x'), index = events.ids)
+	muonStdX = pd.Series(events.std('x'), index = events.ids)
 
-	muonMeanY = dataFrame.groupby('step')['y'].mean()
-	muonStdY = dataFrame.groupby('step')['y'].std()
+	muonMeanY = pd.Series(events.mean('y'), index = events.ids)
+	muonStdY = pd.Series(events.std('y'), index = events.ids)
 
 	xAvgMean = muonMeanX.mean()
 	xAvgStd = muonStdX.std()
@@ -79,10 +87,10 @@ def readElectronData(ar, energy, V, showHists = False, showDistribution = False)
 		plt.show()
 
 		plt.title('Histograma $(x,y)$ con los todos los electrones')
-		plt.hist2d(xAll, yAll, bins = 40)
+		mesh = Occupancy2D(OCCUPANCY_X_RANGE, OCCUPANCY_Y_RANGE).fill(xAll, yAll).plot(plt.gca())
 		plt.xlabel('$x$(cm)')
 		plt.ylabel('$y$(cm)')
-		plt.colorbar()
+		plt.colorbar(mesh)
 		plt.savefig('electronGraphs/HistxyTot.eps', format = 'eps')
 		plt.show()
 
@@ -131,432 +139,121 @@ def readElectronData(ar, energy, V, showHists = False, showDistribution = False)
 	return np.array([xAllMean, xAllStd, yAllMean, yAllStd, eAllMean, eAllStd, xAvgMean, xAvgStd, yAvgMean, yAvgStd])
 
 
+#	Figures
+
+ELECTRON_GRAPHS_PATH = 'electronGraphs/'
+
+ELECTRON_FIXED_V_FIGURES = [
+	FigureSpec('xAllMean', 'ar', 'energy', r'$\langle x \rangle$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas', 'Coordenada $x$ promedio(cm)', 'xTot-Ar-E'),
+	FigureSpec('xAllStd', 'ar', 'energy', r'$\sigma_{\langle x \rangle}$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas', r'$\sigma_x$ promedio(cm)', 'DesxTot-Ar-E'),
+	FigureSpec('yAllMean', 'ar', 'energy', r'$\langle y \rangle$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas', 'Coordenada $y$ promedio(cm)', 'yTot-Ar-E'),
+	FigureSpec('yAllStd', 'ar', 'energy', r'$\sigma_{\langle y \rangle}$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas', r'$\sigma_y$ promedio(cm)', 'DesyTot-Ar-E'),
+	FigureSpec('eAllMean', 'ar', 'energy', r'Energía promedio contra $\%$ Ar para $E_{\mu^{-}}$ fijas', r'$E_{e^{-}}$(eV)', 'Energia-Ar-E', fit = 'linear'),
+	FigureSpec('eAllStd', 'ar', 'energy', r'Desviación energía promedio contra $\%$ Ar para $E_{\mu^{-}}$ fijas', r'$\sigma_E$ promedio(eV)', 'DesEnergia-Ar-E'),
+	FigureSpec('xAvgMean', 'ar', 'energy', r'$\langle x \rangle$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas', 'Coordenada $x$ promedio(cm)', 'xProm-Ar-E'),
+	FigureSpec('xAvgStd', 'ar', 'energy', r'$\sigma_{\langle x \rangle}$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas', r'$\sigma_x$ promedio(cm)', 'DesxProm-Ar-E'),
+	FigureSpec('yAvgMean', 'ar', 'energy', r'$\langle y \rangle$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas', 'Coordenada $y$ promedio(cm)', 'yProm-Ar-E'),
+	FigureSpec('yAvgStd', 'ar', 'energy', r'$\sigma_{\langle y \rangle}$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas', r'$\sigma_y$ promedio(cm)', 'DesyProm-Ar-E'),
+	FigureSpec('xAllMean', 'energy', 'ar', r'$\langle x \rangle$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos', 'Coordenada $x$ promedio(cm)', 'xTot-E-Ar', xscale = 'log'),
+	FigureSpec('xAllStd', 'energy', 'ar', r'$\sigma_{\langle x \rangle}$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos', r'$\sigma_x$ promedio(cm)', 'DesxTot-E-Ar', xscale = 'log'),
+	FigureSpec('yAllMean', 'energy', 'ar', r'$\langle y \rangle$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos', 'Coordenada $y$ promedio(cm)', 'yTot-E-Ar', xscale = 'log'),
+	FigureSpec('yAllStd', 'energy', 'ar', r'$\sigma_{\langle y \rangle}$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos', r'$\sigma_y$ promedio(cm)', 'DesyTot-E-Ar', xscale = 'log'),
+	FigureSpec('eAllMean', 'energy', 'ar', r'Energía promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos', r'$E_{e^{-}}$(eV)', 'Energia-E-Ar', xscale = 'log'),
+	FigureSpec('eAllStd', 'energy', 'ar', r'Desviación energía promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos', r'$\sigma_E$ promedio(eV)', 'DesEnergia-E-Ar', xscale = 'log'),
+	FigureSpec('xAvgMean', 'energy', 'ar', r'$\langle x \rangle$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos', 'Coordenada $x$ promedio(cm)', 'xProm-E-Ar', xscale = 'log'),
+	FigureSpec('xAvgStd', 'energy', 'ar', r'$\sigma_{\langle x \rangle}$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos', r'$\sigma_x$ promedio(cm)', 'DesxProm-E-Ar', xscale = 'log'),
+	FigureSpec('yAvgMean', 'energy', 'ar', r'$\langle y \rangle$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos', 'Coordenada $y$ promedio(cm)', 'yProm-E-Ar', xscale = 'log'),
+	FigureSpec('yAvgStd', 'energy', 'ar', r'$\sigma_{\langle y \rangle}$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos', r'$\sigma_y$ promedio(cm)', 'DesyProm-E-Ar', xscale = 'log'),
+]
+
+ELECTRON_FIXED_E_FIGURES = [
+	FigureSpec('xAllMean', 'V', 'ar', r'$\langle x \rangle$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos', 'Coordenada $x$ promedio(cm)', 'xTot-V-Ar'),
+	FigureSpec('xAllStd', 'V', 'ar', r'$\sigma_{\langle x \rangle}$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos', r'$\sigma_x$ promedio(cm)', 'DesxTot-V-Ar'),
+	FigureSpec('yAllMean', 'V', 'ar', r'$\langle y \rangle$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos', 'Coordenada $y$ promedio(cm)', 'yTot-V-Ar'),
+	FigureSpec('yAllStd', 'V', 'ar', r'$\sigma_{\langle y \rangle}$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos', r'$\sigma_y$ promedio(cm)', 'DesyTot-V-Ar'),
+	FigureSpec('eAllMean', 'V', 'ar', r'Energía promedio contra voltaje para $\%$Ar/CO2 fijos', r'$E_{e^{-}}$(eV)', 'Energia-V-Ar'),
+	FigureSpec('eAllStd', 'V', 'ar', r'Desviación energía promedio contra voltaje para $\%$Ar/CO2 fijos', r'$\sigma_E$ promedio(eV)', 'DesEnergia-V-Ar'),
+	FigureSpec('xAvgMean', 'V', 'ar', r'$\langle x \rangle$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos', 'Coordenada $x$ promedio(cm)', 'xProm-V-Ar'),
+	FigureSpec('xAvgStd', 'V', 'ar', r'$\sigma_{\langle x \rangle}$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos', r'$\sigma_x$ promedio(cm)', 'DesxProm-V-Ar'),
+	FigureSpec('yAvgMean', 'V', 'ar', r'$\langle y \rangle$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos', 'Coordenada $y$ promedio(cm)', 'yProm-V-Ar'),
+	FigureSpec('yAvgStd', 'V', 'ar', r'$\sigma_{\langle y \rangle}$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos', r'$\sigma_y$ promedio(cm)', 'DesyProm-V-Ar'),
+	FigureSpec('xAllMean', 'ar', 'V', r'$\langle x \rangle$ contra $\%$Ar con todos los eventos para voltajes fijos', 'Coordenada $x$ promedio(cm)', 'xTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('xAllStd', 'ar', 'V', r'$\sigma_{\langle x \rangle}$ contra $\%$Ar con todos los eventos para voltajes fijos', r'$\sigma_x$ promedio(cm)', 'DesxTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('yAllMean', 'ar', 'V', r'$\langle y \rangle$ contra $\%$Ar con todos los eventos para voltajes fijos', 'Coordenada $y$ promedio(cm)', 'yTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('yAllStd', 'ar', 'V', r'$\sigma_{\langle y \rangle}$ contra $\%$Ar con todos los eventos para voltajes fijos', r'$\sigma_y$ promedio(cm)', 'DesyTot-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('eAllMean', 'ar', 'V', r'Energía promedio contra $\%$Ar para voltajes fijos', r'$E_{e^{-}}$(eV)', 'Energia-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('eAllStd', 'ar', 'V', r'Desviación energía promedio contra $\%$Ar para voltajes fijos', r'$\sigma_E$ promedio(eV)', 'DesEnergia-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('xAvgMean', 'ar', 'V', r'$\langle x \rangle$ contra $\%$Ar promediada por avalacha para voltajes fijos', 'Coordenada $x$ promedio(cm)', 'xProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('xAvgStd', 'ar', 'V', r'$\sigma_{\langle x \rangle}$ contra $\%$Ar promediada por avalacha para voltajes fijos', r'$\sigma_x$ promedio(cm)', 'DesxProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('yAvgMean', 'ar', 'V', r'$\langle y \rangle$ contra $\%$Ar promediada por avalacha para voltajes fijos', 'Coordenada $y$ promedio(cm)', 'yProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+	FigureSpec('yAvgStd', 'ar', 'V', r'$\sigma_{\langle y \rangle}$ contra $\%$Ar promediada por avalacha para voltajes fijos', r'$\sigma_y$ promedio(cm)', 'DesyProm-Ar-V', seriesValues = [400, 420, 440, 460, 480]),
+]
+
+ELECTRON_TIMING_FIGURES = [
+	FigureSpec('tFirstMean', 'V', 'ar', r'Tiempo de llegada del primer electrón contra voltaje para $\%$Ar/CO2 fijos', r'$\langle t_{primero} \rangle$(ns)', 'tPrimero-V-Ar'),
+	FigureSpec('tFirstStd', 'V', 'ar', r'Resolución temporal contra voltaje para $\%$Ar/CO2 fijos', r'$\sigma_{t_{primero}}$(ns)', 'DestPrimero-V-Ar'),
+	FigureSpec('tMedianMean', 'V', 'ar', r'Mediana del tiempo de llegada contra voltaje para $\%$Ar/CO2 fijos', r'$\langle t_{mediana} \rangle$(ns)', 'tMediana-V-Ar'),
+	FigureSpec('tSpreadMean', 'V', 'ar', r'Dispersión del tiempo de llegada por evento contra voltaje para $\%$Ar/CO2 fijos', r'$\langle \sigma_t \rangle$(ns)', 'DesTiempo-V-Ar'),
+]
+
 def curveFit(x, y, mod = 'linear', guess = None):
 	if(mod == 'linear'):
-		coef, cov = curve_fit(lambda x, m, b: m*x + b, x, y, p0 = guess)
-
-		def f(x):
-			return x*coef[0] + coef[1]
+		coef, cov = fitLinear(x, y)
 
 		print(coef[0], 	np.sqrt(cov)[0, 0])
 		print(coef[1], np.sqrt(cov)[1, 1])
 
-		return np.vectorize(f)
+		return modelEvaluator('linear', coef)
 
 	elif(mod == 'exp'):
-		coef, cov = curve_fit(lambda x, a, b, c: a*np.exp(b*x) + c, x, y, p0 = guess)
-
-		def f(x):
-			return coef[0]*np.exp(coef[1]*x) + coef[2]
+		coef, cov = fitNonlinear('exp', x, y, guess, workers = 1)
 
-		return np.vectorize(f)
+		return modelEvaluator('exp', coef)
 
 def fixedVfixedE(energy, V):
-	argons = np.array([60, 65, 70, 75, 80])
-	return np.vectorize(readElectronData, excluded=['energy', 'V'], signature = '()->(n)')(energy = energy, V = V, ar = argons)
+	return electronCube.get(energy = energy, V = V)
 
 def fixedVfixedAr(ar, V):
-	energies= np.array([7, 8, 9, 10, 11])
-	return np.vectorize(readElectronData, excluded=['ar', 'V'], signature = '()->(n)')(ar = ar, V = V, energy = energies)
+	return electronCube.get(ar = ar, V = V)
 	
 def fixedV(V = 400):
-	energies= np.array([7, 8, 9, 10, 11])
-	argons = np.array([60, 65, 70, 75, 80])
+	renderFigures(ELECTRON_FIXED_V_FIGURES, electronCube, ELECTRON_GRAPHS_PATH, V = V)
 
-	fixedE = np.vectorize(fixedVfixedE, excluded = ['V'], signature = '()->(n,m)')(V = V, energy = energies)
-	
-	xAllMean, xAllStd, yAllMean, yAllStd, eAllMean, eAllStd, xAvgMean, xAvgStd, yAvgMean, yAvgStd = fixedE[:, :, 0], fixedE[:, :, 1], fixedE[:, :, 2], fixedE[:, :, 3], fixedE[:, :, 4], fixedE[:, :, 5], fixedE[:, :, 6], fixedE[:, :, 7], fixedE[:, :, 8], fixedE[:, :, 9]
-
-	# Intentar gráfica de fluctuaciones
-	plt.title(r'$\langle x \rangle$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, xAllMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, xAllMean[0, :], color = 'purple')
-	plt.plot(argons, xAllMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, xAllMean[1, :], color = 'red')
-	plt.plot(argons, xAllMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, xAllMean[2, :], color = 'green')
-	plt.plot(argons, xAllMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, xAllMean[3, :], color = 'magenta')
-	plt.plot(argons, xAllMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, xAllMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, xAllStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, xAllStd[0, :], color = 'purple')
-	plt.plot(argons, xAllStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, xAllStd[1, :], color = 'red')
-	plt.plot(argons, xAllStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, xAllStd[2, :], color = 'green')
-	plt.plot(argons, xAllStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, xAllStd[3, :], color = 'magenta')
-	plt.plot(argons, xAllStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, xAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, yAllMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, yAllMean[0, :], color = 'purple')
-	plt.plot(argons, yAllMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, yAllMean[1, :], color = 'red')
-	plt.plot(argons, yAllMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, yAllMean[2, :], color = 'green')
-	plt.plot(argons, yAllMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, yAllMean[3, :], color = 'magenta')
-	plt.plot(argons, yAllMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, yAllMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $\%$ Ar con todos los eventos para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, yAllStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, yAllStd[0, :], color = 'purple')
-	plt.plot(argons, yAllStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, yAllStd[1, :], color = 'red')
-	plt.plot(argons, yAllStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, yAllStd[2, :], color = 'green')
-	plt.plot(argons, yAllStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, yAllStd[3, :], color = 'magenta')
-	plt.plot(argons, yAllStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, yAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyTot-Ar-E.eps', format = 'eps')
-	plt.show()
-
-
-	argonsCont = np.linspace(np.min(argons), np.max(argons), 1000)
-	fitArgonsCont = curveFit(argons, eAllMean[0, :])(argonsCont)
-
-	plt.title(r'Energía promedio contra $\%$ Ar para $E_{\mu^{-}}$ fijas')
-	plt.scatter(argons, eAllMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, eAllMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, eAllMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, eAllMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, eAllMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.plot(argonsCont, fitArgonsCont, color = 'black')
-	plt.ylabel(r'$E_{e^{-}}$(eV)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/Energia-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación energía promedio contra $\%$ Ar para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, eAllStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, eAllStd[0, :], color = 'purple')
-	plt.plot(argons, eAllStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, eAllStd[1, :], color = 'red')
-	plt.plot(argons, eAllStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, eAllStd[2, :], color = 'green')
-	plt.plot(argons, eAllStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, eAllStd[3, :], color = 'magenta')
-	plt.plot(argons, eAllStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, eAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_E$ promedio(eV)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesEnergia-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle x \rangle$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, xAvgMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, xAvgMean[0, :], color = 'purple')
-	plt.plot(argons, xAvgMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, xAvgMean[1, :], color = 'red')
-	plt.plot(argons, xAvgMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, xAvgMean[2, :], color = 'green')
-	plt.plot(argons, xAvgMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, xAvgMean[3, :], color = 'magenta')
-	plt.plot(argons, xAvgMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, xAvgMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xProm-Ar-E.eps', format = 'eps')
-	plt.show()
+electronCube = getElectronCube()
 
-	
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, xAvgStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, xAvgStd[0, :], color = 'purple')
-	plt.plot(argons, xAvgStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, xAvgStd[1, :], color = 'red')
-	plt.plot(argons, xAvgStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, xAvgStd[2, :], color = 'green')
-	plt.plot(argons, xAvgStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, xAvgStd[3, :], color = 'magenta')
-	plt.plot(argons, xAvgStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, xAvgStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, yAvgMean[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, yAvgMean[0, :], color = 'purple')
-	plt.plot(argons, yAvgMean[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, yAvgMean[1, :], color = 'red')
-	plt.plot(argons, yAvgMean[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, yAvgMean[2, :], color = 'green')
-	plt.plot(argons, yAvgMean[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, yAvgMean[3, :], color = 'magenta')
-	plt.plot(argons, yAvgMean[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, yAvgMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $\%$ Ar promediada por avalacha para $E_{\mu^{-}}$ fijas')
-	plt.plot(argons, yAvgStd[0, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[0]) + r'}$ eV', color = 'purple')
-	plt.scatter(argons, yAvgStd[0, :], color = 'purple')
-	plt.plot(argons, yAvgStd[1, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[1]) + r'}$ eV', color = 'red')
-	plt.scatter(argons, yAvgStd[1, :], color = 'red')
-	plt.plot(argons, yAvgStd[2, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[2]) + r'}$ eV', color = 'green')
-	plt.scatter(argons, yAvgStd[2, :], color = 'green')
-	plt.plot(argons, yAvgStd[3, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[3]) + r'}$ eV', color = 'magenta')
-	plt.scatter(argons, yAvgStd[3, :], color = 'magenta')
-	plt.plot(argons, yAvgStd[4, :], label = r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(energies[4]) + r'}$ eV', color = 'blue')
-	plt.scatter(argons, yAvgStd[3, :], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyProm-Ar-E.eps', format = 'eps')
-	plt.show()
-
-
-	# Dependencia con la energía
-	
-	# Intentar la gráfica de las fluctuaciones 
-
-	plt.title(r'$\langle x \rangle$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, xAllMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, xAllMean[:, 0], color = 'purple')
-	plt.plot(10**energies, xAllMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, xAllMean[:, 1], color = 'red')
-	plt.plot(10**energies, xAllMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, xAllMean[:, 2], color = 'green')
-	plt.plot(10**energies, xAllMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, xAllMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, xAllMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, xAllMean[:, 4], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.legend()
-	plt.xscale('log')
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, xAllStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, xAllStd[:, 0], color = 'purple')
-	plt.plot(10**energies, xAllStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, xAllStd[:, 1], color = 'red')
-	plt.plot(10**energies, xAllStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, xAllStd[:, 2], color = 'green')
-	plt.plot(10**energies, xAllStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, xAllStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, xAllStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, xAllStd[:, 4], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, yAllMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, yAllMean[:, 0], color = 'purple')
-	plt.plot(10**energies, yAllMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, yAllMean[:, 1], color = 'red')
-	plt.plot(10**energies, yAllMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, yAllMean[:, 2], color = 'green')
-	plt.plot(10**energies, yAllMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, yAllMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, yAllMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, yAllMean[:, 4], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $E_{\mu^{-}}$ con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, yAllStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, yAllStd[:, 0], color = 'purple')
-	plt.plot(10**energies, yAllStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, yAllStd[:, 1], color = 'red')
-	plt.plot(10**energies, yAllStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, yAllStd[:, 2], color = 'green')
-	plt.plot(10**energies, yAllStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, yAllStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, yAllStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, yAllStd[:, 4], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyTot-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Energía promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, eAllMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, eAllMean[:, 0], color = 'purple')
-	plt.plot(10**energies, eAllMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, eAllMean[:, 1], color = 'red')
-	plt.plot(10**energies, eAllMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, eAllMean[:, 2], color = 'green')
-	plt.plot(10**energies, eAllMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, eAllMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, eAllMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, eAllMean[:, 4], color = 'blue')
-	plt.ylabel(r'$E_{e^{-}}$(eV)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/Energia-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación energía promedio contra $E_{\mu^{-}}$ para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, eAllStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, eAllStd[:, 0],  color = 'purple')
-	plt.plot(10**energies, eAllStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, eAllStd[:, 1],  color = 'red')
-	plt.plot(10**energies, eAllStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, eAllStd[:, 2],  color = 'green')
-	plt.plot(10**energies, eAllStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, eAllStd[:, 3],  color = 'magenta')
-	plt.plot(10**energies, eAllStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, eAllStd[:, 4],  color = 'blue')
-	plt.ylabel(r'$\sigma_E$ promedio(eV)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesEnergia-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle x \rangle$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, xAvgMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, xAvgMean[:, 0], color = 'purple')
-	plt.plot(10**energies, xAvgMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, xAvgMean[:, 1], color = 'red')
-	plt.plot(10**energies, xAvgMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, xAvgMean[:, 2], color = 'green')
-	plt.plot(10**energies, xAvgMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, xAvgMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, xAvgMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, xAvgMean[:, 4], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, xAvgStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, xAvgStd[:, 0], color = 'purple')
-	plt.plot(10**energies, xAvgStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, xAvgStd[:, 1], color = 'red')
-	plt.plot(10**energies, xAvgStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, xAvgStd[:, 2], color = 'green')
-	plt.plot(10**energies, xAvgStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, xAvgStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, xAvgStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, xAvgStd[:, 4], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, yAvgMean[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, yAvgMean[:, 0], color = 'purple')
-	plt.plot(10**energies, yAvgMean[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, yAvgMean[:, 1], color = 'red')
-	plt.plot(10**energies, yAvgMean[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, yAvgMean[:, 2], color = 'green')
-	plt.plot(10**energies, yAvgMean[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, yAvgMean[:, 3], color = 'magenta')
-	plt.plot(10**energies, yAvgMean[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, yAvgMean[:, 4], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $E_{\mu^{-}}$ promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(10**energies, yAvgStd[:, 0], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(10**energies, yAvgStd[:, 0], color = 'purple')
-	plt.plot(10**energies, yAvgStd[:, 1], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(10**energies, yAvgStd[:, 1], color = 'red')
-	plt.plot(10**energies, yAvgStd[:, 2], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(10**energies, yAvgStd[:, 2], color = 'green')
-	plt.plot(10**energies, yAvgStd[:, 3], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(10**energies, yAvgStd[:, 3], color = 'magenta')
-	plt.plot(10**energies, yAvgStd[:, 4], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(10**energies, yAvgStd[:, 4], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel(r'$E_{\mu^{-}}$(eV)')
-	plt.xscale('log')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyProm-E-Ar.eps', format = 'eps')
-	plt.show()
-
-	#fixedAr = np.vectorize(fixedVfixedAr, excluded = ['V'], signature = '()->(n,m)')(V = V, ar = argons)
-	
-	#print(fixedAr.shape)
+def occupancyFixedV(energy = 9, V = 400):
+
+	# One map per argon percentage plus their sum, all drawn from the cached counts
+
+	fig, axes = plt.subplots(2, 3, figsize = (12, 8), sharex = True, sharey = True)
 
+	occupancies = [unpackOccupancy(electronOccupancyCube.get(ar = ar, energy = energy, V = V)) for ar in electronOccupancyCube.argons]
 
-	"""
-		Returns
-			-	x coordinate distribution
-			-	y coordinate distribution
-	"""
+	for ax, ar, occupancy in zip(axes.flat, electronOccupancyCube.argons, occupancies):
+		mesh = occupancy.plot(ax)
+		ax.set_title(r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(ar, 100 - ar))
+		fig.colorbar(mesh, ax = ax)
+
+	mesh = mergeOccupancies(occupancies).plot(axes.flat[-1])
+	axes.flat[-1].set_title('Todos')
+	fig.colorbar(mesh, ax = axes.flat[-1])
+
+	for ax in axes[-1]:
+		ax.set_xlabel('$x$(cm)')
+
+	for ax in axes[:, 0]:
+		ax.set_ylabel('$y$(cm)')
+
+	fig.tight_layout()
+	fig.savefig(ELECTRON_GRAPHS_PATH + 'Ocupacion-E{}-V{}.eps'.format(energy, V), format = 'eps')
+	plt.close(fig)
 
 fixedV()
 
+electronOccupancyCube = getElectronOccupancyCube()
+
+occupancyFixedV()
+
 readElectronData(60, 9, 400, showHists = True, showDistribution = True)
 
 
@@ -576,398 +273,19 @@ readElectronData(60, 9, 400, showHists = True, showDistribution = True)
 
 
 def fixedEfixedV(V, energy):
-	argons = np.array([60, 65, 70, 75, 80])
-	return np.vectorize(readElectronData, excluded=['energy', 'V'], signature = '()->(n)')(energy = energy, V = V, ar = argons)
+	return electronCube.get(energy = energy, V = V)
 
 def fixedEfixedAr(ar, energy):
-	voltages = np.array([400, 410, 420, 430, 440, 450, 460, 470, 480, 490, 500])
-	return np.vectorize(readElectronData, excluded=['energy', 'ar'], signature = '()->(n)')(ar = ar, V = voltages, energy = energy)
+	return electronCube.get(ar = ar, energy = energy)
 	
 def fixedE(energy = 9):
-	voltages = np.array([400, 410, 420, 430, 440, 450, 460, 470, 480, 490, 500])
-	argons = np.array([60, 65, 70, 75, 80])
+	renderFigures(ELECTRON_FIXED_E_FIGURES, electronCube, ELECTRON_GRAPHS_PATH, energy = energy)
 
-	fixedAr = np.vectorize(fixedEfixedAr, excluded = ['energy'], signature = '()->(n,m)')(ar = argons, energy = energy)
-	
-	#xAllMean, xAllStd, yAllMean, yAllStd, ne, nIons, eAllMean, eAllStd, xAvgMean, xAllStd = fixedAr[:,:,0 ], fixedAr[:,:,1], fixedAr[:,:,2], fixedAr[:,:,3], fixedAr[:,:,4], fixedAr[:,:,5], fixedAr[:,:,6], fixedAr[:,:,7], fixedAr[:,:,8], fixedAr[:,:,9]          
-	
-	xAllMean, xAllStd, yAllMean, yAllStd, eAllMean, eAllStd, xAvgMean, xAvgStd, yAvgMean, yAvgStd = fixedAr[:,:,0 ], fixedAr[:,:,1], fixedAr[:,:,2], fixedAr[:,:,3], fixedAr[:,:,4], fixedAr[:,:,5], fixedAr[:,:,6], fixedAr[:,:,7], fixedAr[:,:,8], fixedAr[:,:,9]          
-
-	plt.title(r'$\langle x \rangle$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.scatter(voltages, xAllMean[0, :], color = 'purple')
-	plt.plot(voltages, xAllMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.plot(voltages, xAllMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, xAllMean[1, :], color = 'red')
-	plt.plot(voltages, xAllMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, xAllMean[2, :], color = 'green')
-	plt.plot(voltages, xAllMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, xAllMean[3, :], color = 'magenta')
-	plt.plot(voltages, xAllMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, xAllMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, xAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, xAllStd[0, :], color = 'purple')
-	plt.plot(voltages, xAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, xAllStd[1, :], color = 'red')
-	plt.plot(voltages, xAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, xAllStd[2, :], color = 'green')
-	plt.plot(voltages, xAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, xAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, xAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, xAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, yAllMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, yAllMean[0, :], color = 'purple')
-	plt.plot(voltages, yAllMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, yAllMean[1, :], color = 'red')
-	plt.plot(voltages, yAllMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, yAllMean[2, :], color = 'green')
-	plt.plot(voltages, yAllMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, yAllMean[3, :], color = 'magenta')
-	plt.plot(voltages, yAllMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, yAllMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra voltaje con todos los eventos para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, yAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, yAllStd[0, :], color = 'purple')
-	plt.plot(voltages, yAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, yAllStd[1, :], color = 'red')
-	plt.plot(voltages, yAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, yAllStd[2, :], color = 'green')
-	plt.plot(voltages, yAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, yAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, yAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, yAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyTot-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Energía promedio contra voltaje para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, eAllMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, eAllMean[0, :], color = 'purple')
-	plt.plot(voltages, eAllMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, eAllMean[1, :], color = 'red')
-	plt.plot(voltages, eAllMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, eAllMean[2, :], color = 'green')
-	plt.plot(voltages, eAllMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, eAllMean[3, :], color = 'magenta')
-	plt.plot(voltages, eAllMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, eAllMean[4, :], color = 'blue')
-	plt.ylabel(r'$E_{e^{-}}$(eV)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/Energia-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación energía promedio contra voltaje para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, eAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, eAllStd[0, :], color = 'purple')
-	plt.plot(voltages, eAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, eAllStd[1, :], color = 'red')
-	plt.plot(voltages, eAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, eAllStd[2, :], color = 'green')
-	plt.plot(voltages, eAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, eAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, eAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, eAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_E$ promedio(eV)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesEnergia-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle x \rangle$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, xAvgMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, xAvgMean[0, :], color = 'purple')
-	plt.plot(voltages, xAvgMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, xAvgMean[1, :], color = 'red')
-	plt.plot(voltages, xAvgMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, xAvgMean[2, :], color = 'green')
-	plt.plot(voltages, xAvgMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, xAvgMean[3, :], color = 'magenta')
-	plt.plot(voltages, xAvgMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, xAvgMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, xAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, xAllStd[0, :], color = 'purple')
-	plt.plot(voltages, xAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, xAllStd[1, :], color = 'red')
-	plt.plot(voltages, xAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, xAllStd[2, :], color = 'green')
-	plt.plot(voltages, xAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, xAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, xAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, xAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, yAvgMean[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, yAvgMean[0, :], color = 'purple')
-	plt.plot(voltages, yAvgMean[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, yAvgMean[1, :], color = 'red')
-	plt.plot(voltages, yAvgMean[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, yAvgMean[2, :], color = 'green')
-	plt.plot(voltages, yAvgMean[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, yAvgMean[3, :], color = 'magenta')
-	plt.plot(voltages, yAvgMean[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, yAvgMean[4, :], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra voltaje promediada por avalacha para $\%$Ar/CO2 fijos')
-	plt.plot(voltages, yAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.scatter(voltages, yAllStd[0, :], color = 'purple')
-	plt.plot(voltages, yAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.scatter(voltages, yAllStd[1, :], color = 'red')
-	plt.plot(voltages, yAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.scatter(voltages, yAllStd[2, :], color = 'green')
-	plt.plot(voltages, yAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.scatter(voltages, yAllStd[3, :], color = 'magenta')
-	plt.plot(voltages, yAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.scatter(voltages, yAllStd[4, :], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel(r'$V_{\mathrm{GEM}}$(V)')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyProm-V-Ar.eps', format = 'eps')
-	plt.show()
-
-	"""
-	plt.title('Distribución electrones por evento para $\%$ Ar/CO2 fijos a ')
-	plt.hist(yAllStd[0, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(60, 40), color = 'purple')
-	plt.hist(yAllStd[1, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(65, 35), color = 'red')
-	plt.hist(yAllStd[2, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(70, 30), color = 'green')
-	plt.hist(yAllStd[3, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(75, 25), color = 'magenta')
-	plt.hist(yAllStd[4, :], label = r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(80, 20), color = 'blue')
-	plt.ylabel('Desviación ganancia promedio')
-	plt.xlabel('V')
-	plt.legend()
-	plt.tight_layout()
-	plt.show()
-
-	"""
-
-	plt.title(r'$\langle x \rangle$ contra $\%$Ar con todos los eventos para voltajes fijos')
-	plt.plot(argons, xAllMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, xAllMean[:, 0], color = 'purple')
-	plt.plot(argons, xAllMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, xAllMean[:, 2], color = 'red')
-	plt.plot(argons, xAllMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, xAllMean[:, 4], color = 'green')
-	plt.plot(argons, xAllMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, xAllMean[:, 6], color = 'magenta')
-	plt.plot(argons, xAllMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, xAllMean[:, 8], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $\%$Ar con todos los eventos para voltajes fijos')
-	plt.plot(argons, xAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, xAllStd[:, 0], color = 'purple')
-	plt.plot(argons, xAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, xAllStd[:, 2], color = 'red')
-	plt.plot(argons, xAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, xAllStd[:, 4], color = 'green')
-	plt.plot(argons, xAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, xAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, xAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, xAllStd[:, 8], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle y \rangle$ contra $\%$Ar con todos los eventos para voltajes fijos')
-	plt.plot(argons, yAllMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, yAllMean[:, 0], color = 'purple')
-	plt.plot(argons, yAllMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, yAllMean[:, 2], color = 'red')
-	plt.plot(argons, yAllMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, yAllMean[:, 4], color = 'green')
-	plt.plot(argons, yAllMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, yAllMean[:, 6], color = 'magenta')
-	plt.plot(argons, yAllMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, yAllMean[:, 8], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $\%$Ar con todos los eventos para voltajes fijos')
-	plt.plot(argons, yAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, yAllStd[:, 0], color = 'purple')
-	plt.plot(argons, yAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, yAllStd[:, 2], color = 'red')
-	plt.plot(argons, yAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, yAllStd[:, 4], color = 'green')
-	plt.plot(argons, yAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, yAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, yAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, yAllStd[:, 8], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyTot-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Energía promedio contra $\%$Ar para voltajes fijos')
-	plt.plot(argons, eAllMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, eAllMean[:, 0], color = 'purple')
-	plt.plot(argons, eAllMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, eAllMean[:, 2], color = 'red')
-	plt.plot(argons, eAllMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, eAllMean[:, 4], color = 'green')
-	plt.plot(argons, eAllMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, eAllMean[:, 6], color = 'magenta')
-	plt.plot(argons, eAllMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, eAllMean[:, 8], color = 'blue')
-	plt.ylabel(r'$E_{e^{-}}$(eV)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/Energia-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'Desviación energía promedio contra $\%$Ar para voltajes fijos')
-	plt.plot(argons, eAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, eAllStd[:, 0], color = 'purple')
-	plt.plot(argons, eAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, eAllStd[:, 2], color = 'red')
-	plt.plot(argons, eAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, eAllStd[:, 4], color = 'green')
-	plt.plot(argons, eAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, eAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, eAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, eAllStd[:, 8], color = 'blue')
-	plt.ylabel(r'$\sigma_E$ promedio(eV)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesEnergia-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\langle x \rangle$ contra $\%$Ar promediada por avalacha para voltajes fijos')
-	plt.plot(argons, xAvgMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, xAvgMean[:, 0], color = 'purple')
-	plt.plot(argons, xAvgMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, xAvgMean[:, 2], color = 'red')
-	plt.plot(argons, xAvgMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, xAvgMean[:, 4], color = 'green')
-	plt.plot(argons, xAvgMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, xAvgMean[:, 6], color = 'magenta')
-	plt.plot(argons, xAvgMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, xAvgMean[:, 8], color = 'blue')
-	plt.ylabel('Coordenada $x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/xProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle x \rangle}$ contra $\%$Ar promediada por avalacha para voltajes fijos')
-	plt.plot(argons, xAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, xAllStd[:, 0], color = 'purple')
-	plt.plot(argons, xAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, xAllStd[:, 2], color = 'red')
-	plt.plot(argons, xAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, xAllStd[:, 2], color = 'green')
-	plt.plot(argons, xAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, xAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, xAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, xAllStd[:, 8], color = 'blue')
-	plt.ylabel(r'$\sigma_x$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesxProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-
-	plt.title(r'$\langle y \rangle$ contra $\%$Ar promediada por avalacha para voltajes fijos')
-	plt.plot(argons, yAvgMean[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, yAvgMean[:, 0], color = 'purple')
-	plt.plot(argons, yAvgMean[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, yAvgMean[:, 2], color = 'red')
-	plt.plot(argons, yAvgMean[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, yAvgMean[:, 4], color = 'green')
-	plt.plot(argons, yAvgMean[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, yAvgMean[:, 6], color = 'magenta')
-	plt.plot(argons, yAvgMean[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, yAvgMean[:, 8], color = 'blue')
-	plt.ylabel('Coordenada $y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/yProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-	plt.title(r'$\sigma_{\langle y \rangle}$ contra $\%$Ar promediada por avalacha para voltajes fijos')
-	plt.plot(argons, yAllStd[:, 0], label = 'V = 400V', color = 'purple')
-	plt.scatter(argons, yAllStd[:, 0], color = 'purple')
-	plt.plot(argons, yAllStd[:, 2], label = 'V = 420V', color = 'red')
-	plt.scatter(argons, yAllStd[:, 2], color = 'red')
-	plt.plot(argons, yAllStd[:, 4], label = 'V = 440V', color = 'green')
-	plt.scatter(argons, yAllStd[:, 2], color = 'green')
-	plt.plot(argons, yAllStd[:, 6], label = 'V = 460V', color = 'magenta')
-	plt.scatter(argons, yAllStd[:, 6], color = 'magenta')
-	plt.plot(argons, yAllStd[:, 8], label = 'V = 480V', color = 'blue')
-	plt.scatter(argons, yAllStd[:, 8], color = 'blue')
-	plt.ylabel(r'$\sigma_y$ promedio(cm)')
-	plt.xlabel('$\%$ Ar')
-	plt.legend()
-	plt.tight_layout()
-	plt.savefig('electronGraphs/DesyProm-Ar-V.eps', format = 'eps')
-	plt.show()
-
-
-fixedE()
\ No newline at end of file
+fixedE()
+
+def timingFixedE(energy = 9):
+	renderFigures(ELECTRON_TIMING_FIGURES, electronTimingCube, ELECTRON_GRAPHS_PATH, energy = energy)
+
+electronTimingCube = getElectronTimingCube()
+
+timingFixedE()
\ No newline at end of file
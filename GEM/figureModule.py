@@ -0,0 +1,178 @@
+import os
+import json
+import hashlib
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+
+from sweepModule import SWEEP_CACHE_PATH
+from fitModule import fitLinear, fitNonlinear, modelEvaluator, poolWorkers, MODELS
+
+#	Paths
+
+FIGURES_MANIFEST_PATH 	= SWEEP_CACHE_PATH + 'figures.json'
+
+#	Style
+
+SERIES_COLORS 	= ['purple', 'red', 'green', 'magenta', 'blue']
+
+PARAMETERS 		= ['ar', 'energy', 'V']
+
+X_LABELS 		= {'ar': r'$\%$ Ar', 'energy': r'$E_{\mu^{-}}$(eV)', 'V': r'$V_{\mathrm{GEM}}$(V)'}
+
+#	Specs
+
+# quantity is a cube field, x and series are sweep parameters ('ar', 'energy' or 'V'), the remaining one is fixed when rendering
+
+FigureSpec = namedtuple('FigureSpec', ['quantity', 'x', 'series', 'title', 'ylabel', 'name', 'xscale', 'seriesValues', 'fit'], defaults = ['linear', None, None])
+
+#	Functions (Labels)
+
+def parameterValues(parameter, values):
+
+	if(parameter == 'energy'):
+		return 10.0**np.array(values)
+
+	return np.array(values)
+
+def seriesLabel(parameter, value):
+
+	if(parameter == 'energy'):
+		return r'$E_{\mu^{-}}$ = 1 $\times 10 ^{' + str(value) + r'}$ eV'
+
+	elif(parameter == 'ar'):
+		return r'$\mathrm{Ar/CO_2} = $' + '{}/{}'.format(value, 100 - value)
+
+	return 'V = {}V'.format(value)
+
+#	Functions (Data)
+
+def figureData(spec, cube, **fixed):
+
+	grid = {'ar': cube.argons, 'energy': cube.energies, 'V': cube.voltages}
+
+	values = cube.getField(spec.quantity, **fixed)
+
+	free = [parameter for parameter in PARAMETERS if parameter not in fixed]
+
+	if(free.index(spec.series) > free.index(spec.x)):
+		values = values.T
+
+	seriesValues = grid[spec.series] if spec.seriesValues is None else np.array(spec.seriesValues)
+
+	values = values[np.searchsorted(grid[spec.series], seriesValues)]
+
+	return grid[spec.x], seriesValues, values
+
+def figureHash(spec, xValues, seriesValues, values):
+
+	digest = hashlib.sha1(repr(tuple(spec)).encode())
+
+	for array in [xValues, seriesValues, values]:
+		digest.update(np.ascontiguousarray(array, dtype = float).tobytes())
+
+	return digest.hexdigest()
+
+def readManifest():
+
+	try:
+		with open(FIGURES_MANIFEST_PATH) as manifestFile:
+			return json.load(manifestFile)
+
+	except (OSError, ValueError):
+		return {}
+
+def writeManifest(manifest):
+
+	os.makedirs(SWEEP_CACHE_PATH, exist_ok = True)
+
+	with open(FIGURES_MANIFEST_PATH, 'w') as manifestFile:
+		json.dump(manifest, manifestFile, indent = 1, sort_keys = True)
+
+#	Functions (Rendering)
+
+def renderFigure(arguments):
+
+	# Object oriented matplotlib so that workers never touch an interactive backend
+
+	spec, xValues, seriesValues, values, filePath = arguments
+
+	fig = Figure()
+	ax 	= fig.subplots()
+
+	x = parameterValues(spec.x, xValues)
+
+	ax.set_title(spec.title)
+
+	for i, seriesValue in enumerate(seriesValues):
+
+		color = SERIES_COLORS[i % len(SERIES_COLORS)]
+
+		if(spec.fit):
+			ax.scatter(x, values[i], label = seriesLabel(spec.series, seriesValue), color = color)
+
+		else:
+			ax.plot(x, values[i], label = seriesLabel(spec.series, seriesValue), color = color)
+			ax.scatter(x, values[i], color = color)
+
+	if(spec.fit):
+
+		if(spec.fit not in MODELS):
+			raise ValueError('Unknown fit model {}, use one of {}'.format(spec.fit, list(MODELS)))
+
+		# The closed form for lines, one curve_fit for the other models of fitModule
+
+		coef, cov = fitLinear(x, values[0]) if spec.fit == 'linear' else fitNonlinear(spec.fit, x, values[0], workers = 1)
+
+		xCont = np.linspace(np.min(x), np.max(x), 1000)
+
+		ax.plot(xCont, modelEvaluator(spec.fit, coef)(xCont), color = 'black')
+
+	ax.set_ylabel(spec.ylabel)
+	ax.set_xlabel(X_LABELS[spec.x])
+	ax.set_xscale(spec.xscale)
+	ax.legend()
+
+	fig.tight_layout()
+	fig.savefig(filePath, format = 'eps')
+
+	return filePath
+
+def renderFigures(specs, cube, graphsPath, workers = None, force = False, **fixed):
+
+	# Only figures whose spec or sliced data changed since the last run (or whose file is missing) are drawn again
+
+	manifest = readManifest()
+
+	pending = []
+	hashes 	= {}
+
+	for spec in specs:
+
+		xValues, seriesValues, values = figureData(spec, cube, **fixed)
+
+		filePath = graphsPath + spec.name + '.eps'
+
+		hashes[filePath] = figureHash(spec, xValues, seriesValues, values)
+
+		if(force or manifest.get(filePath) != hashes[filePath] or not os.path.exists(filePath)):
+			pending.append((spec, xValues, seriesValues, values, filePath))
+
+	if(len(pending) == 0):
+		return []
+
+	os.makedirs(graphsPath, exist_ok = True)
+
+	if(poolWorkers(workers) == 1 or len(pending) == 1):
+		rendered = [renderFigure(arguments) for arguments in pending]
+
+	else:
+		with ProcessPoolExecutor(max_workers = workers) as executor:
+			rendered = list(executor.map(renderFigure, pending))
+
+	manifest.update({filePath: hashes[filePath] for filePath in rendered})
+
+	writeManifest(manifest)
+
+	return rendered
@@ -0,0 +1,291 @@
+import numpy as np
+import multiprocessing
+from scipy.optimize import curve_fit, minimize
+from scipy.special import gammainc
+from concurrent.futures import ProcessPoolExecutor
+
+#	Models
+
+def linear(x, m, b):
+	return m*x + b
+
+def exponential(x, a, b, c):
+	return a*np.exp(b*x) + c
+
+def townsend(x, a, b):
+	return a*np.exp(b*x)
+
+MODELS = {'linear': linear, 'exp': exponential, 'exponential': exponential, 'townsend': townsend}
+
+#	Polya
+
+POLYA_FIELDS 	= np.array(['polyaGainMean', 'polyaTheta', 'polyaGainMeanStd', 'polyaThetaStd'])
+
+POLYA_STEP 		= 1E-4
+
+# Fits of sparse histograms run away: theta + 1 collapses to 0 or the mean leaves the histogram range, both are returned as NaN
+
+POLYA_MIN_SHAPE = 1E-3
+
+#	Functions (Process pools)
+
+def poolWorkers(workers):
+
+	# The analysis scripts start their pools at module level (no __main__ guard), a spawned worker would import the script again
+	# Only forked workers are safe, other start methods (spawn on macOS, forkserver on Linux from Python 3.14) run serially
+
+	return workers if multiprocessing.get_start_method() == 'fork' else 1
+
+#	Functions (Closed form)
+
+def fitLinear(x, y):
+
+	# Least squares line for every slice along the last axis at once, covariance scaled as curve_fit does (absolute_sigma = False)
+
+	y = np.asarray(y, dtype = float)
+	x = np.broadcast_to(np.asarray(x, dtype = float), y.shape)
+
+	n = y.shape[-1]
+
+	xMean = np.mean(x, axis = -1, keepdims = True)
+	yMean = np.mean(y, axis = -1, keepdims = True)
+
+	sxx = np.sum((x - xMean)**2, axis = -1)
+	sxy = np.sum((x - xMean)*(y - yMean), axis = -1)
+
+	m = sxy/sxx
+	b = yMean[..., 0] - m*xMean[..., 0]
+
+	s2 = np.sum((y - (m[..., np.newaxis]*x + b[..., np.newaxis]))**2, axis = -1)/(n - 2)
+
+	cov = np.empty(y.shape[:-1] + (2, 2))
+
+	cov[..., 0, 0] = s2/sxx
+	cov[..., 0, 1] = -xMean[..., 0]*s2/sxx
+	cov[..., 1, 0] = cov[..., 0, 1]
+	cov[..., 1, 1] = s2*(1/n + xMean[..., 0]**2/sxx)
+
+	return np.stack([m, b], axis = -1), cov
+
+def guessTownsend(x, y):
+
+	# Straight line on log(y) gives a and b of a*exp(b*x) for every slice
+
+	coef, cov = fitLinear(x, np.log(np.clip(y, np.finfo(float).tiny, None)))
+
+	return np.stack([np.exp(coef[..., 1]), coef[..., 0]], axis = -1)
+
+#	Functions (Nonlinear)
+
+def fitSlice(arguments):
+
+	model, x, y, guess = arguments
+
+	parameters = MODELS[model].__code__.co_argcount - 1
+
+	valid = np.isfinite(x) & np.isfinite(y)
+
+	try:
+		return curve_fit(MODELS[model], x[valid], y[valid], p0 = guess)
+
+	except (RuntimeError, ValueError, TypeError):
+		return np.full(parameters, np.nan), np.full((parameters, parameters), np.nan)
+
+def fitNonlinear(model, x, y, guess = None, workers = None):
+
+	# One curve_fit per slice along the last axis, the slices are fitted in a process pool
+
+	y = np.asarray(y, dtype = float)
+	x = np.broadcast_to(np.asarray(x, dtype = float), y.shape)
+
+	if(guess is None and model != 'linear'):
+
+		guess = guessTownsend(x, y)
+
+		if(model != 'townsend'):
+			guess = np.concatenate([guess, np.zeros(guess.shape[:-1] + (1,))], axis = -1)
+
+	flatX = x.reshape(-1, y.shape[-1])
+	flatY = y.reshape(-1, y.shape[-1])
+
+	flatGuess = [None]*len(flatY) if guess is None else np.broadcast_to(guess, y.shape[:-1] + np.shape(guess)[-1:]).reshape(len(flatY), -1)
+
+	arguments = [(model, flatX[i], flatY[i], flatGuess[i]) for i in range(len(flatY))]
+
+	if(poolWorkers(workers) == 1 or len(arguments) == 1):
+		results = [fitSlice(argument) for argument in arguments]
+
+	else:
+		with ProcessPoolExecutor(max_workers = workers) as executor:
+			results = list(executor.map(fitSlice, arguments))
+
+	coef = np.array([result[0] for result in results])
+	cov  = np.array([result[1] for result in results])
+
+	return coef.reshape(y.shape[:-1] + coef.shape[-1:]), cov.reshape(y.shape[:-1] + cov.shape[-2:])
+
+def fitGainVoltage(voltages, gains, model = 'townsend', workers = None):
+
+	# gains has voltages on its last axis, e.g. (argons, voltages) for a fixed energy
+
+	return fitNonlinear(model, voltages, gains, workers = workers)
+
+#	Functions (Polya)
+
+def polyaProbabilities(edges, gainMean, theta):
+
+	# Polya of mean gainMean and parameter theta is a gamma distribution of shape theta + 1 and scale gainMean/(theta + 1)
+
+	shape = np.asarray(theta)[..., np.newaxis] + 1
+
+	cdf = gammainc(shape, edges*shape/np.asarray(gainMean)[..., np.newaxis])
+
+	return np.diff(cdf, axis = -1)
+
+def polyaNegLogLikelihood(gainMean, theta, counts, edges):
+
+	# Multinomial binned likelihood, the model is normalized inside the histogram range
+
+	probabilities = polyaProbabilities(edges, gainMean, theta)
+
+	# Parameters that leave no probability inside the histogram range are rejected
+
+	total = np.sum(probabilities, axis = -1, keepdims = True)
+
+	if(not np.all(total > 0)):
+		return np.inf
+
+	probabilities = probabilities/total
+
+	filled = counts > 0
+
+	return -np.sum(counts[filled]*np.log(np.clip(probabilities[filled], np.finfo(float).tiny, None)))
+
+def guessPolya(counts, edges):
+
+	# Moments of the histogram: theta + 1 = mean^2/variance
+
+	centers = (edges[..., 1:] + edges[..., :-1])/2
+	total 	= np.sum(counts, axis = -1)
+
+	mean 		= np.sum(counts*centers, axis = -1)/total
+	variance 	= np.sum(counts*(centers - mean[..., np.newaxis])**2, axis = -1)/total
+
+	return np.stack([mean, mean**2/variance - 1], axis = -1)
+
+def polyaCovariance(gainMean, theta, counts, edges):
+
+	# Inverse of the finite difference Hessian of -log L in (gainMean, theta)
+
+	point 	= np.array([gainMean, theta])
+	steps 	= POLYA_STEP*np.maximum(np.abs(point), 1)
+
+	def nll(shift):
+		return polyaNegLogLikelihood(*(point + shift*steps), counts, edges)
+
+	hessian = np.empty((2, 2))
+
+	for i, j in [(0, 0), (1, 1), (0, 1)]:
+
+		ei, ej = np.eye(2)[i], np.eye(2)[j]
+
+		hessian[i, j] = (nll(ei + ej) - nll(ei - ej) - nll(ej - ei) + nll(-ei - ej))/(4*steps[i]*steps[j])
+		hessian[j, i] = hessian[i, j]
+
+	return np.linalg.inv(hessian)
+
+def fitPolyaSlice(arguments):
+
+	counts, edges = arguments
+
+	if(not (np.all(np.isfinite(counts)) and np.all(np.isfinite(edges)) and np.sum(counts) > 1)):
+		return np.full(len(POLYA_FIELDS), np.nan)
+
+	gainGuess, thetaGuess = guessPolya(counts, edges)
+
+	# Logarithmic parameters keep the mean positive and theta above -1
+
+	def objective(parameters):
+		return polyaNegLogLikelihood(np.exp(parameters[0]), np.exp(parameters[1]) - 1, counts, edges)
+
+	result = minimize(objective, [np.log(gainGuess), np.log(max(thetaGuess, 0) + 1)], method = 'Nelder-Mead', options = {'xatol': 1E-8, 'fatol': 1E-10, 'maxiter': 2000})
+
+	if(not result.success):
+		return np.full(len(POLYA_FIELDS), np.nan)
+
+	gainMean, theta = np.exp(result.x[0]), np.exp(result.x[1]) - 1
+
+	if(theta + 1 < POLYA_MIN_SHAPE or not (edges[0] <= gainMean <= edges[-1])):
+		return np.full(len(POLYA_FIELDS), np.nan)
+
+	try:
+		with np.errstate(all = 'ignore'):
+			errors = np.sqrt(np.diag(polyaCovariance(gainMean, theta, counts, edges)))
+
+	except np.linalg.LinAlgError:
+		errors = np.full(2, np.nan)
+
+	return np.array([gainMean, theta, errors[0], errors[1]])
+
+def fitPolya(counts, edges, workers = None):
+
+	# counts (..., bins) and edges (..., bins + 1), e.g. the gain histograms of the whole sweep, give (..., POLYA_FIELDS)
+
+	counts 	= np.asarray(counts, dtype = float)
+	edges 	= np.broadcast_to(np.asarray(edges, dtype = float), counts.shape[:-1] + (counts.shape[-1] + 1,))
+
+	flatCounts 	= counts.reshape(-1, counts.shape[-1])
+	flatEdges 	= edges.reshape(-1, edges.shape[-1])
+
+	arguments = [(flatCounts[i], flatEdges[i]) for i in range(len(flatCounts))]
+
+	if(poolWorkers(workers) == 1 or len(arguments) == 1):
+		results = [fitPolyaSlice(argument) for argument in arguments]
+
+	else:
+		with ProcessPoolExecutor(max_workers = workers) as executor:
+			results = list(executor.map(fitPolyaSlice, arguments, chunksize = 8))
+
+	return np.array(results).reshape(counts.shape[:-1] + (len(POLYA_FIELDS),))
+
+def interpolatePolya(voltages, parameters, V):
+
+	# parameters (..., voltages, POLYA_FIELDS) at the sweep voltages, V the voltages wanted
+	# The gain grows exponentially with the voltage so it is interpolated in log, theta linearly
+
+	voltages 	= np.asarray(voltages, dtype = float)
+	V 			= np.atleast_1d(np.asarray(V, dtype = float))
+
+	upper 	= np.clip(np.searchsorted(voltages, V), 1, len(voltages) - 1)
+	lower 	= upper - 1
+
+	w = (V - voltages[lower])/(voltages[upper] - voltages[lower])
+
+	low, high = parameters[..., lower, :], parameters[..., upper, :]
+
+	interpolated = np.empty(parameters.shape[:-2] + (len(V), len(POLYA_FIELDS)))
+
+	interpolated[..., 0] = np.exp((1 - w)*np.log(low[..., 0]) + w*np.log(high[..., 0]))
+	interpolated[..., 1] = (1 - w)*low[..., 1] + w*high[..., 1]
+
+	# Independent errors at both voltages: sigma^2 = sum w^2 sigma_i^2 (relative for the gain)
+
+	relative = np.sqrt(((1 - w)*low[..., 2]/low[..., 0])**2 + (w*high[..., 2]/high[..., 0])**2)
+
+	interpolated[..., 2] = interpolated[..., 0]*relative
+	interpolated[..., 3] = np.sqrt(((1 - w)*low[..., 3])**2 + (w*high[..., 3])**2)
+
+	return interpolated
+
+#	Functions (Evaluation)
+
+def modelEvaluator(model, coef):
+
+	# Broadcasts over the fitted slices: coef (..., p) and x (k,) give (..., k)
+
+	coef = np.asarray(coef)
+
+	def evaluate(x):
+		return MODELS[model](np.asarray(x), *[coef[..., i, np.newaxis] if coef.ndim > 1 else coef[i] for i in range(coef.shape[-1])])
+
+	return evaluate
@@ -0,0 +1,149 @@
+import numpy as np
+from scipy.interpolate import make_interp_spline, make_smoothing_spline
+
+#	Interpolation
+
+INTERPOLATION_METHODS 	= ['linear', 'spline']
+
+SPLINE_RESOLUTION 		= 32
+
+QUERY_CHUNK_SIZE 		= 262144
+
+#	Functions (Axis operators)
+
+def linearOperator(nodes):
+
+	# Hat functions sampled at the nodes themselves: linear interpolation of the rows is plain multilinear interpolation
+
+	return nodes, np.eye(len(nodes))
+
+def splineOperator(nodes, smoothing = 0.0, resolution = SPLINE_RESOLUTION):
+
+	# Rows of the cubic spline that maps the node values to a fine grid, the axis is scaled to [0, 1] so smoothing has no units
+
+	if(len(nodes) < 5):
+		return linearOperator(nodes)
+
+	scaled 	= (nodes - nodes[0])/(nodes[-1] - nodes[0])
+	fine 	= np.linspace(0, 1, (len(nodes) - 1)*resolution + 1)
+
+	if(smoothing > 0):
+		spline = make_smoothing_spline(scaled, np.eye(len(nodes)), lam = smoothing)
+
+	else:
+		spline = make_interp_spline(scaled, np.eye(len(nodes)), k = 3)
+
+	return nodes[0] + fine*(nodes[-1] - nodes[0]), spline(fine)
+
+def operatorWeights(grid, operator, queries):
+
+	# Row of the axis operator at every query, NaN outside the sweep
+
+	index 	= np.clip(np.searchsorted(grid, queries, side = 'right') - 1, 0, len(grid) - 2)
+	w 		= ((queries - grid[index])/(grid[index + 1] - grid[index]))[:, np.newaxis]
+
+	weights = (1 - w)*operator[index] + w*operator[index + 1]
+
+	weights[(queries < grid[0]) | (queries > grid[-1]) | np.isnan(queries)] = np.nan
+
+	return weights
+
+# Classes
+
+class SweepInterpolator():
+
+	# Interpolation of cube fields at any operating point of the free axes (the ones not fixed in **fixed)
+	# Every method is linear in the cell values, value = sum r_ar r_E r_V y and variance = sum (r_ar r_E r_V)^2 sigma^2
+
+	def __init__(self, cube, fields, errorFields = None, countField = None, method = 'linear', smoothing = 0.0, logScale = False, **fixed):
+
+		if(method not in INTERPOLATION_METHODS):
+			raise ValueError('Unknown interpolation method {}, use one of {}'.format(method, INTERPOLATION_METHODS))
+
+		self.single 	= isinstance(fields, str)
+		self.fields 	= [fields] if self.single else list(fields)
+		self.method 	= method
+		self.logScale 	= logScale
+		self.fixed 		= fixed
+
+		grid = {'ar': cube.argons, 'energy': cube.energies, 'V': cube.voltages}
+
+		self.axes  = [parameter for parameter in ['ar', 'energy', 'V'] if parameter not in fixed]
+		self.nodes = [np.asarray(grid[axis], dtype = float) for axis in self.axes]
+
+		values = np.stack([cube.getField(field, **fixed) for field in self.fields], axis = -1)
+
+		# Standard errors of the cell values, errorFields / sqrt(countField) when the errors are spreads
+
+		if(errorFields is None):
+			errors = np.zeros(values.shape)
+
+		else:
+			errorFields = [errorFields] if isinstance(errorFields, str) else list(errorFields)
+			errors 		= np.stack([cube.getField(field, **fixed) for field in errorFields], axis = -1)
+
+			if(countField is not None):
+				errors = errors/np.sqrt(cube.getField(countField, **fixed))[..., np.newaxis]
+
+		if(logScale):
+			errors, values = errors/values, np.log(values)
+
+		# Missing cells are zeroed and tracked apart, a query touching one of them is NaN
+
+		self.missing 	= np.any(~np.isfinite(values), axis = -1).astype(float)
+		self.values 	= np.where(np.isfinite(values), values, 0)
+		self.variances 	= np.where(np.isfinite(errors), errors**2, 0)
+
+		self.hasErrors = errorFields is not None
+
+		self.operators = [splineOperator(nodes, smoothing) if method == 'spline' else linearOperator(nodes) for nodes in self.nodes]
+
+	def contract(self, weights, table):
+
+		# weights per axis (n, axis) contracted against table (axis..., F) one axis at a time
+
+		result = np.einsum('na,a...->n...', weights[0], table)
+
+		for axisWeights in weights[1:]:
+			result = np.einsum('na,na...->n...', axisWeights, result)
+
+		return result
+
+	def __call__(self, **queries):
+
+		missingAxes = [axis for axis in self.axes if axis not in queries]
+
+		if(len(missingAxes) > 0):
+			raise ValueError('Queries need every free axis, missing {}'.format(missingAxes))
+
+		points 	= np.broadcast_arrays(*[np.ravel(np.asarray(queries[axis], dtype = float)) for axis in self.axes])
+		n 		= len(points[0])
+
+		values = np.empty((n, len(self.fields)))
+		errors = np.empty((n, len(self.fields)))
+
+		for start in range(0, n, QUERY_CHUNK_SIZE):
+
+			chunk = slice(start, start + QUERY_CHUNK_SIZE)
+
+			weights = [operatorWeights(grid, operator, axisPoints[chunk]) for (grid, operator), axisPoints in zip(self.operators, points)]
+
+			touchesMissing = self.contract([np.abs(axisWeights) for axisWeights in weights], self.missing) > 0
+
+			values[chunk] = self.contract(weights, self.values)
+			errors[chunk] = np.sqrt(self.contract([axisWeights**2 for axisWeights in weights], self.variances))
+
+			values[chunk][touchesMissing] = np.nan
+			errors[chunk][touchesMissing] = np.nan
+
+		if(self.logScale):
+			values = np.exp(values)
+			errors = values*errors
+
+		if(not self.hasErrors):
+			errors[np.isfinite(values)] = 0
+
+		if(self.single):
+			return values[:, 0], errors[:, 0]
+
+		return values, errors
@@ -0,0 +1,472 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from fitModule import POLYA_FIELDS, fitPolya, poolWorkers
+from occupancyModule import Occupancy2D, OCCUPANCY_BINS
+from raggedModule import RaggedEvents
+
+#	Paths
+
+ELECTRONS_FILE_FORMAT 	= '{V}/dataElectronsAr{ar}E{energy}V{V}.csv'
+
+AVALANCHES_FILE_FORMAT 	= '{V}/dataAvalanchesAr{ar}E{energy}V{V}.csv'
+
+SWEEP_CACHE_PATH 		= 'sweepCache/'
+
+#	Sweep grid
+
+ARGONS 		= np.array([60, 65, 70, 75, 80])
+
+ENERGIES 	= np.array([7, 8, 9, 10, 11])
+
+VOLTAGES 	= np.array([400, 410, 420, 430, 440, 450, 460, 470, 480, 490, 500])
+
+#	Detector Constants
+
+READOUT_Z 			= -0.203000
+
+READOUT_TOLERANCE 	= 1E-5
+
+#	Streaming reader
+
+CHUNK_SIZE 			= 1000000
+
+ELECTRON_DTYPES 	= {'step': np.int32, 'x': np.float64, 'y': np.float64, 'z': np.float32, 'e': np.float64}
+
+AVALANCHE_DTYPES 	= {'step': np.int32, 'filTot': np.float64, 'ne': np.float64, 'nIons': np.float64}
+
+TIMING_DTYPES 		= {'step': np.int32, 'z': np.float32, 't': np.float64}
+
+#	Electron timing (the track of event i starts at TRACK_TIME_SPACING*i ns, step = i + 1)
+
+TRACK_TIME_SPACING 	= 100
+
+#	Avalanche histograms
+
+HISTOGRAM_BINS 			= 40
+
+HISTOGRAM_QUANTITIES 	= np.array(['gain', 'ne', 'nIons'])
+
+#	Electron occupancy (sensor area of the GEM cell in cm)
+
+OCCUPANCY_X_RANGE 	= (-0.08, 0.08)
+
+OCCUPANCY_Y_RANGE 	= (-0.3, 0.3)
+
+#	Summary fields (same order as readElectronData returns them)
+
+ELECTRON_FIELDS 	= np.array(['xAllMean', 'xAllStd', 'yAllMean', 'yAllStd', 'eAllMean', 'eAllStd', 'xAvgMean', 'xAvgStd', 'yAvgMean', 'yAvgStd'])
+
+TIMING_FIELDS 		= np.array(['tFirstMean', 'tFirstStd', 'tMedianMean', 'tMedianStd', 'tSpreadMean', 'tSpreadStd', 'timedEvents'])
+
+AVALANCHE_FIELDS 	= np.array(['gainAllMean', 'gainAllStd', 'gainAvgMean', 'gainAvgStd', 'ionsEventMean', 'ionsEventStd', 'electronsAllMean', 'electronsAllStd', 'electronsEventMean', 'electronsEventStd', 'events'])
+
+#	Functions (Files)
+
+def electronsFilePath(ar, energy, V):
+	return ELECTRONS_FILE_FORMAT.format(ar = ar, energy = energy, V = V)
+
+def avalanchesFilePath(ar, energy, V):
+	return AVALANCHES_FILE_FORMAT.format(ar = ar, energy = energy, V = V)
+
+def gridFilePaths(fileFormat, argons = ARGONS, energies = ENERGIES, voltages = VOLTAGES):
+
+	ar, energy, V = np.meshgrid(argons, energies, voltages, indexing = 'ij')
+
+	return np.vectorize(lambda ar, energy, V: fileFormat.format(ar = ar, energy = energy, V = V), otypes = [np.dtype('O')])(ar, energy, V)
+
+def fileFingerprint(filePath):
+
+	try:
+		stat = os.stat(filePath)
+
+	except OSError:
+		return ''
+
+	return '{}-{}'.format(stat.st_size, stat.st_mtime_ns)
+
+#	Functions (Statistics)
+
+def onReadoutPlane(z, readoutZ = READOUT_Z):
+	return np.abs(z - readoutZ) <= READOUT_TOLERANCE
+
+def chunkMoments(values):
+
+	count = len(values)
+
+	if(count == 0):
+		return 0, 0.0, 0.0
+
+	mean = np.mean(values)
+
+	return count, mean, np.sum((values - mean)**2)
+
+def groupMoments(inverse, values, groups):
+
+	count = np.bincount(inverse, minlength = groups)
+	mean  = np.divide(np.bincount(inverse, values, minlength = groups), count, out = np.zeros(groups), where = count > 0)
+
+	return count, mean, np.bincount(inverse, (values - mean[inverse])**2, minlength = groups)
+
+def mergeMoments(countA, meanA, m2A, countB, meanB, m2B):
+
+	# Chan et al. pairwise update, works elementwise on arrays of partial moments
+
+	count = countA + countB
+	delta = meanB - meanA
+
+	weight = np.divide(countB, count, out = np.zeros(np.shape(count)), where = np.asarray(count) > 0)
+
+	return count, meanA + delta*weight, m2A + m2B + (delta**2)*countA*weight
+
+def momentsStatistics(count, mean, m2):
+
+	# Sample std (ddof = 1) as pandas, NaN when there are less than two entries
+
+	std = np.sqrt(np.divide(m2, count - 1, out = np.full(np.shape(count), np.nan), where = np.asarray(count) > 1))
+
+	return np.where(np.asarray(count) > 0, mean, np.nan), std
+
+def readElectronStatistics(filePath, chunkSize = CHUNK_SIZE):
+
+	# Streams the file so memory is bounded by chunkSize rows plus one accumulator entry per step
+
+	readout = {'x': (0, 0.0, 0.0), 'y': (0, 0.0, 0.0), 'e': (0, 0.0, 0.0)}
+	byStep  = {'x': (np.zeros(0, dtype = np.int64), np.zeros(0), np.zeros(0)), 'y': (np.zeros(0, dtype = np.int64), np.zeros(0), np.zeros(0))}
+
+	for chunk in pd.read_csv(filePath, usecols = list(ELECTRON_DTYPES), dtype = ELECTRON_DTYPES, chunksize = chunkSize):
+
+		onReadout = onReadoutPlane(chunk['z'].to_numpy())
+
+		for column in readout:
+			readout[column] = mergeMoments(*readout[column], *chunkMoments(chunk[column].to_numpy()[onReadout]))
+
+		steps = chunk['step'].to_numpy()
+
+		stepsNumber = max(steps.max() + 1, len(byStep['x'][0]))
+
+		for column in byStep:
+
+			chunkStep = groupMoments(steps, chunk[column].to_numpy(), stepsNumber)
+			totalStep = [np.pad(moment, (0, stepsNumber - len(moment))) for moment in byStep[column]]
+
+			byStep[column] = mergeMoments(*totalStep, *chunkStep)
+
+	xAllMean, xAllStd = momentsStatistics(*readout['x'])
+	yAllMean, yAllStd = momentsStatistics(*readout['y'])
+	eAllMean, eAllStd = momentsStatistics(*readout['e'])
+
+	seen = byStep['x'][0] > 0
+
+	muonMeanX, muonStdX = momentsStatistics(*[moment[seen] for moment in byStep['x']])
+	muonMeanY, muonStdY = momentsStatistics(*[moment[seen] for moment in byStep['y']])
+
+	return np.array([xAllMean, xAllStd, yAllMean, yAllStd, eAllMean, eAllStd, np.nanmean(muonMeanX), np.nanstd(muonStdX, ddof = 1), np.nanmean(muonMeanY), np.nanstd(muonStdY, ddof = 1)])
+
+def readEventChunks(filePath, dtypes, chunkSize = CHUNK_SIZE, selection = None):
+
+	# Complete events of a file written event after event, the rows of the last step of a chunk wait for the next chunk
+
+	carry = None
+
+	for chunk in pd.read_csv(filePath, usecols = list(dtypes), dtype = dtypes, chunksize = chunkSize):
+
+		if(selection is not None):
+			chunk = chunk[selection(chunk)]
+
+		if(carry is not None):
+			chunk = pd.concat([carry, chunk])
+
+		if(len(chunk) == 0):
+			continue
+
+		complete = chunk['step'].to_numpy() != chunk['step'].to_numpy()[-1]
+
+		carry = chunk[~complete]
+
+		yield RaggedEvents.fromDataFrame(chunk[complete], 'step')
+
+	if(carry is not None and len(carry) > 0):
+		yield RaggedEvents.fromDataFrame(carry, 'step')
+
+def eventTiming(events):
+
+	# First arrival, median and spread of every event, times relative to the start of its track
+
+	events = RaggedEvents(events.ids, events.offsets, {'t': events['t'] - events.expand(TRACK_TIME_SPACING*(events.ids - 1))})
+
+	return events.min('t'), events.median('t'), events.std('t')
+
+def readElectronTiming(filePath, chunkSize = CHUNK_SIZE):
+
+	# Per-event timing of the electrons on the readout plane, the spread of the per-event values is the timing resolution
+
+	timings = [eventTiming(events) for events in readEventChunks(filePath, TIMING_DTYPES, chunkSize, selection = lambda chunk: onReadoutPlane(chunk['z'].to_numpy()))]
+
+	tFirst, tMedian, tSpread = [np.concatenate([timing[i] for timing in timings] + [np.zeros(0)]) for i in range(3)]
+
+	statistics = [momentsStatistics(*chunkMoments(values[np.isfinite(values)])) for values in [tFirst, tMedian, tSpread]]
+
+	return np.array([value for statistic in statistics for value in statistic] + [len(tFirst)])
+
+def readAvalancheSums(filePath, chunkSize = CHUNK_SIZE):
+
+	# Per-step sums and avalanche counts, the only per-event quantities the avalanche summaries need
+
+	sums 	= {column: np.zeros(0) for column in ['filTot', 'ne', 'nIons']}
+	counts 	= np.zeros(0, dtype = np.int64)
+	ne 		= (0, 0.0, 0.0)
+
+	for chunk in pd.read_csv(filePath, usecols = list(AVALANCHE_DTYPES), dtype = AVALANCHE_DTYPES, chunksize = chunkSize):
+
+		steps = chunk['step'].to_numpy()
+
+		stepsNumber = max(steps.max() + 1, len(counts))
+
+		counts = np.pad(counts, (0, stepsNumber - len(counts))) + np.bincount(steps, minlength = stepsNumber)
+
+		for column in sums:
+			sums[column] = np.pad(sums[column], (0, stepsNumber - len(sums[column]))) + np.bincount(steps, chunk[column].to_numpy(), minlength = stepsNumber)
+
+		ne = mergeMoments(*ne, *chunkMoments(chunk['ne'].to_numpy()))
+
+	seen = counts > 0
+
+	return counts[seen], {column: sums[column][seen] for column in sums}, ne
+
+def readAvalancheStatistics(filePath, chunkSize = CHUNK_SIZE):
+
+	counts, sums, ne = readAvalancheSums(filePath, chunkSize)
+
+	gain = sums['filTot']
+	gainAvg = gain/counts
+
+	electronsAllMean, electronsAllStd = momentsStatistics(*ne)
+
+	return np.array([gain.mean(), gain.std(ddof = 1), gainAvg.mean(), gainAvg.std(ddof = 1), sums['nIons'].mean(), sums['nIons'].std(ddof = 1), electronsAllMean, electronsAllStd, sums['ne'].mean(), sums['ne'].std(ddof = 1), len(counts)])
+
+def histogramFields(bins = HISTOGRAM_BINS):
+
+	return np.concatenate([[quantity + 'Low', quantity + 'High'] + [quantity + str(i) for i in range(bins)] for quantity in HISTOGRAM_QUANTITIES])
+
+def readAvalancheHistograms(filePath, bins = HISTOGRAM_BINS, chunkSize = CHUNK_SIZE):
+
+	# Fixed-bin histograms of the per-event distributions, each stored as [low, high, counts...]
+
+	counts, sums, ne = readAvalancheSums(filePath, chunkSize)
+
+	histograms = []
+
+	for values in [sums['filTot'], sums['ne'], sums['nIons']]:
+
+		histogramCounts, edges = np.histogram(values, bins = bins)
+
+		histograms.append(np.concatenate([[edges[0], edges[-1]], histogramCounts]))
+
+	return np.concatenate(histograms)
+
+def unpackHistogram(record, quantity = 'gain', bins = HISTOGRAM_BINS):
+
+	start = int(np.flatnonzero(HISTOGRAM_QUANTITIES == quantity)[0])*(bins + 2)
+
+	low, high = record[..., start], record[..., start + 1]
+
+	edges = low[..., np.newaxis] + (high - low)[..., np.newaxis]*np.linspace(0, 1, bins + 1)
+
+	return record[..., start + 2: start + 2 + bins], edges
+
+def occupancyFields(bins = OCCUPANCY_BINS):
+	return np.array(['occupancy' + str(i) for i in range(bins*bins)])
+
+def readElectronOccupancy(filePath, bins = OCCUPANCY_BINS, chunkSize = CHUNK_SIZE):
+
+	# (x, y) counts of the electrons on the readout plane, flattened x major
+
+	occupancy = Occupancy2D(OCCUPANCY_X_RANGE, OCCUPANCY_Y_RANGE, bins)
+
+	occupancy.fillCsv(filePath, selection = lambda chunk: onReadoutPlane(chunk['z'].to_numpy()), columns = ['z'], chunkSize = chunkSize)
+
+	return np.ravel(occupancy.counts)
+
+def unpackOccupancy(record, bins = OCCUPANCY_BINS):
+
+	# Cells summed over the leading axes of the record give one occupancy, e.g. all argons at fixed (E, V)
+
+	counts = np.nansum(np.reshape(record, (-1, bins*bins)), axis = 0)
+
+	return Occupancy2D(OCCUPANCY_X_RANGE, OCCUPANCY_Y_RANGE, bins, counts.astype(np.int64))
+
+#	Functions (Parallel loading)
+
+def loadSweep(reader, filePaths, workers = None):
+
+	# Cells are independent files, so they are fanned out over a process pool in grid order
+
+	filePaths = np.array(filePaths, dtype = np.dtype('O'))
+
+	# No file gives no cells and no fields, e.g. a grid whose data directories are still empty
+
+	if(filePaths.size == 0):
+		return np.zeros(filePaths.shape + (0,))
+
+	if(poolWorkers(workers) == 1):
+		results = [reader(filePath) for filePath in filePaths.flat]
+
+	else:
+		with ProcessPoolExecutor(max_workers = workers) as executor:
+			results = list(executor.map(reader, filePaths.flat, chunksize = max(1, filePaths.size//(4*(workers or os.cpu_count())))))
+
+	stacked = np.empty((len(results), len(results[0])), dtype = results[0].dtype)
+
+	for i, result in enumerate(results):
+		stacked[i] = result
+
+	return stacked.reshape(filePaths.shape + (-1,))
+
+def loadSweepGrid(reader, fileFormat, argons = ARGONS, energies = ENERGIES, voltages = VOLTAGES, workers = None):
+
+	# Returns an (ar, energy, V, fields) array, cells without a file are left as NaN
+
+	filePaths = gridFilePaths(fileFormat, argons, energies, voltages)
+
+	exists = np.vectorize(os.path.exists, otypes = [bool])(filePaths)
+
+	cells = loadSweep(reader, filePaths[exists], workers)
+
+	stacked = np.full(filePaths.shape + cells.shape[-1:], np.nan, dtype = cells.dtype)
+	stacked[exists] = cells
+
+	return stacked
+
+def benchmarkSweepLoader(reader, fileFormat, workersList = (1, 2, 4, 8, 16, 32), **kwargs):
+
+	times = np.zeros(len(workersList))
+
+	for i, workers in enumerate(workersList):
+
+		start = time.perf_counter()
+		loadSweepGrid(reader, fileFormat, workers = workers, **kwargs)
+		times[i] = time.perf_counter() - start
+
+	return np.array(workersList), times, times[0]/times
+
+# Classes
+
+class ParameterCube():
+
+	def __init__(self, fields, values, argons = ARGONS, energies = ENERGIES, voltages = VOLTAGES):
+
+		self.fields 	= np.array(fields)
+		self.values 	= values
+
+		self.argons 	= np.array(argons)
+		self.energies 	= np.array(energies)
+		self.voltages 	= np.array(voltages)
+
+	def get(self, ar = None, energy = None, V = None):
+
+		# Fixed parameters are removed from the result, free ones keep the (ar, energy, V) order
+
+		index = (self.getIndex(self.argons, ar), self.getIndex(self.energies, energy), self.getIndex(self.voltages, V))
+
+		return self.values[index]
+
+	def getIndex(self, parameters, value):
+
+		if(value is None):
+			return slice(None)
+
+		return int(np.flatnonzero(parameters == value)[0])
+
+	def getField(self, field, **kwargs):
+
+		return self.get(**kwargs)[..., int(np.flatnonzero(self.fields == field)[0])]
+
+
+class SweepCube(ParameterCube):
+
+	def __init__(self, name, reader, fields, fileFormat, argons = ARGONS, energies = ENERGIES, voltages = VOLTAGES, workers = None):
+
+		ParameterCube.__init__(self, fields, None, argons, energies, voltages)
+
+		self.name 		= name
+		self.reader 	= reader
+		self.fileFormat = fileFormat
+
+		self.workers 	= workers
+
+		self.cachePath 	= SWEEP_CACHE_PATH + name + '.npz'
+
+		self.getData()
+
+	def getData(self):
+
+		self.filePaths 		= gridFilePaths(self.fileFormat, self.argons, self.energies, self.voltages)
+		self.fingerprints 	= np.vectorize(fileFingerprint, otypes = [np.dtype('U64')])(self.filePaths)
+
+		self.values = np.full(self.filePaths.shape + (len(self.fields),), np.nan)
+
+		cachedFingerprints = self.readCache()
+
+		outdated = (self.fingerprints != cachedFingerprints) & (self.fingerprints != '')
+
+		if(np.any(outdated)):
+
+			self.values[outdated] = loadSweep(self.reader, self.filePaths[outdated], self.workers)
+
+			self.writeCache()
+
+		self.values[self.fingerprints == ''] = np.nan
+
+	def readCache(self):
+
+		try:
+			cache = np.load(self.cachePath)
+
+		except OSError:
+			return np.full(self.filePaths.shape, '', dtype = np.dtype('U64'))
+
+		sameGrid = np.array_equal(cache['argons'], self.argons) and np.array_equal(cache['energies'], self.energies) and np.array_equal(cache['voltages'], self.voltages) and np.array_equal(cache['fields'], self.fields)
+
+		if(not sameGrid):
+			return np.full(self.filePaths.shape, '', dtype = np.dtype('U64'))
+
+		self.values = cache['values']
+
+		return cache['fingerprints']
+
+	def writeCache(self):
+
+		os.makedirs(SWEEP_CACHE_PATH, exist_ok = True)
+
+		np.savez(self.cachePath, values = self.values, fingerprints = self.fingerprints, argons = self.argons, energies = self.energies, voltages = self.voltages, fields = self.fields)
+
+
+def getElectronCube(**kwargs):
+	return SweepCube('electrons', readElectronStatistics, ELECTRON_FIELDS, ELECTRONS_FILE_FORMAT, **kwargs)
+
+def getAvalancheCube(**kwargs):
+	return SweepCube('avalanches', readAvalancheStatistics, AVALANCHE_FIELDS, AVALANCHES_FILE_FORMAT, **kwargs)
+
+def getAvalancheHistogramCube(bins = HISTOGRAM_BINS, **kwargs):
+	return SweepCube('avalancheHistograms{}'.format(bins), partial(readAvalancheHistograms, bins = bins), histogramFields(bins), AVALANCHES_FILE_FORMAT, **kwargs)
+
+def getPolyaCube(bins = HISTOGRAM_BINS, workers = None, **kwargs):
+
+	# Polya fit of the per-event gain histogram of every cell, the histograms come from their own cache
+
+	histogramCube = getAvalancheHistogramCube(bins, workers = workers, **kwargs)
+
+	counts, edges = unpackHistogram(histogramCube.values, 'gain', bins)
+
+	return ParameterCube(POLYA_FIELDS, fitPolya(counts, edges, workers), histogramCube.argons, histogramCube.energies, histogramCube.voltages)
+
+def getElectronTimingCube(**kwargs):
+	return SweepCube('electronTiming', readElectronTiming, TIMING_FIELDS, ELECTRONS_FILE_FORMAT, **kwargs)
+
+def getElectronOccupancyCube(bins = OCCUPANCY_BINS, **kwargs):
+	return SweepCube('electronOccupancy{}'.format(bins), partial(readElectronOccupancy, bins = bins), occupancyFields(bins), ELECTRONS_FILE_FORMAT, **kwargs)
@@ -0,0 +1,201 @@
+import numpy as np
+
+#	Paths
+
+ALIGNMENT_PATH 			= 'alignment.npz'
+
+#	Alignment
+
+# Hits farther than this from the prediction (electrons lost to a neighbour hole) are left out of the fit, in cm
+
+ALIGNMENT_CUT 			= 0.1
+
+ALIGNMENT_ITERATIONS 	= 20
+
+ALIGNMENT_TOLERANCE 	= 1E-7
+
+# 'muon': predictions are the simulated muon entry points, 'track': a straight line fitted through the aligned hits
+
+ALIGNMENT_REFERENCES 	= ['muon', 'track']
+
+#	Functions (Tracks)
+
+def trackPrediction(x, y, z):
+
+	# Least squares line through the hits of every event (planes, events), missing hits are NaN, evaluated at every plane
+
+	z = np.asarray(z, dtype = float).reshape(-1, 1)
+
+	weight = np.isfinite(x) & np.isfinite(y)
+
+	n 	= np.sum(weight, axis = 0)
+	sz 	= np.sum(weight*z, axis = 0)
+	szz = np.sum(weight*z**2, axis = 0)
+
+	determinant = n*szz - sz**2
+
+	predictions = []
+
+	for values in [x, y]:
+
+		values = np.where(weight, values, 0)
+
+		sv 	= np.sum(values, axis = 0)
+		szv = np.sum(values*z, axis = 0)
+
+		slope 		= np.divide(n*szv - sz*sv, determinant, out = np.full(len(n), np.nan), where = (n >= 2) & (determinant > 0))
+		intercept 	= (sv - slope*sz)/np.where(n > 0, n, np.nan)
+
+		predictions.append(intercept + slope*z)
+
+	return predictions
+
+def unbiasedTrackPrediction(x, y, z):
+
+	# Prediction at every plane from the line through the other planes, the residuals then carry the full misalignment
+
+	xPrediction, yPrediction = np.empty(np.shape(x)), np.empty(np.shape(y))
+
+	for plane in range(len(x)):
+
+		others = np.arange(len(x)) != plane
+
+		xLine, yLine = trackPrediction(x[others], y[others], np.asarray(z)[others])
+
+		slopeZ = (np.asarray(z)[plane] - np.asarray(z)[others][0])/(np.asarray(z)[others][-1] - np.asarray(z)[others][0])
+
+		xPrediction[plane] = xLine[0] + slopeZ*(xLine[-1] - xLine[0])
+		yPrediction[plane] = yLine[0] + slopeZ*(yLine[-1] - yLine[0])
+
+	return xPrediction, yPrediction
+
+# Classes
+
+class Alignment():
+
+	# Per-plane offset (cm) and rotation about z (rad): measured = R(rotation) true + offset
+
+	def __init__(self, offsets = None, rotations = None, planes = 3):
+
+		self.offsets 	= np.zeros((planes, 2)) if offsets is None else np.array(offsets, dtype = float)
+		self.rotations 	= np.zeros(planes) if rotations is None else np.array(rotations, dtype = float)
+
+		self.planes 	= len(self.rotations)
+		self.iterations = 0
+
+	def copy(self):
+
+		alignment = Alignment(self.offsets, self.rotations)
+
+		alignment.iterations = self.iterations
+
+		return alignment
+
+	@classmethod
+	def load(cls, filePath = ALIGNMENT_PATH):
+
+		data = np.load(filePath)
+
+		return cls(data['offsets'], data['rotations'])
+
+	def save(self, filePath = ALIGNMENT_PATH):
+		np.savez(filePath, offsets = self.offsets, rotations = self.rotations)
+
+	def apply(self, x, y):
+
+		# Measured hits (planes, events) to aligned hits, R(-rotation)(measured - offset)
+
+		cos = np.cos(self.rotations).reshape(-1, 1)
+		sin = np.sin(self.rotations).reshape(-1, 1)
+
+		u = x - self.offsets[:, 0].reshape(-1, 1)
+		v = y - self.offsets[:, 1].reshape(-1, 1)
+
+		return cos*u + sin*v, -sin*u + cos*v
+
+	def update(self, deltas):
+
+		# An extra correction R(-d)(aligned - do) composes to offset + R(rotation) do and rotation + d
+
+		cos, sin = np.cos(self.rotations), np.sin(self.rotations)
+
+		self.offsets[:, 0] += cos*deltas[:, 0] - sin*deltas[:, 1]
+		self.offsets[:, 1] += sin*deltas[:, 0] + cos*deltas[:, 1]
+
+		self.rotations += deltas[:, 2]
+
+	def normalEquations(self, chunks, z, reference, cut):
+
+		# One pass over the chunks: per plane sums of the linearized residual model r_x = dx - d y, r_y = dy + d x
+
+		normal 	= np.zeros((self.planes, 3, 3))
+		rhs 	= np.zeros((self.planes, 3))
+		used 	= np.zeros(self.planes, dtype = np.int64)
+
+		for x, y, xReference, yReference in chunks():
+
+			x, y = self.apply(np.asarray(x, dtype = float), np.asarray(y, dtype = float))
+
+			if(reference == 'muon'):
+				xPrediction, yPrediction = np.broadcast_arrays(np.asarray(xReference, dtype = float).reshape(self.planes, -1), np.asarray(yReference, dtype = float).reshape(self.planes, -1))
+
+			else:
+				xPrediction, yPrediction = unbiasedTrackPrediction(x, y, z)
+
+			xResidual, yResidual = x - xPrediction, y - yPrediction
+
+			with np.errstate(invalid = 'ignore'):
+				valid = np.isfinite(xResidual) & np.isfinite(yResidual) & (np.hypot(xResidual, yResidual) <= cut)
+
+			x, y, xResidual, yResidual = [np.where(valid, values, 0) for values in [x, y, xResidual, yResidual]]
+
+			count = np.sum(valid, axis = 1)
+
+			normal[:, 0, 0] += count
+			normal[:, 1, 1] += count
+			normal[:, 0, 2] -= np.sum(y, axis = 1)
+			normal[:, 1, 2] += np.sum(x, axis = 1)
+			normal[:, 2, 2] += np.sum(x**2 + y**2, axis = 1)
+
+			rhs[:, 0] += np.sum(xResidual, axis = 1)
+			rhs[:, 1] += np.sum(yResidual, axis = 1)
+			rhs[:, 2] += np.sum(x*yResidual - y*xResidual, axis = 1)
+
+			used += count
+
+		normal[:, 2, 0] = normal[:, 0, 2]
+		normal[:, 2, 1] = normal[:, 1, 2]
+
+		return normal, rhs, used
+
+	def fit(self, chunks, z, reference = 'muon', fixedPlanes = None, cut = ALIGNMENT_CUT, iterations = ALIGNMENT_ITERATIONS, tolerance = ALIGNMENT_TOLERANCE):
+
+		# chunks() yields (x, y, xReference, yReference) with hits (planes, events) and references per plane or per hit, once per pass
+		# With the 'track' reference a global shift, rotation or shear is invisible, so the first and last planes are fixed by default
+
+		if(reference not in ALIGNMENT_REFERENCES):
+			raise ValueError('Unknown alignment reference {}, use one of {}'.format(reference, ALIGNMENT_REFERENCES))
+
+		if(fixedPlanes is None):
+			fixedPlanes = [0, self.planes - 1] if reference == 'track' else []
+
+		free = np.ones(self.planes, dtype = bool)
+		free[list(fixedPlanes)] = False
+
+		for iteration in range(iterations):
+
+			normal, rhs, used = self.normalEquations(chunks, z, reference, cut)
+
+			# The pseudo-inverse leaves the rotation at zero when every hit of a plane sits at one point
+
+			deltas = np.array([np.linalg.pinv(normal[plane], rcond = 1E-12) @ rhs[plane] if free[plane] and used[plane] > 0 else np.zeros(3) for plane in range(self.planes)])
+
+			self.update(deltas)
+
+			self.iterations = iteration + 1
+			self.used 		= used
+
+			if(np.max(np.abs(deltas)) < tolerance):
+				break
+
+		return self
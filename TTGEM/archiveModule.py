@@ -0,0 +1,174 @@
+import os
+import json
+import zlib
+import numpy as np
+import pandas as pd
+
+#	Paths
+
+ELECTRONS_DATA_PATH 	= 'electronsData/'
+
+ELECTRONS_ARCHIVE_PATH 	= 'electronsArchive/'
+
+#	Format: magic, header length (uint64), JSON header, then one compressed block per column
+
+ARCHIVE_MAGIC 			= b'TTGEMZ1'
+
+ARCHIVE_EXTENSION 		= '.tgz1'
+
+ARCHIVE_LEVEL 			= 6
+
+# Columns that are constant in a run (the sweep parameters written on every line) become metadata
+
+METADATA_COLUMNS 		= ['Ar', 'E', 'V']
+
+# Integer columns that move by small steps (event number, electron counter) are stored as differences
+
+DELTA_COLUMNS 			= ['step', 'elecNum']
+
+#	Functions (Encoding)
+
+def smallestInteger(values):
+
+	for dtype in [np.int8, np.int16, np.int32, np.int64]:
+
+		if(len(values) == 0 or (values.min() >= np.iinfo(dtype).min and values.max() <= np.iinfo(dtype).max)):
+			return values.astype(dtype)
+
+def shuffleBytes(values):
+
+	# Byte k of every value goes together, the exponent and high mantissa bytes then compress well
+
+	return np.ascontiguousarray(values.view(np.uint8).reshape(-1, values.dtype.itemsize).T).tobytes()
+
+def unshuffleBytes(data, dtype, rows):
+
+	return np.ascontiguousarray(np.frombuffer(data, dtype = np.uint8).reshape(dtype.itemsize, rows).T).view(dtype).reshape(rows)
+
+def encodeColumn(column, values, floatDtype = np.float64, level = ARCHIVE_LEVEL):
+
+	values = np.asarray(values)
+
+	encoding = []
+
+	if(values.dtype.kind in 'iu'):
+
+		if(column in DELTA_COLUMNS and len(values) > 0):
+			values = np.diff(values.astype(np.int64), prepend = 0)
+			encoding.append('delta')
+
+		values = smallestInteger(values)
+
+	elif(values.dtype.kind == 'f'):
+		values = values.astype(floatDtype)
+
+	data = zlib.compress(shuffleBytes(values), level)
+
+	return {'name': column, 'dtype': values.dtype.str, 'encoding': encoding, 'rows': len(values)}, data
+
+def decodeColumn(entry, data):
+
+	values = unshuffleBytes(zlib.decompress(data), np.dtype(entry['dtype']), entry['rows'])
+
+	if('delta' in entry['encoding']):
+		values = np.cumsum(values, dtype = np.int64)
+
+	return values
+
+#	Functions (Archive)
+
+def archiveDataFrame(dataFrame, archivePath, floatDtype = np.float64, level = ARCHIVE_LEVEL):
+
+	metadata = {}
+
+	for column in METADATA_COLUMNS:
+
+		if(column in dataFrame.columns and dataFrame[column].nunique() <= 1):
+			metadata[column] = dataFrame[column].iloc[0].item() if len(dataFrame) > 0 else None
+
+	header 	= {'version': 1, 'metadata': metadata, 'columns': []}
+	blocks 	= []
+	offset 	= 0
+
+	for column in dataFrame.columns:
+
+		if(column in metadata):
+			continue
+
+		entry, data = encodeColumn(column, dataFrame[column].to_numpy(), floatDtype, level)
+
+		entry['offset'] = offset
+		entry['bytes'] 	= len(data)
+
+		header['columns'].append(entry)
+		blocks.append(data)
+
+		offset += len(data)
+
+	headerBytes = json.dumps(header).encode()
+
+	with open(archivePath, 'wb') as archiveFile:
+
+		archiveFile.write(ARCHIVE_MAGIC)
+		archiveFile.write(np.uint64(len(headerBytes)).tobytes())
+		archiveFile.write(headerBytes)
+
+		for data in blocks:
+			archiveFile.write(data)
+
+	return archivePath
+
+def archiveElectrons(csvPath, archivePath, floatDtype = np.float64, level = ARCHIVE_LEVEL):
+	return archiveDataFrame(pd.read_csv(csvPath), archivePath, floatDtype, level)
+
+def archiveElectronsDirectory(electronsDataPath = ELECTRONS_DATA_PATH, archiveDataPath = ELECTRONS_ARCHIVE_PATH, floatDtype = np.float64, level = ARCHIVE_LEVEL):
+
+	os.makedirs(archiveDataPath, exist_ok = True)
+
+	archived = []
+
+	for fileName in sorted(os.listdir(electronsDataPath)):
+
+		if(fileName.endswith('.csv')):
+			archived.append(archiveElectrons(electronsDataPath + fileName, archiveDataPath + fileName[:-4] + ARCHIVE_EXTENSION, floatDtype, level))
+
+	return archived
+
+def readArchiveHeader(archiveFile):
+
+	if(archiveFile.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC):
+		raise ValueError('{} is not an electron archive'.format(archiveFile.name))
+
+	headerLength = int(np.frombuffer(archiveFile.read(8), dtype = np.uint64)[0])
+
+	return json.loads(archiveFile.read(headerLength)), len(ARCHIVE_MAGIC) + 8 + headerLength
+
+def readArchive(archivePath, columns = None, withMetadata = False):
+
+	# Only the requested columns are decompressed, metadata columns are rebuilt on demand
+
+	with open(archivePath, 'rb') as archiveFile:
+
+		header, dataStart = readArchiveHeader(archiveFile)
+
+		arrays = {}
+
+		for entry in header['columns']:
+
+			if(columns is None or entry['name'] in columns):
+
+				archiveFile.seek(dataStart + entry['offset'])
+
+				arrays[entry['name']] = decodeColumn(entry, archiveFile.read(entry['bytes']))
+
+	rows = header['columns'][0]['rows'] if len(header['columns']) > 0 else 0
+
+	if(withMetadata):
+		for column, value in header['metadata'].items():
+			if(columns is None or column in columns):
+				arrays[column] = np.full(rows, value)
+
+	return arrays, header['metadata']
+
+def readElectronArchive(archivePath, columns = None, withMetadata = False):
+	return pd.DataFrame(readArchive(archivePath, columns, withMetadata)[0])
@@ -0,0 +1,242 @@
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from datasetModule import *
+from archiveModule import *
+from trackModule import reconstructEventsData, READOUT_Z_LIMIT
+from raggedModule import RaggedEvents
+from digitizationModule import StripReadout
+from pileupModule import PileupEmulator
+from centroidModule import estimateCentroid, CENTROID_ESTIMATORS
+
+#	Campaign loading: one CSV per file against the packed dataset
+
+RUNS 		= 1000
+
+SUBSET_RUNS = 100
+
+#	Electron archive (a synthetic run in the TGEM.hh format when electronsData is empty)
+
+ARCHIVE_EVENTS 			= 20
+
+ARCHIVE_EVENT_ELECTRONS = 25000
+
+#	Strip digitization (collected electrons per second, target 1E7)
+
+DIGITIZATION_ELECTRONS 	= 10000000
+
+DIGITIZATION_EVENT_ELECTRONS = 5000
+
+#	Pile-up emulation (overlaid events of three planes at a muon rate in MHz)
+
+PILEUP_EVENTS 			= 1000000
+
+PILEUP_POOL_EVENTS 		= 1000
+
+PILEUP_EVENT_ELECTRONS 	= 300
+
+PILEUP_RATE 			= 1.0
+
+#	Centroid estimators (clouds around the muon entry points of TTGEMData: gaussian core, exponential tail of lower energy electrons, cm and eV)
+
+CENTROID_EVENTS 		= 1000
+
+CENTROID_EVENT_ELECTRONS = 200
+
+CENTROID_CORE_STD 		= 0.01
+
+CENTROID_TAIL_FRACTION 	= 0.15
+
+CENTROID_TAIL_SCALE 	= 0.05
+
+def replicateCampaign(campaignPath, runs = RUNS):
+
+	# The committed runs are copied under new serials until the campaign has the wanted size
+
+	templates = csvSerials(TTGEM_DATA_PATH)
+
+	for kind in DATASET_TABLES:
+		os.makedirs(os.path.join(campaignPath, kind), exist_ok = True)
+
+	for run in range(runs):
+
+		template = templates[run % len(templates)]
+
+		TTGEMdataFrame = pd.read_csv(TTGEM_DATA_PATH + '{}.csv'.format(template))
+
+		names = run*10 + np.arange(1, len(TTGEMdataFrame) + 1)
+
+		for name, templateName in zip(names, TTGEMdataFrame['name']):
+			shutil.copyfile(EVENTS_DATA_PATH + '{}.csv'.format(templateName), os.path.join(campaignPath, 'eventsData', '{}.csv'.format(name)))
+
+		TTGEMdataFrame['name'] = names
+
+		TTGEMdataFrame.to_csv(os.path.join(campaignPath, 'TTGEMData', '{}.csv'.format(run + 1)), index = False)
+
+	return {kind: os.path.join(campaignPath, kind, '') for kind in DATASET_TABLES}
+
+def loadCsvRuns(tablePaths, serials):
+
+	runs = {}
+
+	for serial in serials:
+
+		TTGEMdataFrame = pd.read_csv(tablePaths['TTGEMData'] + '{}.csv'.format(serial))
+
+		runs[serial] = (TTGEMdataFrame, [pd.read_csv(tablePaths['eventsData'] + '{}.csv'.format(name)) for name in TTGEMdataFrame['name']])
+
+	return runs
+
+def syntheticElectrons(csvPath, events = ARCHIVE_EVENTS, electrons = ARCHIVE_EVENT_ELECTRONS):
+
+	# Same columns and 6 significant digits as the ofstream output of TGEM.hh
+
+	rng = np.random.default_rng()
+
+	counts 	= rng.poisson(electrons, events)
+	steps 	= np.repeat(np.arange(1, events + 1), counts)
+	rows 	= len(steps)
+
+	elecNum = np.repeat(counts + np.concatenate([[0], np.cumsum(counts)[:-1]]), counts) - np.arange(rows)
+
+	collected = rng.random(rows) < 0.35
+
+	pd.DataFrame({
+		'Ar': 70, 'E': 1000000000, 'V': 400, 'step': steps, 'elecNum': elecNum,
+		'x': rng.normal(0, 0.01, rows), 'y': rng.normal(0, 0.01, rows),
+		'z': np.where(collected, -0.603, rng.uniform(-0.6, 0.3, rows)),
+		't': rng.uniform(0, 200, rows), 'e': rng.exponential(3, rows)}).to_csv(csvPath, index = False, float_format = '%.6g')
+
+	return csvPath
+
+def timeIt(function, *args, **kwargs):
+
+	start = time.perf_counter()
+	function(*args, **kwargs)
+
+	return time.perf_counter() - start
+
+campaignPath = tempfile.mkdtemp()
+
+try:
+	tablePaths = replicateCampaign(campaignPath)
+
+	datasetPath = os.path.join(campaignPath, DATASET_PATH)
+
+	packSeconds = timeIt(packCampaign, datasetPath, tablePaths)
+
+	serials 		= csvSerials(tablePaths['TTGEMData'])
+	subsetSerials 	= list(np.random.default_rng().choice(serials, SUBSET_RUNS, replace = False))
+
+	print('Carga de {} corridas ({} archivos, empaquetado en {:.2f}s, {:.1f} MB)'.format(RUNS, 4*RUNS, packSeconds, os.path.getsize(datasetPath)/1E6))
+	print('corridas\tCSV(s)\t\tdataset(s)\taceleración')
+
+	for label, subset in [(RUNS, serials), (SUBSET_RUNS, subsetSerials)]:
+
+		csvSeconds 		= timeIt(loadCsvRuns, tablePaths, subset)
+		datasetSeconds 	= timeIt(lambda: CampaignDataset(datasetPath).getRuns(subset))
+
+		print('{}\t\t{:.3f}\t\t{:.3f}\t\t{:.1f}'.format(label, csvSeconds, datasetSeconds, csvSeconds/datasetSeconds))
+
+	#	Electron archive
+
+	electronFiles = [ELECTRONS_DATA_PATH + fileName for fileName in sorted(os.listdir(ELECTRONS_DATA_PATH)) if fileName.endswith('.csv')] if os.path.isdir(ELECTRONS_DATA_PATH) else []
+
+	csvPath = electronFiles[0] if len(electronFiles) > 0 else syntheticElectrons(os.path.join(campaignPath, 'electrons.csv'))
+
+	csvBytes = os.path.getsize(csvPath)
+
+	print('Archivo de electrones {} ({:.1f} MB)'.format(os.path.basename(csvPath), csvBytes/1E6))
+	print('formato		tamaño(MB)	compresión	lectura(MB/s CSV)	reconstrucción(s)')
+
+	csvSeconds 		= timeIt(pd.read_csv, csvPath)
+	csvEndToEnd 	= timeIt(lambda: reconstructEventsData(pd.read_csv(csvPath)))
+
+	print('CSV		{:.1f}		{:.2f}		{:.1f}			{:.3f}'.format(csvBytes/1E6, 1.0, csvBytes/1E6/csvSeconds, csvEndToEnd))
+
+	for label, floatDtype in [('float64', np.float64), ('float32', np.float32)]:
+
+		archivePath = os.path.join(campaignPath, 'electrons' + label + ARCHIVE_EXTENSION)
+
+		archiveElectrons(csvPath, archivePath, floatDtype)
+
+		archiveBytes 	= os.path.getsize(archivePath)
+		archiveSeconds 	= timeIt(readArchive, archivePath)
+		archiveEndToEnd = timeIt(lambda: reconstructEventsData(readElectronArchive(archivePath)))
+
+		print('{}		{:.1f}		{:.2f}		{:.1f}			{:.3f}'.format(label, archiveBytes/1E6, csvBytes/archiveBytes, csvBytes/1E6/archiveSeconds, archiveEndToEnd))
+
+	#	Strip digitization
+
+	rng = np.random.default_rng()
+
+	counts 	= rng.poisson(DIGITIZATION_EVENT_ELECTRONS, DIGITIZATION_ELECTRONS//DIGITIZATION_EVENT_ELECTRONS)
+	rows 	= np.sum(counts)
+
+	events = RaggedEvents(np.arange(1, len(counts) + 1), np.concatenate([[0], np.cumsum(counts)]), {
+		'x': np.repeat(rng.uniform(-4, 4, len(counts)), counts) + rng.normal(0, 0.02, rows),
+		'y': np.repeat(rng.uniform(-4, 4, len(counts)), counts) + rng.normal(0, 0.02, rows)})
+
+	digitizationSeconds = timeIt(StripReadout().digitize, events)
+
+	print('Digitalización de {} electrones en {} eventos: {:.3f}s, {:.1f} M electrones/s'.format(rows, len(counts), digitizationSeconds, rows/digitizationSeconds/1E6))
+
+	#	Pile-up emulation
+
+	counts 	= rng.poisson(PILEUP_EVENT_ELECTRONS, PILEUP_POOL_EVENTS)
+	rows 	= np.sum(counts)
+
+	pool = [RaggedEvents(np.arange(1, len(counts) + 1), np.concatenate([[0], np.cumsum(counts)]), {
+		'x': rng.normal(0, 0.01, rows),
+		'y': rng.normal(0, 0.01, rows),
+		'z': np.where(rng.random(rows) < 0.5, 2*READOUT_Z_LIMIT, 0.0),
+		't': rng.normal(60, 5, rows)}) for plane in range(3)]
+
+	emulator = PileupEmulator(pool, PILEUP_RATE, seed = 0)
+
+	# Overlaid electrons of every plane, ready for reconstructEvents
+
+	start = time.perf_counter()
+
+	overlaid = sum(len(events['t']) for planeEvents, triggers in emulator.chunks(PILEUP_EVENTS) for events in planeEvents)
+
+	pileupSeconds = time.perf_counter() - start
+
+	print('Pile-up de {} eventos a {} MHz ({:.2f} muones extra por evento): {:.3f}s, {:.2f} M eventos/s, {:.1f} M electrones/s'.format(PILEUP_EVENTS, PILEUP_RATE, emulator.getMeanPileup(), pileupSeconds, PILEUP_EVENTS/pileupSeconds/1E6, overlaid/pileupSeconds/1E6))
+
+	#	Centroid estimators
+
+	muons = pd.concat([pd.read_csv(TTGEM_DATA_PATH + '{}.csv'.format(serial)) for serial in csvSerials(TTGEM_DATA_PATH)], ignore_index = True)
+
+	planes 	= rng.integers(len(muons), size = CENTROID_EVENTS)
+	counts 	= rng.poisson(CENTROID_EVENT_ELECTRONS, CENTROID_EVENTS)
+	rows 	= np.sum(counts)
+
+	xMuon, yMuon = np.array(muons['x'])[planes], np.array(muons['y'])[planes]
+
+	tail 	= rng.random(rows) < CENTROID_TAIL_FRACTION
+	radius 	= rng.exponential(CENTROID_TAIL_SCALE, rows)
+	angle 	= rng.uniform(0, 2*np.pi, rows)
+
+	events = RaggedEvents(np.arange(1, CENTROID_EVENTS + 1), np.concatenate([[0], np.cumsum(counts)]), {
+		'x': np.repeat(xMuon, counts) + rng.normal(0, CENTROID_CORE_STD, rows) + np.where(tail, radius*np.cos(angle), 0),
+		'y': np.repeat(yMuon, counts) + rng.normal(0, CENTROID_CORE_STD, rows) + np.where(tail, radius*np.sin(angle), 0),
+		'e': np.where(tail, rng.exponential(0.5, rows), rng.exponential(2.0, rows))})
+
+	print('Estimador	Tiempo(s)	M electrones/s	Sesgo x(cm)	Resolución x(cm)	Resolución y(cm)')
+
+	for estimator in CENTROID_ESTIMATORS:
+
+		start = time.perf_counter()
+
+		x, y = [estimateCentroid(events, axis, estimator) for axis in ['x', 'y']]
+
+		estimatorSeconds = time.perf_counter() - start
+
+		print('{}		{:.3f}		{:.1f}		{:.5f}		{:.5f}			{:.5f}'.format(estimator, estimatorSeconds, 2*rows/estimatorSeconds/1E6, np.nanmean(x - xMuon), np.nanstd(x - xMuon, ddof = 1), np.nanstd(y - yMuon, ddof = 1)))
+
+finally:
+	shutil.rmtree(campaignPath)
@@ -0,0 +1,159 @@
+import numpy as np
+
+#	Binned statistics
+
+MAP_BINS = 20
+
+#	Functions (Moments)
+
+def mergeMoments(countA, meanA, m2A, countB, meanB, m2B):
+
+	# Chan et al. pairwise update of (count, mean, sum of squared deviations), elementwise on arrays
+
+	count = countA + countB
+	delta = meanB - meanA
+
+	weight = np.divide(countB, count, out = np.zeros(np.shape(count)), where = count > 0)
+
+	return count, meanA + delta*weight, m2A + m2B + delta**2*countA*weight
+
+def groupMoments(index, values, groups):
+
+	# Two passes of bincount: counts and means, then squared deviations from the group mean
+
+	count = np.bincount(index, minlength = groups)
+	mean  = np.divide(np.bincount(index, values, minlength = groups), count, out = np.zeros(groups), where = count > 0)
+
+	return count, mean, np.bincount(index, (values - mean[index])**2, minlength = groups)
+
+def binEdges(values, bins = MAP_BINS):
+
+	# Explicit edges are kept, a number of bins spans the finite values
+
+	if(np.ndim(bins) > 0):
+		return np.asarray(bins, dtype = float)
+
+	values = np.asarray(values, dtype = float)
+	values = values[np.isfinite(values)]
+
+	low, high = (values.min(), values.max()) if len(values) > 0 else (0.0, 0.0)
+
+	if(low == high):
+		low, high = low - 0.5, high + 0.5
+
+	return np.linspace(low, high, bins + 1)
+
+# Classes
+
+class BinnedStatistics():
+
+	# Count, mean and sum of squared deviations of several quantities per (plane, x bin, y bin), mergeable
+
+	def __init__(self, xEdges, yEdges, planes, quantities):
+
+		self.xEdges 	= np.asarray(xEdges, dtype = float)
+		self.yEdges 	= np.asarray(yEdges, dtype = float)
+		self.planes 	= planes
+		self.quantities = list(quantities)
+
+		shape = (len(self.quantities), planes, len(self.xEdges) - 1, len(self.yEdges) - 1)
+
+		self.count 	= np.zeros(shape, dtype = np.int64)
+		self.mean 	= np.zeros(shape)
+		self.m2 	= np.zeros(shape)
+
+	def binIndex(self, edges, values):
+
+		# The last edge belongs to the last bin as in np.histogram
+
+		index = np.searchsorted(edges, values, side = 'right') - 1
+
+		index[values == edges[-1]] = len(edges) - 2
+
+		return index, (index >= 0) & (index < len(edges) - 1)
+
+	def fill(self, plane, x, y, values):
+
+		# plane, x, y have one entry per row, values maps every quantity to its rows, NaN rows are skipped
+
+		plane 	= np.asarray(plane, dtype = np.int64)
+		x, y 	= np.asarray(x, dtype = float), np.asarray(y, dtype = float)
+
+		xIndex, xInside = self.binIndex(self.xEdges, x)
+		yIndex, yInside = self.binIndex(self.yEdges, y)
+
+		groups = self.count[0].size
+
+		flatIndex = (plane*(len(self.xEdges) - 1) + xIndex)*(len(self.yEdges) - 1) + yIndex
+
+		for i, quantity in enumerate(self.quantities):
+
+			quantityValues = np.asarray(values[quantity], dtype = float)
+
+			valid = xInside & yInside & np.isfinite(quantityValues)
+
+			moments = groupMoments(flatIndex[valid], quantityValues[valid], groups)
+
+			self.count[i], self.mean[i], self.m2[i] = [moment.reshape(self.count[i].shape) for moment in mergeMoments(self.count[i].ravel(), self.mean[i].ravel(), self.m2[i].ravel(), *moments)]
+
+		return self
+
+	def isCompatible(self, other):
+		return self.planes == other.planes and self.quantities == other.quantities and np.array_equal(self.xEdges, other.xEdges) and np.array_equal(self.yEdges, other.yEdges)
+
+	def merge(self, other):
+
+		if(not self.isCompatible(other)):
+			raise ValueError('Binned statistics with different planes, quantities or edges cannot be merged')
+
+		self.count, self.mean, self.m2 = mergeMoments(self.count, self.mean, self.m2, other.count, other.mean, other.m2)
+
+		return self
+
+	def copy(self):
+
+		statistics = BinnedStatistics(self.xEdges, self.yEdges, self.planes, self.quantities)
+
+		statistics.count, statistics.mean, statistics.m2 = self.count.copy(), self.mean.copy(), self.m2.copy()
+
+		return statistics
+
+	def getCount(self, quantity):
+		return self.count[self.quantities.index(quantity)]
+
+	def getMean(self, quantity):
+
+		i = self.quantities.index(quantity)
+
+		return np.where(self.count[i] > 0, self.mean[i], np.nan)
+
+	def getStd(self, quantity):
+
+		i = self.quantities.index(quantity)
+
+		return np.sqrt(np.divide(self.m2[i], self.count[i] - 1, out = np.full(self.count[i].shape, np.nan), where = self.count[i] > 1))
+
+	def getError(self, quantity):
+		return self.getStd(quantity)/np.sqrt(self.getCount(quantity))
+
+	def getStatistic(self, quantity, statistic = 'mean'):
+
+		getters = {'mean': self.getMean, 'std': self.getStd, 'error': self.getError, 'count': self.getCount}
+
+		if(statistic not in getters):
+			raise ValueError('Unknown statistic {}, use one of {}'.format(statistic, list(getters)))
+
+		return getters[statistic](quantity)
+
+	def plot(self, axes, quantity, statistic = 'mean', **kwargs):
+
+		# One heatmap per plane on axes, same color scale for every plane
+
+		values = np.asarray(self.getStatistic(quantity, statistic), dtype = float)
+
+		finite = values[np.isfinite(values)]
+
+		kwargs.setdefault('vmin', finite.min() if len(finite) > 0 else None)
+		kwargs.setdefault('vmax', finite.max() if len(finite) > 0 else None)
+
+		return [ax.pcolormesh(self.xEdges, self.yEdges, np.ma.masked_invalid(values[plane]).T, **kwargs) for plane, ax in enumerate(axes)]
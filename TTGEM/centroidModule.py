@@ -0,0 +1,93 @@
+import math
+import numpy as np
+
+from raggedModule import RaggedEvents
+
+#	Centroid estimators (position of the collected electron cloud of every event)
+
+# Fraction of the electrons dropped at each end of every event by the truncated mean
+
+TRUNCATION_FRACTION 		= 0.1
+
+# Half width (in sigmas) of the window of the gaussian core and its iterations from the median and the MAD
+
+GAUSSIAN_CORE_SIGMAS 		= 2.0
+
+GAUSSIAN_CORE_ITERATIONS 	= 5
+
+# MAD of a normal distribution times this is its sigma
+
+MAD_SCALE 					= 1.482602218505602
+
+#	Functions (Estimators)
+
+def meanCentroid(events, column):
+	return events.mean(column)
+
+def medianCentroid(events, column):
+	return events.median(column)
+
+def truncatedCentroid(events, column, fraction = TRUNCATION_FRACTION):
+
+	# Mean of the values left after dropping the fraction of lowest and highest of every event, ranks from one sort by (event, value)
+
+	counts = events.getCounts()
+
+	order = np.lexsort((events[column], events.getEventIndex()))
+
+	rank = np.arange(len(order)) - events.expand(events.offsets[:-1])
+	drop = events.expand(np.floor(fraction*counts).astype(np.int64))
+
+	sortedEvents = RaggedEvents(events.ids, events.offsets, {column: events[column][order]})
+
+	return sortedEvents.filter((rank >= drop) & (rank < events.expand(counts) - drop)).mean(column)
+
+def weightedCentroid(events, column, weights = 'e'):
+
+	# Mean weighted by the electron energy, NaN for events without energy
+
+	weighted = RaggedEvents(events.ids, events.offsets, {'value': events[column]*events[weights], 'weight': events[weights]})
+
+	weightSum = weighted.sum('weight')
+
+	return np.divide(weighted.sum('value'), weightSum, out = np.full(len(events), np.nan), where = weightSum > 0)
+
+def truncatedGaussianStd(sigmas):
+
+	# Std of a unit normal restricted to |x| <= sigmas
+
+	density = math.exp(-sigmas**2/2)/math.sqrt(2*math.pi)
+
+	return math.sqrt(1 - 2*sigmas*density/math.erf(sigmas/math.sqrt(2)))
+
+def gaussianCentroid(events, column, sigmas = GAUSSIAN_CORE_SIGMAS, iterations = GAUSSIAN_CORE_ITERATIONS):
+
+	# Mean of a gaussian fitted to the core: moments of the values within sigmas of the center, the width corrected for the cut
+	# Starts from the median and the MAD so the tails never pull the first window, every event is iterated at once
+
+	values = events[column]
+
+	center = events.median(column)
+	width  = MAD_SCALE*RaggedEvents(events.ids, events.offsets, {'deviation': np.abs(values - events.expand(center))}).median('deviation')
+
+	correction = truncatedGaussianStd(sigmas)
+
+	for iteration in range(iterations):
+
+		core = events.filter(np.abs(values - events.expand(center)) <= sigmas*events.expand(width))
+
+		coreCounts = core.getCounts()
+
+		center = np.where(coreCounts > 0, core.mean(column), center)
+		width  = np.where(coreCounts > 1, core.std(column)/correction, width)
+
+	return center
+
+CENTROID_ESTIMATORS = {'mean': meanCentroid, 'median': medianCentroid, 'truncated': truncatedCentroid, 'weighted': weightedCentroid, 'gaussian': gaussianCentroid}
+
+def estimateCentroid(events, column, estimator = 'mean'):
+
+	if(estimator not in CENTROID_ESTIMATORS):
+		raise ValueError('Unknown centroid estimator {}, use one of {}'.format(estimator, list(CENTROID_ESTIMATORS)))
+
+	return CENTROID_ESTIMATORS[estimator](events, column)
@@ -0,0 +1,121 @@
+import numpy as np
+
+#	Coincidences
+
+# Query kinds, planes are 0-based plane indices:
+#	('and', planes) 				every plane passed
+#	('or', planes) 					at least one plane passed
+#	('majority', planes) 			more than half of the planes passed
+#	('atLeast', k, planes) 			k or more planes passed
+#	('pattern', passed, failed) 	the planes in passed did and the ones in failed did not, the rest do not matter
+
+QUERY_KINDS = ['and', 'or', 'majority', 'atLeast', 'pattern']
+
+#	Functions (Bits)
+
+def planeMask(planes):
+	return int(np.sum(np.left_shift(1, np.asarray(planes, dtype = np.int64)))) if len(planes) > 0 else 0
+
+def popcount(values):
+
+	# SWAR bit count of every 64 bit value
+
+	values = np.asarray(values).astype(np.uint64)
+
+	values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+	values = (values & np.uint64(0x3333333333333333)) + ((values >> np.uint64(2)) & np.uint64(0x3333333333333333))
+	values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+
+	return ((values*np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+def packFlags(flags):
+
+	# (planes, events) booleans to one integer per event, bit p set when plane p passed
+
+	flags = np.asarray(flags, dtype = bool)
+
+	dtype = np.min_scalar_type((1 << len(flags)) - 1)
+
+	return np.sum(flags.astype(dtype) << np.arange(len(flags), dtype = dtype).reshape(-1, 1), axis = 0, dtype = dtype)
+
+def queryTable(query, planes):
+
+	# Which of the 2^planes patterns satisfy the query
+
+	patterns = np.arange(1 << planes)
+
+	kind = query[0]
+
+	if(kind == 'and'):
+		mask = planeMask(query[1])
+		return (patterns & mask) == mask
+
+	if(kind == 'or'):
+		return (patterns & planeMask(query[1])) != 0
+
+	if(kind == 'majority'):
+		return 2*popcount(patterns & planeMask(query[1])) > len(query[1])
+
+	if(kind == 'atLeast'):
+		return popcount(patterns & planeMask(query[2])) >= query[1]
+
+	if(kind == 'pattern'):
+		passed, failed = planeMask(query[1]), planeMask(query[2])
+		return (patterns & (passed | failed)) == passed
+
+	raise ValueError('Unknown coincidence query {}, use one of {}'.format(kind, QUERY_KINDS))
+
+def chainQueries(planes):
+
+	# Planes 1, 1-2, 1-2-3... passed together, the stacked efficiency
+
+	return [('and', tuple(range(plane + 1))) for plane in range(planes)]
+
+def independentQueries(planes):
+	return [('and', (plane,)) for plane in range(planes)]
+
+# Classes
+
+class CoincidenceCounts():
+
+	# Frequencies of the 2^planes pass/fail patterns, every query is answered from them without going back to the events
+
+	def __init__(self, planes, counts):
+
+		self.planes = planes
+		self.counts = np.asarray(counts, dtype = np.int64)
+
+	@classmethod
+	def fromFlags(cls, flags):
+
+		flags = np.asarray(flags, dtype = bool)
+
+		return cls(len(flags), np.bincount(packFlags(flags), minlength = 1 << len(flags)))
+
+	def getEvents(self):
+		return int(np.sum(self.counts))
+
+	def __add__(self, other):
+
+		if(self.planes != other.planes):
+			raise ValueError('Coincidences of {} and {} planes cannot be merged'.format(self.planes, other.planes))
+
+		return CoincidenceCounts(self.planes, self.counts + other.counts)
+
+	def copy(self):
+		return CoincidenceCounts(self.planes, self.counts.copy())
+
+	def count(self, query):
+		return int(np.sum(self.counts[queryTable(query, self.planes)]))
+
+	def fraction(self, query):
+
+		events = self.getEvents()
+
+		return self.count(query)/events if events > 0 else np.nan
+
+	def fractions(self, queries):
+		return np.array([self.fraction(query) for query in queries])
+
+	def getPatternFractions(self):
+		return self.counts/self.getEvents()
@@ -0,0 +1,247 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from trackModule import ELECTRONS_DATA_PATH, AVALANCHES_DATA_PATH, EVENTS_DATA_PATH, TTGEM_DATA_PATH
+
+#	Paths
+
+DATASET_PATH 		= 'campaign.ttgem'
+
+#	Format: magic, header length (uint64), JSON header, then one aligned buffer per column
+
+DATASET_MAGIC 		= b'TTGEMPK1'
+
+DATASET_ALIGNMENT 	= 64
+
+# Every table is partitioned by serial: TTGEMData by TTGEM serial, the others by TGEM serial (the name column of TTGEMData)
+
+DATASET_TABLES 		= {'TTGEMData': TTGEM_DATA_PATH, 'eventsData': EVENTS_DATA_PATH, 'electronsData': ELECTRONS_DATA_PATH, 'avalanchesData': AVALANCHES_DATA_PATH}
+
+#	Functions (Packing)
+
+def csvSerials(dataPath):
+
+	try:
+		fileNames = os.listdir(dataPath)
+
+	except OSError:
+		return []
+
+	return sorted(int(fileName[:-4]) for fileName in fileNames if fileName.endswith('.csv') and fileName[:-4].isdigit())
+
+def alignedOffset(offset):
+	return -(-offset//DATASET_ALIGNMENT)*DATASET_ALIGNMENT
+
+def packTable(dataPath, serials):
+
+	# Rows of every serial one after the other, columns missing in some files are filled with NaN
+
+	frames = [pd.read_csv(dataPath + '{}.csv'.format(serial)) for serial in serials]
+	frames = [frame.loc[:, ~frame.columns.str.startswith('Unnamed')] for frame in frames]
+
+	if(len(frames) == 0):
+		return {}, {}
+
+	table = pd.concat(frames, ignore_index = True)
+
+	counts = np.array([len(frame) for frame in frames])
+	starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+	partitions = {str(serial): [int(start), int(count)] for serial, start, count in zip(serials, starts, counts)}
+
+	columns = {}
+
+	for column in table.columns:
+
+		values = table[column].to_numpy()
+
+		if(values.dtype == np.dtype('O')):
+			values = values.astype(str)
+
+		columns[column] = np.ascontiguousarray(values)
+
+	return columns, partitions
+
+def packCampaign(datasetPath = DATASET_PATH, tablePaths = DATASET_TABLES, TTGEMSerials = None):
+
+	# Consolidates a campaign (all of it or the TTGEM runs in TTGEMSerials) into one file
+
+	if(TTGEMSerials is None):
+		TTGEMSerials = csvSerials(tablePaths['TTGEMData'])
+
+	TTGEMSerials = sorted(int(serial) for serial in TTGEMSerials)
+
+	TTGEMColumns, TTGEMPartitions = packTable(tablePaths['TTGEMData'], TTGEMSerials)
+
+	planes = {}
+
+	for serial, (start, count) in TTGEMPartitions.items():
+		planes[serial] = [int(name) for name in TTGEMColumns['name'][start: start + count]]
+
+	TGEMSerials = sorted(set(name for names in planes.values() for name in names))
+
+	tables = {'TTGEMData': (TTGEMColumns, TTGEMPartitions)}
+
+	for kind, dataPath in tablePaths.items():
+
+		if(kind != 'TTGEMData'):
+			available = set(csvSerials(dataPath))
+			tables[kind] = packTable(dataPath, [serial for serial in TGEMSerials if serial in available])
+
+	header 	= {'version': 1, 'planes': planes, 'tables': {}}
+	offset 	= 0
+
+	for kind, (columns, partitions) in tables.items():
+
+		header['tables'][kind] = {'partitions': partitions, 'columns': []}
+
+		for column, values in columns.items():
+
+			header['tables'][kind]['columns'].append({'name': column, 'dtype': values.dtype.str, 'offset': offset, 'rows': len(values)})
+
+			offset = alignedOffset(offset + values.nbytes)
+
+	headerBytes = json.dumps(header).encode()
+
+	dataStart = alignedOffset(len(DATASET_MAGIC) + 8 + len(headerBytes))
+
+	with open(datasetPath, 'wb') as datasetFile:
+
+		datasetFile.write(DATASET_MAGIC)
+		datasetFile.write(np.uint64(len(headerBytes)).tobytes())
+		datasetFile.write(headerBytes)
+
+		for kind, (columns, partitions) in tables.items():
+			for column, values in columns.items():
+
+				datasetFile.seek(dataStart + next(entry['offset'] for entry in header['tables'][kind]['columns'] if entry['name'] == column))
+				datasetFile.write(values.tobytes())
+
+		datasetFile.truncate(dataStart + offset)
+
+	return datasetPath
+
+# Classes
+
+class CampaignDataset():
+
+	# One open and a memory map, every partition is a contiguous slice of each column
+
+	def __init__(self, datasetPath = DATASET_PATH):
+
+		self.datasetPath = datasetPath
+
+		with open(datasetPath, 'rb') as datasetFile:
+
+			if(datasetFile.read(len(DATASET_MAGIC)) != DATASET_MAGIC):
+				raise ValueError('{} is not a packed campaign'.format(datasetPath))
+
+			headerLength = int(np.frombuffer(datasetFile.read(8), dtype = np.uint64)[0])
+
+			self.header = json.loads(datasetFile.read(headerLength))
+
+		self.dataStart 	= alignedOffset(len(DATASET_MAGIC) + 8 + headerLength)
+		self.buffer 	= np.memmap(datasetPath, dtype = np.uint8, mode = 'r')
+
+		self.planes = {int(serial): names for serial, names in self.header['planes'].items()}
+
+	def getSerials(self, kind = 'TTGEMData'):
+		return sorted(int(serial) for serial in self.header['tables'][kind]['partitions'])
+
+	def getColumn(self, kind, column, start = 0, count = None):
+
+		entry = next(entry for entry in self.header['tables'][kind]['columns'] if entry['name'] == column)
+
+		dtype = np.dtype(entry['dtype'])
+		count = entry['rows'] - start if count is None else count
+
+		begin = self.dataStart + entry['offset'] + start*dtype.itemsize
+
+		return self.buffer[begin: begin + count*dtype.itemsize].view(dtype)
+
+	def getPartition(self, kind, serial):
+
+		partitions = self.header['tables'][kind]['partitions']
+
+		if(str(serial) not in partitions):
+			raise KeyError('Serial {} is not in the {} table of {}'.format(serial, kind, self.datasetPath))
+
+		start, count = partitions[str(serial)]
+
+		return pd.DataFrame({entry['name']: np.array(self.getColumn(kind, entry['name'], start, count)) for entry in self.header['tables'][kind]['columns']})
+
+	def getTable(self, kind, serials = None):
+
+		# Several partitions at once, neighbouring serials are merged into a single contiguous read
+
+		partitions = self.header['tables'][kind]['partitions']
+
+		serials = self.getSerials(kind) if serials is None else sorted(int(serial) for serial in serials)
+
+		missing = [serial for serial in serials if str(serial) not in partitions]
+
+		if(len(missing) > 0):
+			raise KeyError('Serials {} are not in the {} table of {}'.format(missing, kind, self.datasetPath))
+
+		if(len(serials) == 0):
+			return self.emptyTable(kind)
+
+		ranges = np.array([partitions[str(serial)] for serial in serials], dtype = np.int64).reshape(-1, 2)
+
+		order 	= np.argsort(ranges[:, 0])
+		ranges 	= ranges[order]
+		serials = np.array(serials)[order]
+
+		breaks = np.flatnonzero(ranges[1:, 0] != ranges[:-1, 0] + ranges[:-1, 1]) + 1
+		blocks = np.split(np.arange(len(ranges)), breaks)
+
+		columns = {}
+
+		for entry in self.header['tables'][kind]['columns']:
+			columns[entry['name']] = np.concatenate([self.getColumn(kind, entry['name'], ranges[block[0], 0], np.sum(ranges[block, 1])) for block in blocks])
+
+		columns['serial'] = np.repeat(serials, ranges[:, 1])
+
+		return pd.DataFrame(columns)
+
+	def emptyTable(self, kind):
+
+		# No rows but the columns and dtypes of the table, so callers can still select and group
+
+		columns = {entry['name']: np.array([], dtype = np.dtype(entry['dtype'])) for entry in self.header['tables'][kind]['columns']}
+
+		columns['serial'] = np.array([], dtype = np.int64)
+
+		return pd.DataFrame(columns)
+
+	def getTTGEMData(self, serial):
+		return self.getPartition('TTGEMData', serial)
+
+	def getEventsData(self, name):
+		return self.getPartition('eventsData', name)
+
+	def getElectronsData(self, name):
+		return self.getPartition('electronsData', name)
+
+	def getAvalanchesData(self, name):
+		return self.getPartition('avalanchesData', name)
+
+	def getRuns(self, serials = None):
+
+		# TTGEMData and the eventsData of the planes of every run, read as two tables
+		# A plane packed without eventsData (only electronsData, or not simulated yet) gets an empty frame
+
+		serials = self.getSerials() if serials is None else serials
+
+		available = self.header['tables']['eventsData']['partitions']
+
+		TTGEMData 	= self.getTable('TTGEMData', serials)
+		eventsData 	= self.getTable('eventsData', [name for serial in serials for name in self.planes[int(serial)] if str(name) in available])
+
+		eventsBySerial = dict(tuple(eventsData.groupby('serial')))
+
+		empty = self.emptyTable('eventsData')
+
+		return {int(serial): (TTGEMData[TTGEMData['serial'] == int(serial)], [eventsBySerial.get(name, empty) for name in self.planes[int(serial)]]) for serial in serials}
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+from raggedModule import RaggedEvents, concatenateEvents
+
+#	Readout (strip pitch in cm, noise and threshold in electrons)
+
+STRIP_PITCH 			= 0.04
+
+STRIP_RANGE 			= (-5.0, 5.0)
+
+STRIP_NOISE 			= 20.0
+
+STRIP_THRESHOLD_SIGMAS 	= 5.0
+
+# Events digitized together, the dense (events, strips) charge matrix is bounded by this
+
+DIGITIZATION_CHUNK_EVENTS = 4096
+
+STRIP_AXES 				= ['x', 'y']
+
+#	Functions (Clustering)
+
+def findClusters(charges, stripCenters, ids):
+
+	# Contiguous strips with charge in every row of charges (events, strips), zero below threshold
+	# A zero column closes every row, so the runs found by diff on the flattened grid never cross events
+
+	events, strips = charges.shape
+
+	padded = np.zeros((events, strips + 1))
+	padded[:, :strips] = charges
+
+	flatCharges = padded.ravel()
+
+	edges = np.diff((flatCharges > 0).astype(np.int8), prepend = 0)
+
+	starts 	= np.flatnonzero(edges == 1)
+	ends 	= np.flatnonzero(edges == -1)
+
+	# A reduceat segment runs until the next cluster start, the strips in between hold no charge
+
+	if(len(starts) > 0):
+		charge 	 = np.add.reduceat(flatCharges, starts)
+		centroid = np.add.reduceat(flatCharges*np.tile(np.append(stripCenters, 0), events), starts)/charge
+	else:
+		charge, centroid = np.zeros(0), np.zeros(0)
+
+	event = starts//(strips + 1)
+
+	offsets = np.concatenate([[0], np.cumsum(np.bincount(event, minlength = events))])
+
+	return RaggedEvents(ids, offsets, {'firstStrip': starts % (strips + 1), 'size': ends - starts, 'charge': charge, 'centroid': centroid})
+
+# Classes
+
+class StripReadout():
+
+	# Orthogonal x and y strip planes: every collected electron adds one unit of charge to the strip under it
+
+	def __init__(self, pitch = STRIP_PITCH, xRange = STRIP_RANGE, yRange = STRIP_RANGE, noise = STRIP_NOISE, thresholdSigmas = STRIP_THRESHOLD_SIGMAS, seed = None):
+
+		self.pitch 		= pitch
+		self.ranges 	= {'x': xRange, 'y': yRange}
+		self.noise 		= noise
+		self.threshold 	= thresholdSigmas*noise
+		self.rng 		= np.random.default_rng(seed)
+
+		self.strips 	= {axis: int(np.ceil((self.ranges[axis][1] - self.ranges[axis][0])/pitch)) for axis in STRIP_AXES}
+
+	def getStripCenters(self, axis):
+		return self.ranges[axis][0] + (np.arange(self.strips[axis]) + 0.5)*self.pitch
+
+	def stripCharges(self, events, axis):
+
+		# (events, strips) charge of a chunk, one bincount over the flattened (event, strip) index plus gaussian noise on every strip
+
+		strips = self.strips[axis]
+
+		strip = np.floor((events[axis] - self.ranges[axis][0])/self.pitch).astype(np.int64)
+
+		inside = (strip >= 0) & (strip < strips)
+
+		flatIndex = events.getEventIndex()[inside]*strips + strip[inside]
+
+		charges = np.bincount(flatIndex, minlength = len(events)*strips).reshape(len(events), strips).astype(float)
+
+		if(self.noise > 0):
+			charges += self.rng.normal(0, self.noise, charges.shape)
+
+		return charges
+
+	def getClusters(self, events, axis, chunkEvents = DIGITIZATION_CHUNK_EVENTS):
+
+		# Clusters (first strip, size, charge, centroid) of every event as a RaggedEvents with the event ids
+
+		chunks = [events[start: start + chunkEvents] for start in range(0, max(len(events), 1), chunkEvents)]
+
+		return concatenateEvents([findClusters(self.thresholdCharges(chunk, axis), self.getStripCenters(axis), chunk.ids) for chunk in chunks])
+
+	def thresholdCharges(self, events, axis):
+
+		charges = self.stripCharges(events, axis)
+
+		return np.where(charges > self.threshold, charges, 0)
+
+	def digitize(self, events, chunkEvents = DIGITIZATION_CHUNK_EVENTS):
+
+		# events is a RaggedEvents of collected electrons with x and y, one row per event with the eventsData style columns
+		# The hit is the centroid of the cluster with the most charge, isolated noise strips make clusters of their own
+
+		columns = {'event': events.ids, 'collected': events.getCounts()}
+
+		for axis in STRIP_AXES:
+
+			clusters = self.getClusters(events, axis, chunkEvents)
+
+			leading = clusters.argmax('charge')
+
+			columns[axis + 'Strips'] 	= clusters.sum('size')
+			columns[axis + 'Clusters'] 	= clusters.getCounts()
+			columns[axis + 'Charge'] 	= clusters.sum('charge')
+			columns[axis] 				= np.full(len(events), np.nan)
+
+			columns[axis][leading >= 0] = clusters['centroid'][leading[leading >= 0]]
+
+		return pd.DataFrame(columns)
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+#	Defaults
+
+OCCUPANCY_BINS 			= 40
+
+OCCUPANCY_CHUNK_SIZE 	= 1000000
+
+# Classes
+
+class Occupancy2D():
+
+	# Fixed-bin (x, y) histogram filled chunk by chunk, two accumulators with the same binning add up exactly
+
+	def __init__(self, xRange, yRange, bins = OCCUPANCY_BINS, counts = None):
+
+		self.xRange = (float(xRange[0]), float(xRange[1]))
+		self.yRange = (float(yRange[0]), float(yRange[1]))
+
+		self.bins 	= (bins, bins) if np.ndim(bins) == 0 else (int(bins[0]), int(bins[1]))
+
+		self.counts  = np.zeros(self.bins, dtype = np.int64) if counts is None else np.array(counts).reshape(self.bins)
+
+		self.entries = int(np.sum(self.counts))
+		self.outside = 0
+
+	@property
+	def xEdges(self):
+		return np.linspace(self.xRange[0], self.xRange[1], self.bins[0] + 1)
+
+	@property
+	def yEdges(self):
+		return np.linspace(self.yRange[0], self.yRange[1], self.bins[1] + 1)
+
+	def binIndex(self, values, valuesRange, bins):
+
+		# The upper edge belongs to the last bin as in np.histogram
+
+		index = np.floor((values - valuesRange[0])*(bins/(valuesRange[1] - valuesRange[0]))).astype(np.int64)
+
+		index[values == valuesRange[1]] = bins - 1
+
+		return index
+
+	def fill(self, x, y, weights = None):
+
+		x = np.asarray(x, dtype = float)
+		y = np.asarray(y, dtype = float)
+
+		ix = self.binIndex(x, self.xRange, self.bins[0])
+		iy = self.binIndex(y, self.yRange, self.bins[1])
+
+		inside = (ix >= 0) & (ix < self.bins[0]) & (iy >= 0) & (iy < self.bins[1])
+
+		flat = ix[inside]*self.bins[1] + iy[inside]
+
+		if(weights is None):
+			self.counts += np.bincount(flat, minlength = self.counts.size).reshape(self.bins)
+
+		else:
+			if(self.counts.dtype.kind == 'i'):
+				self.counts = self.counts.astype(float)
+
+			self.counts += np.bincount(flat, weights = np.asarray(weights, dtype = float)[inside], minlength = self.counts.size).reshape(self.bins)
+
+		self.entries += int(np.sum(inside))
+		self.outside += int(len(x) - np.sum(inside))
+
+		return self
+
+	def fillArrays(self, x, y, chunkSize = OCCUPANCY_CHUNK_SIZE):
+
+		# Works on memory-mapped arrays (np.load(..., mmap_mode = 'r')) without reading them whole
+
+		for start in range(0, len(x), chunkSize):
+			self.fill(x[start: start + chunkSize], y[start: start + chunkSize])
+
+		return self
+
+	def fillCsv(self, filePath, xColumn = 'x', yColumn = 'y', selection = None, columns = None, chunkSize = OCCUPANCY_CHUNK_SIZE):
+
+		# selection receives every chunk and returns the rows to keep, e.g. the ones on the readout plane
+
+		usecols = list(dict.fromkeys([xColumn, yColumn] + ([] if columns is None else list(columns))))
+
+		for chunk in pd.read_csv(filePath, usecols = usecols, chunksize = chunkSize):
+
+			if(selection is not None):
+				chunk = chunk[np.asarray(selection(chunk))]
+
+			self.fill(chunk[xColumn].to_numpy(), chunk[yColumn].to_numpy())
+
+		return self
+
+	def isCompatible(self, other):
+		return self.xRange == other.xRange and self.yRange == other.yRange and self.bins == other.bins
+
+	def merge(self, other):
+
+		if(not self.isCompatible(other)):
+			raise ValueError('Occupancies with different binning can not be merged')
+
+		self.counts  = self.counts + other.counts
+		self.entries += other.entries
+		self.outside += other.outside
+
+		return self
+
+	def __add__(self, other):
+		return self.copy().merge(other)
+
+	def copy(self):
+
+		occupancy = Occupancy2D(self.xRange, self.yRange, self.bins, self.counts.copy())
+
+		occupancy.entries = self.entries
+		occupancy.outside = self.outside
+
+		return occupancy
+
+	def save(self, filePath):
+		np.savez(filePath, counts = self.counts, xRange = self.xRange, yRange = self.yRange, bins = self.bins, entries = self.entries, outside = self.outside)
+
+	@classmethod
+	def load(cls, filePath):
+
+		data = np.load(filePath)
+
+		occupancy = cls(data['xRange'], data['yRange'], data['bins'], data['counts'])
+
+		occupancy.entries = int(data['entries'])
+		occupancy.outside = int(data['outside'])
+
+		return occupancy
+
+	def plot(self, ax, **kwargs):
+
+		# Drawing cost depends on the number of bins only, not on the number of hits
+
+		return ax.pcolormesh(self.xEdges, self.yEdges, self.counts.T, **kwargs)
+
+#	Functions
+
+def mergeOccupancies(occupancies):
+
+	occupancies = list(occupancies)
+
+	merged = occupancies[0].copy()
+
+	for occupancy in occupancies[1:]:
+		merged.merge(occupancy)
+
+	return merged
@@ -0,0 +1,100 @@
+import numpy as np
+
+from raggedModule import RaggedEvents
+
+#	Pile-up (muon rate in MHz, times in ns)
+
+# Background muons crossing up to PILEUP_WINDOW ns before or after the trigger still drift electrons into its readout
+
+PILEUP_WINDOW 		= 100.0
+
+# Electrons overlaid together (on the busiest plane), the synthetic events of a chunk follow from the mean pile-up
+
+PILEUP_CHUNK_ELECTRONS = 10000000
+
+# Default seed of the pile-up studies, so rates are compared on the same draws and repeated calls agree
+
+PILEUP_SEED 		= 0
+
+#	Functions (Overlay)
+
+def overlayEvents(events, sources, owners, shifts, synthetic):
+
+	# Electrons of the pool events sources, shifted in time by shifts, gathered into the synthetic event owners (sorted)
+	# Contributions of one synthetic event are contiguous after the take, so its offsets are those of its first contribution
+
+	contributions = events.take(sources)
+
+	columns = dict(contributions.columns)
+
+	columns['t'] 		= columns['t'] + contributions.expand(shifts)
+	columns['source'] 	= contributions.expand(np.asarray(sources))
+
+	first = np.concatenate([[0], np.cumsum(np.bincount(owners, minlength = synthetic))])
+
+	return RaggedEvents(np.arange(1, synthetic + 1), contributions.offsets[first], columns)
+
+# Classes
+
+class PileupEmulator():
+
+	# Pool of simulated events with the same ids on every plane (x, y, z and t from the start of the track)
+	# A synthetic event is a trigger muon at t = 0 plus the background muons that cross the telescope within the window
+
+	def __init__(self, planeEvents, rate, window = PILEUP_WINDOW, seed = None):
+
+		self.planeEvents 	= list(planeEvents)
+		self.rate 			= rate
+		self.window 		= window
+		self.rng 			= np.random.default_rng(seed)
+
+		if(any(not np.array_equal(events.ids, self.planeEvents[0].ids) for events in self.planeEvents)):
+			raise ValueError('Every plane of the pile-up pool must hold the same events')
+
+		self.poolSize = len(self.planeEvents[0])
+
+	def getMeanPileup(self):
+
+		# Expected background muons per trigger, a rate in MHz is 1E-3 muons per ns
+
+		return self.rate*1E-3*2*self.window
+
+	def sampleContributions(self, synthetic, pileup = None):
+
+		# Poisson number of background muons (pileup of them when given), their arrivals are uniform in the window as in a Poisson process
+		# The first contribution of every synthetic event is its trigger
+
+		background = self.rng.poisson(self.getMeanPileup(), synthetic) if pileup is None else np.full(synthetic, pileup)
+
+		counts = background + 1
+
+		owners 	= np.repeat(np.arange(synthetic), counts)
+		sources = self.rng.integers(self.poolSize, size = len(owners))
+		shifts 	= self.rng.uniform(-self.window, self.window, len(owners))
+
+		first = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+		shifts[first] = 0
+
+		return owners, sources, shifts, first
+
+	def overlay(self, synthetic, pileup = None):
+
+		# Overlaid events of every plane (ids 1..synthetic) and the pool position of every trigger
+
+		owners, sources, shifts, first = self.sampleContributions(synthetic, pileup)
+
+		return [overlayEvents(events, sources, owners, shifts, synthetic) for events in self.planeEvents], sources[first]
+
+	def getChunkEvents(self, pileup = None, chunkElectrons = PILEUP_CHUNK_ELECTRONS):
+
+		electrons = max(np.mean(events.getCounts()) for events in self.planeEvents)*(1 + (self.getMeanPileup() if pileup is None else pileup))
+
+		return max(1, int(chunkElectrons//max(electrons, 1)))
+
+	def chunks(self, synthetic, pileup = None, chunkElectrons = PILEUP_CHUNK_ELECTRONS):
+
+		chunkEvents = self.getChunkEvents(pileup, chunkElectrons)
+
+		for start in range(0, synthetic, chunkEvents):
+			yield self.overlay(min(chunkEvents, synthetic - start), pileup)
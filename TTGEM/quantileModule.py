@@ -0,0 +1,148 @@
+import numpy as np
+
+#	Quantile sketch
+
+# k of the top compactor, memory is about 3k values whatever the number of gains seen
+# Rank error of one quantile (99% confidence) follows the DataSketches KLL fit 2.296/k^0.9723, 1.3% for k = 200
+
+QUANTILE_SKETCH_K 	= 200
+
+MIN_CAPACITY 		= 8
+
+# Classes
+
+class QuantileSketch():
+
+	# KLL sketch: level h keeps values of weight 2^h, a full level is sorted and every other value (random parity) moves up one level
+
+	def __init__(self, k = QUANTILE_SKETCH_K, seed = 0):
+
+		self.k 		= k
+		self.rng 	= np.random.default_rng(seed)
+
+		self.levels = [np.zeros(0)]
+		self.count 	= 0
+
+	def capacity(self, level):
+
+		# Capacities shrink geometrically by 2/3 below the top level
+
+		return max(MIN_CAPACITY, int(np.ceil(self.k*(2/3)**(len(self.levels) - 1 - level))))
+
+	def getSize(self):
+		return sum(len(values) for values in self.levels)
+
+	def getMaxSize(self):
+		return sum(self.capacity(level) for level in range(len(self.levels)))
+
+	def compact(self, level):
+
+		values = np.sort(self.levels[level])
+
+		# An odd value out stays at its level so weights are conserved
+
+		kept, values = values[len(values) - len(values) % 2:], values[:len(values) - len(values) % 2]
+
+		if(level + 1 == len(self.levels)):
+			self.levels.append(np.zeros(0))
+
+		self.levels[level] 		= kept
+		self.levels[level + 1] 	= np.concatenate([self.levels[level + 1], values[self.rng.integers(2)::2]])
+
+	def compress(self):
+
+		while(self.getSize() >= self.getMaxSize()):
+
+			level = next(level for level in range(len(self.levels)) if len(self.levels[level]) >= self.capacity(level))
+
+			self.compact(level)
+
+	def update(self, values):
+
+		values = np.ravel(np.asarray(values, dtype = float))
+		values = values[~np.isnan(values)]
+
+		self.levels[0] 	= np.concatenate([self.levels[0], values])
+		self.count 		+= len(values)
+
+		self.compress()
+
+		return self
+
+	def merge(self, other):
+
+		# Same level, same weight: the levels are concatenated and compressed again
+
+		for level, values in enumerate(other.levels):
+
+			if(level == len(self.levels)):
+				self.levels.append(np.zeros(0))
+
+			self.levels[level] = np.concatenate([self.levels[level], values])
+
+		self.k 		= max(self.k, other.k)
+		self.count 	+= other.count
+
+		self.compress()
+
+		return self
+
+	def __add__(self, other):
+		return self.copy().merge(other)
+
+	def copy(self):
+
+		sketch = QuantileSketch(self.k)
+
+		# The copy continues the random stream of this sketch without advancing it
+
+		sketch.rng 		= np.random.default_rng()
+		sketch.rng.bit_generator.state = self.rng.bit_generator.state
+		sketch.levels 	= [values.copy() for values in self.levels]
+		sketch.count 	= self.count
+
+		return sketch
+
+	def getWeightedValues(self):
+
+		values 	= np.concatenate(self.levels)
+		weights = np.concatenate([np.full(len(values), 2**level) for level, values in enumerate(self.levels)])
+
+		order = np.argsort(values, kind = 'stable')
+
+		return values[order], weights[order]
+
+	def quantile(self, q):
+
+		# Smallest stored value whose cumulative weight reaches q of the total
+
+		values, weights = self.getWeightedValues()
+
+		if(len(values) == 0):
+			return np.full(np.shape(q), np.nan)
+
+		cumulative = np.cumsum(weights)
+
+		return values[np.clip(np.searchsorted(cumulative, np.asarray(q)*cumulative[-1], side = 'left'), 0, len(values) - 1)]
+
+	def percentile(self, p):
+		return self.quantile(np.asarray(p)/100)
+
+	def rank(self, x):
+
+		# Fraction of the values seen that are not above x
+
+		values, weights = self.getWeightedValues()
+
+		if(len(values) == 0):
+			return np.full(np.shape(x), np.nan)
+
+		cumulative = np.concatenate([[0], np.cumsum(weights)])
+
+		return cumulative[np.searchsorted(values, x, side = 'right')]/cumulative[-1]
+
+	def getRankError(self):
+
+		# Exact while nothing was compacted
+
+		return 0.0 if len(self.levels) == 1 else 2.296/self.k**0.9723
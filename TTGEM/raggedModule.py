@@ -0,0 +1,241 @@
+import numpy as np
+import pandas as pd
+
+#	Functions (Segments)
+
+def segmentStarts(keys):
+
+	# Rows where a new event begins in a key column grouped event after event
+
+	if(len(keys) == 0):
+		return np.zeros(0, dtype = np.int64)
+
+	return np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+
+def segmentReduce(ufunc, values, offsets, empty):
+
+	# ufunc.reduceat over the non empty segments, a segment ends where the next non empty one starts since empty ones have no rows
+
+	counts = np.diff(offsets)
+
+	result = np.full(len(counts), empty, dtype = np.result_type(values, np.asarray(empty)))
+
+	nonEmpty = counts > 0
+
+	if(np.any(nonEmpty)):
+		result[nonEmpty] = ufunc.reduceat(values, offsets[:-1][nonEmpty])
+
+	return result
+
+def concatenateEvents(raggedList):
+
+	# Events of several containers one after the other, the columns must match
+
+	shifts = np.cumsum([0] + [ragged.offsets[-1] for ragged in raggedList[:-1]])
+
+	offsets = np.concatenate([[0]] + [ragged.offsets[1:] + shift for ragged, shift in zip(raggedList, shifts)])
+
+	return RaggedEvents(np.concatenate([ragged.ids for ragged in raggedList]), offsets, {name: np.concatenate([ragged.columns[name] for ragged in raggedList]) for name in raggedList[0].columns})
+
+# Classes
+
+class RaggedEvents():
+
+	# Per-event rows (electrons, avalanches) as flat columns, event i owns the rows offsets[i]:offsets[i + 1]
+
+	def __init__(self, ids, offsets, columns):
+
+		self.ids 		= np.asarray(ids)
+		self.offsets 	= np.asarray(offsets, dtype = np.int64)
+		self.columns 	= {name: np.asarray(values) for name, values in columns.items()}
+
+		if(len(self.offsets) != len(self.ids) + 1):
+			raise ValueError('{} offsets for {} events, expected one more offset than events'.format(len(self.offsets), len(self.ids)))
+
+	@classmethod
+	def fromArrays(cls, keys, columns):
+
+		keys 	= np.asarray(keys)
+		columns = {name: np.asarray(values) for name, values in columns.items()}
+
+		# Simulation files are written event after event, sorting is only needed when they are not
+
+		if(np.any(keys[1:] < keys[:-1])):
+
+			order 	= np.argsort(keys, kind = 'stable')
+			keys 	= keys[order]
+			columns = {name: values[order] for name, values in columns.items()}
+
+		starts = segmentStarts(keys)
+
+		return cls(keys[starts], np.append(starts, len(keys)), columns)
+
+	@classmethod
+	def fromDataFrame(cls, dataFrame, key = 'step', columns = None):
+
+		columns = [column for column in dataFrame.columns if column != key] if columns is None else columns
+
+		return cls.fromArrays(dataFrame[key].to_numpy(), {column: dataFrame[column].to_numpy() for column in columns})
+
+	def __len__(self):
+		return len(self.ids)
+
+	def __getitem__(self, item):
+
+		# A column name gives the flat column, a slice gives the events in that position range
+
+		if(isinstance(item, slice)):
+			return self.sliceEvents(*item.indices(len(self))[:2])
+
+		return self.columns[item]
+
+	def getCounts(self):
+		return np.diff(self.offsets)
+
+	def getEventIndex(self):
+		return np.repeat(np.arange(len(self)), self.getCounts())
+
+	def expand(self, perEvent):
+
+		# One value per event repeated on every row of the event
+
+		return np.repeat(np.asarray(perEvent), self.getCounts())
+
+	#	Reductions (one value per event, empty events get NaN or the neutral value)
+
+	def sum(self, column):
+		return segmentReduce(np.add, self.columns[column], self.offsets, 0)
+
+	def min(self, column):
+		return segmentReduce(np.minimum, self.columns[column], self.offsets, np.nan)
+
+	def max(self, column):
+		return segmentReduce(np.maximum, self.columns[column], self.offsets, np.nan)
+
+	def argmax(self, column):
+
+		# Row of the largest value of every event, -1 for empty events
+
+		# Sorted by event and then by value, the last row of every segment holds the maximum
+
+		order = np.lexsort((self.columns[column], self.getEventIndex()))
+
+		rows = np.full(len(self), -1, dtype = np.int64)
+
+		nonEmpty = self.getCounts() > 0
+
+		rows[nonEmpty] = order[self.offsets[1:][nonEmpty] - 1]
+
+		return rows
+
+	def quantile(self, column, q):
+
+		# Linear interpolation between the sorted values of every event as np.quantile, NaN for empty events
+
+		counts = self.getCounts()
+
+		values = self.columns[column][np.lexsort((self.columns[column], self.getEventIndex()))]
+
+		result 		= np.full(len(self), np.nan)
+		nonEmpty 	= counts > 0
+
+		position = self.offsets[:-1][nonEmpty] + q*(counts[nonEmpty] - 1)
+
+		lower = np.floor(position).astype(np.int64)
+		upper = np.minimum(lower + 1, self.offsets[1:][nonEmpty] - 1)
+
+		result[nonEmpty] = values[lower] + (position - lower)*(values[upper] - values[lower])
+
+		return result
+
+	def median(self, column):
+		return self.quantile(column, 0.5)
+
+	def mean(self, column):
+
+		counts = self.getCounts()
+
+		return np.divide(self.sum(column), counts, out = np.full(len(counts), np.nan), where = counts > 0)
+
+	def std(self, column, ddof = 1):
+
+		# Two passes as pandas, deviations from the event mean are summed per event
+
+		counts 	= self.getCounts()
+		mean 	= self.mean(column)
+
+		m2 = segmentReduce(np.add, (self.columns[column] - self.expand(mean))**2, self.offsets, 0.0)
+
+		return np.sqrt(np.divide(m2, counts - ddof, out = np.full(len(counts), np.nan), where = counts > ddof))
+
+	#	Selections
+
+	def filter(self, mask):
+
+		# Keeps the rows where mask is True, every event stays (possibly empty) so results align with the unfiltered events
+
+		mask = np.asarray(mask, dtype = bool)
+
+		kept = np.concatenate([[0], np.cumsum(mask)])
+
+		return RaggedEvents(self.ids, kept[self.offsets], {name: values[mask] for name, values in self.columns.items()})
+
+	def selectEvents(self, eventMask):
+
+		eventMask = np.asarray(eventMask, dtype = bool)
+
+		rowMask = self.expand(eventMask)
+
+		return RaggedEvents(self.ids[eventMask], np.concatenate([[0], np.cumsum(self.getCounts()[eventMask])]), {name: values[rowMask] for name, values in self.columns.items()})
+
+	def dropEmpty(self):
+		return self.selectEvents(self.getCounts() > 0)
+
+	def take(self, positions, ids = None):
+
+		# Events at positions one after the other (repeats allowed), a position -1 gives an empty event with id -1 (unless ids are given)
+		# Rows are gathered with one arange shifted by the distance from every event start to its new start
+
+		positions = np.asarray(positions, dtype = np.int64)
+
+		present = positions >= 0
+
+		counts = np.zeros(len(positions), dtype = np.int64)
+		starts = np.zeros(len(positions), dtype = np.int64)
+
+		counts[present] = self.getCounts()[positions[present]]
+		starts[present] = self.offsets[positions[present]]
+
+		if(ids is None):
+			ids = np.full(len(positions), -1, dtype = self.ids.dtype)
+			ids[present] = self.ids[positions[present]]
+
+		offsets = np.concatenate([[0], np.cumsum(counts)])
+
+		rows = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], counts)
+
+		return RaggedEvents(ids, offsets, {name: values[rows] for name, values in self.columns.items()})
+
+	def sliceEvents(self, start, stop):
+
+		# Events start:stop by position, the rows are a view of the flat columns
+
+		start, stop = max(start, 0), max(min(stop, len(self)), max(start, 0))
+
+		first, last = self.offsets[start], self.offsets[stop]
+
+		return RaggedEvents(self.ids[start: stop], self.offsets[start: stop + 1] - first, {name: values[first: last] for name, values in self.columns.items()})
+
+	def sliceIds(self, firstId, lastId):
+
+		# Events with firstId <= id < lastId, ids are sorted
+
+		return self.sliceEvents(np.searchsorted(self.ids, firstId, side = 'left'), np.searchsorted(self.ids, lastId, side = 'left'))
+
+	def toDataFrame(self, key = 'step'):
+
+		dataFrame = pd.DataFrame(self.columns)
+
+		dataFrame.insert(0, key, self.expand(self.ids))
+
+		return dataFrame
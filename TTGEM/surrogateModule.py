@@ -0,0 +1,240 @@
+import os
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from trackModule import TGEM, MUON_MASS_EV, TTGEM_DATA_PATH, EVENTS_DATA_PATH
+
+#	Paths
+
+SURROGATE_PATH 			= 'surrogate.npz'
+
+#	Features (entry position in cm, direction as slopes dx/|dz|, dy/|dz|, log10 of the muon energy in eV)
+
+SURROGATE_FEATURES 		= np.array(['x', 'y', 'slopeX', 'slopeY', 'logEnergy'])
+
+SURROGATE_SCALES 		= np.array([0.01, 0.01, 0.002, 0.002, 0.5])
+
+#	Parameters of the response of one condition
+
+# (log collected, log total) bivariate normal, centroid offset as a gaussian core plus a wide isotropic component
+
+SURROGATE_PARAMETERS 	= np.array(['logCollectedMean', 'logTotalMean', 'logCollectedStd', 'logTotalStd', 'logCorrelation', 'offsetXMean', 'offsetYMean', 'offsetXStd', 'offsetYStd', 'outlierFraction', 'outlierStd'])
+
+OUTLIER_DISTANCE 		= 0.1
+
+SURROGATE_CHUNK_SIZE 	= 65536
+
+# Training conditions averaged per muon, farther ones have negligible kernel weight at the surrogate scales
+
+SURROGATE_NEIGHBOURS 	= 8
+
+# Kernel weights below this fraction of the weight of the nearest condition are dropped
+
+SURROGATE_KERNEL_CUTOFF = 1E-12
+
+#	Functions (Training)
+
+def muonEnergy(v):
+
+	# v is the speed in units of c
+
+	return MUON_MASS_EV/np.sqrt(1 - np.asarray(v, dtype = float)**2)
+
+def muonFeatures(x, y, dx, dy, dz, energy):
+
+	x, y, dx, dy, dz, energy = np.broadcast_arrays(*[np.asarray(value, dtype = float) for value in [x, y, dx, dy, dz, energy]])
+
+	return np.stack([x, y, dx/np.abs(dz), dy/np.abs(dz), np.log10(energy)], axis = -1)
+
+def conditionParameters(eventsDataFrame, xMuon, yMuon):
+
+	collected 	= np.log(np.maximum(np.array(eventsDataFrame['collected'], dtype = float), 1))
+	total 		= np.log(np.maximum(np.array(eventsDataFrame['total'], dtype = float), 1))
+
+	offsetX = np.array(eventsDataFrame['x']) - xMuon
+	offsetY = np.array(eventsDataFrame['y']) - yMuon
+
+	valid = np.isfinite(offsetX) & np.isfinite(offsetY)
+
+	offsetX, offsetY = offsetX[valid], offsetY[valid]
+
+	# Centroids far from the median come from electrons lost to neighbour holes, they are modelled apart
+
+	outlier = np.hypot(offsetX - np.median(offsetX), offsetY - np.median(offsetY)) > OUTLIER_DISTANCE
+	core 	= ~outlier
+
+	outlierStd = np.sqrt(np.mean(np.concatenate([offsetX[outlier], offsetY[outlier]])**2)) if np.any(outlier) else 0.0
+
+	return np.array([
+		np.mean(collected), np.mean(total), np.std(collected, ddof = 1), np.std(total, ddof = 1), np.corrcoef(collected, total)[0, 1],
+		np.mean(offsetX[core]), np.mean(offsetY[core]), np.std(offsetX[core], ddof = 1), np.std(offsetY[core], ddof = 1),
+		np.mean(outlier), outlierStd])
+
+def getTrainingSet(TTGEMDataPath = TTGEM_DATA_PATH):
+
+	# One condition per TGEM plane of every TTGEM run, events come from eventsData (or electronsData through TGEM)
+
+	features 	= []
+	parameters 	= []
+
+	for fileName in sorted(os.listdir(TTGEMDataPath)):
+
+		if(not fileName.endswith('.csv')):
+			continue
+
+		TTGEMdataFrame = pd.read_csv(TTGEMDataPath + fileName)
+
+		for _, plane in TTGEMdataFrame.iterrows():
+
+			eventsDataFrame = TGEM(int(plane['name'])).eventsDataFrame
+
+			features.append(muonFeatures(plane['x'], plane['y'], plane['dx'], plane['dy'], plane['dz'], muonEnergy(plane['v'])))
+			parameters.append(conditionParameters(eventsDataFrame, plane['x'], plane['y']))
+
+	return np.array(features), np.array(parameters)
+
+# Classes
+
+class DetectorSurrogate():
+
+	def __init__(self, features, parameters, scales = SURROGATE_SCALES, neighbours = SURROGATE_NEIGHBOURS):
+
+		self.features 	= np.asarray(features, dtype = float)
+		self.parameters = np.asarray(parameters, dtype = float)
+		self.scales 	= np.asarray(scales, dtype = float)
+
+		# Runs repeated with the same muon are one condition of averaged parameters weighted by their count, as in the full kernel sum
+
+		uniqueFeatures, inverse, self.counts = np.unique(self.features, axis = 0, return_inverse = True, return_counts = True)
+
+		self.conditionParameters = np.zeros((len(uniqueFeatures), self.parameters.shape[1]))
+
+		np.add.at(self.conditionParameters, inverse.ravel(), self.parameters)
+
+		self.conditionParameters /= self.counts.reshape(-1, 1)
+
+		self.neighbours = min(neighbours, len(uniqueFeatures))
+
+		self.tree = cKDTree(uniqueFeatures/self.scales)
+
+	@classmethod
+	def fromData(cls, TTGEMDataPath = TTGEM_DATA_PATH, scales = SURROGATE_SCALES):
+		return cls(*getTrainingSet(TTGEMDataPath), scales)
+
+	@classmethod
+	def load(cls, filePath = SURROGATE_PATH):
+
+		data = np.load(filePath)
+
+		return cls(data['features'], data['parameters'], data['scales'])
+
+	def save(self, filePath = SURROGATE_PATH):
+		np.savez(filePath, features = self.features, parameters = self.parameters, scales = self.scales)
+
+	def predict(self, features):
+
+		# Gaussian kernel average of the nearest training conditions, far from every condition it tends to the nearest one
+		# Conditions are many scales apart, so the kernel of the farther ones vanishes and only the neighbours are weighted
+
+		features = np.atleast_2d(features)/self.scales
+
+		parameters = np.empty((len(features), self.parameters.shape[1]))
+
+		for start in range(0, len(features), SURROGATE_CHUNK_SIZE):
+
+			chunk = features[start: start + SURROGATE_CHUNK_SIZE]
+
+			# Most muons are much closer to one condition than to the second, only the rest query every neighbour
+
+			chunkParameters, weights = self.kernelAverage(chunk, min(2, self.neighbours))
+
+			refine = weights[:, -1] > 0
+
+			if(self.neighbours > 2 and np.any(refine)):
+				chunkParameters[refine] = self.kernelAverage(chunk[refine], self.neighbours)[0]
+
+			parameters[start: start + SURROGATE_CHUNK_SIZE] = chunkParameters
+
+		return parameters
+
+	def kernelAverage(self, features, neighbours):
+
+		# Parameters of the scaled features averaged over their nearest conditions and the kernel weights used
+
+		distances, index = self.tree.query(features, k = neighbours, workers = -1)
+
+		distances, index = distances.reshape(len(features), -1), index.reshape(len(features), -1)
+
+		weights = np.exp(-(distances**2 - distances[:, :1]**2)/2)
+
+		weights[weights < SURROGATE_KERNEL_CUTOFF] = 0
+
+		weights = weights*self.counts[index]
+
+		return np.einsum('ij,ijk->ik', weights, self.conditionParameters[index])/np.sum(weights, axis = 1, keepdims = True), weights
+
+	def sampleParameters(self, parameters, xEntry, yEntry, rng = None):
+
+		# One synthetic event per row of parameters with the columns of eventsData
+
+		rng = np.random.default_rng(rng)
+
+		n = len(parameters)
+
+		logCollectedMean, logTotalMean, logCollectedStd, logTotalStd, logCorrelation, offsetXMean, offsetYMean, offsetXStd, offsetYStd, outlierFraction, outlierStd = parameters.T
+
+		z1 = rng.standard_normal(n)
+		z2 = rng.standard_normal(n)
+
+		total 		= np.rint(np.exp(logTotalMean + logTotalStd*z1))
+		collected 	= np.rint(np.exp(logCollectedMean + logCollectedStd*(logCorrelation*z1 + np.sqrt(np.clip(1 - logCorrelation**2, 0, None))*z2)))
+
+		collected = np.minimum(collected, total)
+
+		outlier = rng.random(n) < outlierFraction
+
+		offsetStdX = np.where(outlier, outlierStd, offsetXStd)
+		offsetStdY = np.where(outlier, outlierStd, offsetYStd)
+
+		return pd.DataFrame({
+			'event': np.arange(1, n + 1),
+			'collected': collected.astype(np.int64),
+			'total': total.astype(np.int64),
+			'x': xEntry + np.where(outlier, 0, offsetXMean) + offsetStdX*rng.standard_normal(n),
+			'y': yEntry + np.where(outlier, 0, offsetYMean) + offsetStdY*rng.standard_normal(n)})
+
+	def sample(self, x, y, dx, dy, dz, energy, rng = None):
+
+		# One event per muon, every muon may have its own entry point, direction and energy
+
+		features = muonFeatures(x, y, dx, dy, dz, energy).reshape(-1, len(SURROGATE_FEATURES))
+
+		return self.sampleParameters(self.predict(features), features[:, 0], features[:, 1], rng)
+
+	def simulateTGEM(self, serial, x, y, dx, dy, dz, energy, events = 100, rng = None):
+
+		# Written as eventsData so that TGEM(serial) reads it like a simulated plane
+
+		# Same muon for every event, the kernel is evaluated once
+
+		parameters = self.predict(muonFeatures(x, y, dx, dy, dz, energy))
+
+		eventsDataFrame = self.sampleParameters(np.repeat(parameters, events, axis = 0), x, y, rng)
+
+		eventsDataFrame.index = np.arange(1, events + 1)
+
+		eventsDataFrame.to_csv(EVENTS_DATA_PATH + '{}.csv'.format(serial), index_label = 'step')
+
+		return eventsDataFrame
+
+	def simulateTTGEM(self, serial, planesDataFrame, events = 100, rng = None):
+
+		# planesDataFrame has the TTGEMData columns (Id, name, x, y, z, dx, dy, dz, v), one row per plane
+
+		rng = np.random.default_rng(rng)
+
+		for _, plane in planesDataFrame.iterrows():
+			self.simulateTGEM(int(plane['name']), plane['x'], plane['y'], plane['dx'], plane['dy'], plane['dz'], muonEnergy(plane['v']), events, rng)
+
+		planesDataFrame.to_csv(TTGEM_DATA_PATH + '{}.csv'.format(serial), index = False)
@@ -59,6 +59,15 @@ verticalConstantYGroup = verticalGroup.getConstant('y')
 
 allGroup.graphMuonTracks()
 
+allGroup.graphStatisticsMap('gain')
+allGroup.graphStatisticsMap('difference')
+allGroup.graphStatisticsMap('gain', coordinates = 'angle')
+allGroup.graphStatisticsMap('difference', coordinates = 'angle')
+
+# Explicit edges: events per 1 cm cell of the sensor area
+
+allGroup.graphStatisticsMap('gain', statistic = 'count', bins = (np.linspace(*OCCUPANCY_X_RANGE, 11), np.linspace(*OCCUPANCY_Y_RANGE, 11)))
+
 
 #verticalGroup.graphMuonTracks()
 
@@ -68,6 +77,11 @@ centralGroup.plotEfficiencies(mode = 'chain')
 centralGroup.plotEfficiencies(mode = 'independent')
 centralGroup.graphMuonTracks()
 
+# Plane 2 passed without plane 1, majority of the three planes and every pass/fail pattern
+
+print(centralGroup.getCoincidenceFractions([('pattern', (1,), (0,)), ('majority', (0, 1, 2))]))
+print(centralGroup.getCoincidences().getPatternFractions())
+
 
 verticalConstantXGroup.graphMuonTracks('y')
 verticalConstantXGroup.plotAverageGainAxis('y')
@@ -97,6 +111,13 @@ movingInYGroup.plotAverageGainByChannelAxis('y')
 movingInYGroup.plotAverageDifferenceAxis('y')
 movingInYGroup.plotAverageDifferenceByChannelAxis('y')
 
+# Plane offsets and rotations against the simulated muons, saved for TTGEM(serial, alignment = Alignment.load())
+
+alignment = allGroup.getAlignment()
+alignment.save()
+
+print(alignment.offsets, alignment.rotations, alignment.iterations)
+
 
 
 """
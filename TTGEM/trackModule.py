@@ -1,7 +1,21 @@
+import os
+import inspect
+import weakref
+import functools
 import numpy as np 
 import pandas as pd
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from raggedModule import RaggedEvents, concatenateEvents
+from occupancyModule import Occupancy2D, mergeOccupancies, OCCUPANCY_BINS
+from coincidenceModule import CoincidenceCounts, chainQueries, independentQueries
+from quantileModule import QuantileSketch, QUANTILE_SKETCH_K
+from binnedModule import BinnedStatistics, binEdges, MAP_BINS
+from alignmentModule import Alignment, ALIGNMENT_CUT
+from digitizationModule import StripReadout
+from centroidModule import estimateCentroid, CENTROID_ESTIMATORS
+from pileupModule import PileupEmulator, PILEUP_WINDOW, PILEUP_CHUNK_ELECTRONS, PILEUP_SEED
+from archiveModule import readElectronArchive, ELECTRONS_ARCHIVE_PATH, ARCHIVE_EXTENSION
 
 plt.rcParams.update({
   "text.usetex": True,
@@ -34,6 +48,30 @@ INTER_GEM_DISTANCE 		= 2.5
 
 INTRA_GEM_DISTANCE 		= (0.906)/100
 
+READOUT_Z_LIMIT 		= -0.6029
+
+#	Timing (TGEM.hh starts the track of event i at t = 100 i ns, times in ns)
+
+TRACK_TIME_SPACING 		= 100
+
+TIMING_COLUMNS 			= ['tFirst', 'tMedian', 'tSpread']
+
+#	Occupancy (sensor area of every TGEM in cm)
+
+OCCUPANCY_X_RANGE 		= (-5.0, 5.0)
+
+OCCUPANCY_Y_RANGE 		= (-5.0, 5.0)
+
+#	Statistic maps (muon entry point in cm or direction in degrees, per-event quantities of every plane)
+
+MAP_COORDINATES 		= {'position': ('xMuon', 'yMuon'), 'angle': ('thetaMuon', 'phiMuon')}
+
+MAP_COORDINATE_LABELS 	= {'position': ('x(cm)', 'y(cm)'), 'angle': (r'$\theta$(grados)', r'$\phi$(grados)')}
+
+MAP_QUANTITIES 			= ['gain', 'difference', 'xDifference', 'yDifference']
+
+MAP_QUANTITY_LABELS 	= {'gain': 'Ganancia', 'difference': 'Diferencia (cm)', 'xDifference': 'Diferencia en x (cm)', 'yDifference': 'Diferencia en y (cm)'}
+
 #	Functions (Trayectory)
 
 def linearTrajectory(t, x0, y0, z0, x1, y1, z1, dx, dy, dz, v):
@@ -69,8 +107,8 @@ def trajectoryZFunc(x0, y0, z0, x1, y1, z1, points = 10000):
 #	Functions (Vectorization)
 
 
-def TGEMVect(serials):
-	return np.vectorize(TGEM)(serials)
+def TGEMVect(serials, dataset = None):
+	return np.vectorize(TGEM, excluded = ['dataset'], otypes = [np.dtype('O')])(serials, dataset = dataset)
 
 def dataFrameVect(objects, attr):
 	return np.vectorize(getattr, excluded = [1], otypes = [np.dtype('O')])(objects, attr)
@@ -91,29 +129,163 @@ def getAttrArrayVectObj(objects, attr):
 	return np.vectorize(getattr, excluded = [1], signature = '()->(n,m)')(objects, attr)
 
 
+#	Functions (Memoization)
+
+def hashableKey(value):
+
+	# Arrays and lists (edges, fixed planes) become nested tuples, arrays keep their shape so (2, 3) and (3, 2) differ
+
+	if(isinstance(value, np.ndarray)):
+		return ('ndarray', value.shape, hashableKey(value.tolist()))
+
+	if(isinstance(value, (list, tuple))):
+		return tuple(hashableKey(item) for item in value)
+
+	if(isinstance(value, dict)):
+		return tuple(sorted((key, hashableKey(item)) for key, item in value.items()))
+
+	return value
+
+def cachedValue(value):
+
+	# Cached arrays are shared between callers so they are made read only, objects with a copy (sketches, coincidences, maps, alignments) are copied for every caller
+	# Groups and events have no copy and stay shared
+
+	if(isinstance(value, np.ndarray)):
+		value.flags.writeable = False
+		return value
+
+	if(isinstance(value, (list, tuple))):
+		return type(value)(cachedValue(item) for item in value)
+
+	return value.copy() if hasattr(value, 'copy') else value
+
+def memoized(method):
+
+	# Caches the result per (method, arguments) in self.cache, defaults are applied so equivalent calls share the key
+
+	signature = inspect.signature(method)
+
+	@functools.wraps(method)
+	def wrapper(self, *args, **kwargs):
+
+		arguments = signature.bind(self, *args, **kwargs)
+		arguments.apply_defaults()
+
+		key = (method.__name__,) + hashableKey(tuple(arguments.arguments.items())[1:])
+
+		stats = self.cacheStats.setdefault(method.__name__, [0, 0])
+
+		# Arguments that still cannot be hashed (arbitrary objects) and random draws without a seed are computed every time
+
+		try:
+			hash(key)
+
+		except TypeError:
+			stats[1] += 1
+			return method(self, *args, **kwargs)
+
+		if('seed' in arguments.arguments and arguments.arguments['seed'] is None):
+			stats[1] += 1
+			return method(self, *args, **kwargs)
+
+		if(key in self.cache):
+			stats[0] += 1
+			return cachedValue(self.cache[key])
+
+		stats[1] += 1
+
+		self.cache[key] = method(self, *args, **kwargs)
+
+		return cachedValue(self.cache[key])
+
+	return wrapper
+
+#	Functions (Joining)
+
+def joinEventIds(idArrays):
+
+	# Union of the event ids of every plane, the row of each plane for every id (-1 when absent) and a presence bitmask
+	# A stable sort of the concatenated (already sorted) id runs is a k-way merge, the rest is linear
+
+	planes = len(idArrays)
+
+	ids 	= np.concatenate(idArrays).astype(np.int64)
+	planeOf = np.repeat(np.arange(planes), [len(planeIds) for planeIds in idArrays])
+	rowOf 	= np.concatenate([np.arange(len(planeIds)) for planeIds in idArrays])
+
+	order = np.argsort(ids, kind = 'stable')
+
+	ids, planeOf, rowOf = ids[order], planeOf[order], rowOf[order]
+
+	new = np.ones(len(ids), dtype = bool)
+	new[1:] = ids[1:] != ids[:-1]
+
+	slot = np.cumsum(new) - 1
+
+	rows = np.full((planes, np.count_nonzero(new)), -1, dtype = np.int64)
+	rows[planeOf, slot] = rowOf
+
+	presence = np.sum((rows >= 0).astype(np.int64) << np.arange(planes).reshape(-1, 1), axis = 0)
+
+	return ids[new], rows, presence
+
 # Processing
 
-def reconstructEventsData(electronDataFrame, serial = None):
+def relativeTimes(events):
+
+	# Electron times from the start of the track of their event
 
-	collectedDataFrame = electronDataFrame[electronDataFrame['z'] <= -0.6029]
+	columns = dict(events.columns)
 
-	groupByEvent = electronDataFrame.groupby('step')
-	groupByEventCollected = collectedDataFrame.groupby('step') 
+	columns['t'] = events['t'] - TRACK_TIME_SPACING*(events.expand(events.ids) - 1)
 
-	eventsId		= 	np.unique(collectedDataFrame['step'])
-	totalCounts		=	groupByEvent.count()['x']
-	collectedCounts =	groupByEventCollected.count()['x']
+	return RaggedEvents(events.ids, events.offsets, columns)
 
-	xMean			= groupByEventCollected.mean()['x']
-	yMean			= groupByEventCollected.mean()['y']
+def eventTiming(events):
+
+	# First arrival, median and spread (sample std) of the electron times of every event, times from the start of its track
+
+	return events.min('t'), events.median('t'), events.std('t')
+
+def reconstructEvents(events, readout = None, estimator = 'mean'):
+
+	# events is a RaggedEvents of the electrons with x, y, z (t from the start of the track when timed, e for the weighted centroid)
+
+	collected = events.filter(events['z'] <= READOUT_Z_LIMIT)
+
+	# Events without collected electrons are not written
+
+	collectedCounts = collected.getCounts()
+	seen 			= collectedCounts > 0
+
+	# A strip readout replaces the electron centroid (of the chosen estimator) by the centroid of the strips above threshold
+
+	if(readout):
+		digitized = readout.digitize(collected.selectEvents(seen))
+		x, y = np.array(digitized['x']), np.array(digitized['y'])
+	else:
+		x, y = [estimateCentroid(collected.selectEvents(seen), axis, estimator) for axis in ['x', 'y']]
 
 	reconstructedEventsDataFrame = pd.DataFrame({
-		'event': eventsId, 
-		'collected': collectedCounts,
-		'total': totalCounts, 
-		'x':xMean,
-		'y': yMean})
+		'event': events.ids[seen], 
+		'collected': collectedCounts[seen],
+		'total': events.getCounts()[seen], 
+		'x': x,
+		'y': y}, index = pd.Index(events.ids[seen], name = 'step'))
+
+	if('t' in events.columns):
+
+		for column, values in zip(TIMING_COLUMNS, eventTiming(collected.selectEvents(seen))):
+			reconstructedEventsDataFrame[column] = values
+
+	return reconstructedEventsDataFrame
 
+def reconstructEventsData(electronDataFrame, serial = None, readout = None, estimator = 'mean'):
+
+	events = RaggedEvents.fromDataFrame(electronDataFrame, 'step', ['x', 'y', 'z'] + [column for column in ['t', 'e'] if column in electronDataFrame.columns])
+
+	reconstructedEventsDataFrame = reconstructEvents(relativeTimes(events) if 't' in events.columns else events, readout, estimator)
 
 	if(serial):
 
@@ -213,16 +385,63 @@ def vectTrackPlot(ax, xAll, yAll, xMuonAll, yMuonAll, zMuonAll, **kwargs):
 
 	return np.vectorize(trackPlot, excluded = [0], otypes = [np.dtype('O')], signature = '(n,m), (n,m), (n), (n), (n) -> ()')(ax, xAll, yAll, xMuonAll, yMuonAll, zMuonAll)
 
+def occupancyPlot(ax, occupancies, zPlanes, **kwargs):
+
+	# Every plane is drawn as filled contours of its counts at its own height, the cost does not grow with the hits
+
+	for occupancy, z in zip(occupancies, zPlanes):
+
+		xCenters = (occupancy.xEdges[1:] + occupancy.xEdges[:-1])/2
+		yCenters = (occupancy.yEdges[1:] + occupancy.yEdges[:-1])/2
+
+		counts = np.ma.masked_equal(occupancy.counts.T, 0)
+
+		ax.contourf(xCenters, yCenters, counts, zdir = 'z', offset = z, **kwargs)
+
+	ax.set_zlim(np.min(zPlanes), np.max(zPlanes))
 
 # Classes
 
+class EventJoin():
+
+	# Events of several planes aligned on their ids, values of each plane are gathered into (planes, events) arrays
+
+	def __init__(self, idArrays):
+
+		self.planes = len(idArrays)
+
+		self.ids, self.rows, self.presence = joinEventIds(idArrays)
+
+		self.present = self.rows >= 0
+
+	def getComplete(self):
+		return self.presence == (1 << self.planes) - 1
+
+	def padded(self, valueArrays, fill = np.nan):
+
+		values = np.full(self.rows.shape, fill, dtype = np.result_type(*[np.asarray(planeValues).dtype for planeValues in valueArrays], np.asarray(fill).dtype))
+
+		for plane, planeValues in enumerate(valueArrays):
+			values[plane, self.present[plane]] = np.asarray(planeValues)[self.rows[plane, self.present[plane]]]
+
+		return values
+
+	def masked(self, valueArrays):
+
+		# Missing entries are masked and hold NaN, so plain numpy copies do not mistake them for data
+
+		return np.ma.masked_array(self.padded(valueArrays, np.nan), mask = ~self.present)
+
+
 class TGEM():
 
-	def __init__(self, serial):
+	def __init__(self, serial, dataset = None):
 
 		self.serial = serial
+		self.dataset = dataset
 
 		self.electronsDataPath 	= ELECTRONS_DATA_PATH + str(serial) + '.csv'
+		self.electronsArchivePath = ELECTRONS_ARCHIVE_PATH + str(serial) + ARCHIVE_EXTENSION
 		#self.avalanchesDataPath = AVALANCHES_DATA_PATH + str(serial) + '.csv'
 		self.eventsDataPath  	= EVENTS_DATA_PATH + str(serial) + '.csv'
 
@@ -232,22 +451,72 @@ class TGEM():
 	def getData(self):
 
 		try:
-			self.eventsDataFrame = pd.read_csv(self.eventsDataPath)
+			self.eventsDataFrame = self.dataset.getEventsData(self.serial) if self.dataset else pd.read_csv(self.eventsDataPath)
 
 		except Exception as e:
 
-			self.electronsDataFrame = pd.read_csv(self.electronsDataPath)
+			self.electronsDataFrame = self.readElectronsData()
 			self.eventsDataFrame = reconstructEventsData(self.electronsDataFrame, self.serial)
 			#self.eventsDataFrame.to_csv(self.electronsDataPath)
 
 		#self.avlanchesDataFrame = pd.read_csv(self.avalanchesDataPath)
 
-		self.idArray  = np.unique(self.eventsDataFrame['event'])	
+		self.eventIds = np.array(self.eventsDataFrame['event'])
+		self.idArray  = np.unique(self.eventIds)	
 		
 		self.getGain()
 
 		self.getCoordinates()
 
+	def readElectronsData(self):
+
+		if(self.dataset):
+			return self.dataset.getElectronsData(self.serial)
+
+		if(os.path.exists(self.electronsArchivePath)):
+			return readElectronArchive(self.electronsArchivePath)
+
+		return pd.read_csv(self.electronsDataPath)
+
+	def getDigitizedEvents(self, readout = None):
+
+		# Strip charges, fired strips and strip centroids of every event from the electrons file
+
+		readout = StripReadout() if readout is None else readout
+
+		events = RaggedEvents.fromDataFrame(self.readElectronsData(), 'step', ['x', 'y', 'z'])
+
+		return readout.digitize(events.filter(events['z'] <= READOUT_Z_LIMIT).dropEmpty())
+
+	def getCentroids(self, estimators = None):
+
+		# Centroid of every event with every estimator (all of them by default), columns x and y followed by the estimator name
+
+		estimators = list(CENTROID_ESTIMATORS) if estimators is None else estimators
+
+		events 		= RaggedEvents.fromDataFrame(self.readElectronsData(), 'step', ['x', 'y', 'z', 'e'])
+		collected 	= events.filter(events['z'] <= READOUT_Z_LIMIT).dropEmpty()
+
+		centroids = {'event': collected.ids}
+
+		for estimator in estimators:
+			for axis in ['x', 'y']:
+				centroids[axis + estimator.capitalize()] = estimateCentroid(collected, axis, estimator)
+
+		return pd.DataFrame(centroids)
+
+	def getTiming(self):
+
+		# Timing columns of eventsData when it was reconstructed with them, the electrons file otherwise
+
+		if(set(TIMING_COLUMNS).issubset(self.eventsDataFrame.columns)):
+			return self.eventsDataFrame[['event'] + TIMING_COLUMNS]
+
+		events 		= RaggedEvents.fromDataFrame(self.readElectronsData(), 'step', ['z', 't'])
+		collected 	= events.filter(events['z'] <= READOUT_Z_LIMIT).dropEmpty()
+
+		return pd.DataFrame(dict(zip(['event'] + TIMING_COLUMNS, [collected.ids, *eventTiming(relativeTimes(collected))])))
+
 	def getGain(self):
 
 		self.gain 	 = np.array(self.eventsDataFrame['collected'])
@@ -257,14 +526,32 @@ class TGEM():
 		self.x 		=  np.array(self.eventsDataFrame['x'])
 		self.y 		=  np.array(self.eventsDataFrame['y'])
 
+	def getOccupancy(self, bins = OCCUPANCY_BINS):
+
+		# Electron hits on the readout when the electrons file is around, event centroids otherwise
+
+		occupancy = Occupancy2D(OCCUPANCY_X_RANGE, OCCUPANCY_Y_RANGE, bins)
+
+		try:
+			return occupancy.fillCsv(self.electronsDataPath, selection = lambda chunk: chunk['z'] <= READOUT_Z_LIMIT, columns = ['z'])
+
+		except OSError:
+			return occupancy.fill(self.x, self.y)
+
 
 class TTGEM():
 
-	def __init__(self, serial):
+	def __init__(self, serial, dataset = None, alignment = None):
 
 		self.serial = serial	
+		self.dataset = dataset
+		self.alignment = alignment
 		self.TTGEMDataPath  = TTGEM_DATA_PATH + str(serial) + '.csv'
 
+		# Groups holding this run, their caches are cleared when the run is realigned
+
+		self.groups = weakref.WeakSet()
+
 		self.getData()
 
 		self.getTGEMS()
@@ -275,12 +562,19 @@ class TTGEM():
 
 	def getData(self):
 
-		self.TTGEMdataFrame = pd.read_csv(self.TTGEMDataPath)
+		self.TTGEMdataFrame = self.dataset.getTTGEMData(self.serial) if self.dataset else pd.read_csv(self.TTGEMDataPath)
 
 		self.xMuon = np.array(self.TTGEMdataFrame['x'])
 		self.yMuon = np.array(self.TTGEMdataFrame['y'])
 		self.zMuon = np.array([ 0, -1*INTER_GEM_DISTANCE, -2*INTER_GEM_DISTANCE])
 
+		dx = np.array(self.TTGEMdataFrame['dx'])
+		dy = np.array(self.TTGEMdataFrame['dy'])
+		dz = np.array(self.TTGEMdataFrame['dz'])
+
+		self.thetaMuon 	= np.degrees(np.arccos(np.abs(dz)/np.sqrt(dx**2 + dy**2 + dz**2)))
+		self.phiMuon 	= np.degrees(np.arctan2(dy, dx))
+
 		self.areMuonsVertical =  len(np.unique(self.xMuon)) == 1 and len(np.unique(self.yMuon)) == 1
 
 		self.areMuonsCentral = self.areMuonsVertical and np.all(self.xMuon == 0) and np.all(self.yMuon == 0) 
@@ -289,7 +583,7 @@ class TTGEM():
 
 		self.serialsTGEMS = np.array(self.TTGEMdataFrame['name'])
 	
-		self.TGEMS   	= TGEMVect(self.serialsTGEMS)
+		self.TGEMS   	= TGEMVect(self.serialsTGEMS, self.dataset)
 
 		allDataFramesList = list(np.array(dataFrameVect(self.TGEMS, 'eventsDataFrame')))
 
@@ -301,7 +595,11 @@ class TTGEM():
 
 	def getGains(self):
 
-		self.gains = np.array(getAttrVectObj(self.TGEMS, 'gain'))
+		self.join = EventJoin([TGEM.eventIds for TGEM in self.TGEMS])
+
+		# reconstructEventsData drops events without collected electrons, so an event missing from a plane has gain 0 there
+
+		self.gains = self.join.padded([TGEM.gain for TGEM in self.TGEMS], fill = 0)
 
 		self.events = self.gains.shape[1]
 
@@ -312,18 +610,20 @@ class TTGEM():
 		self.getAverageGains()
 
 
+	def getGainSketches(self, k = QUANTILE_SKETCH_K):
+		return [QuantileSketch(k).update(gains) for gains in self.gains]
+
+	def getCoincidences(self, threshold):
+
+		# Pass/fail pattern of the planes in every event, a plane passes when its gain is not above the threshold
+
+		return CoincidenceCounts.fromFlags(self.gains <= threshold)
+
 	def getEfficiencies(self, threshold, mode):
 
-		if(mode == 'chain'):
-			conditionArray1 = self.gains[0] <= threshold
-			conditionArray2 = np.all(self.gains[:2] <= threshold, axis = 0)
-			conditionArray3 = np.all(self.gains <= threshold, axis = 0)
-		else:
-			conditionArray1 = self.gains[0] <= threshold
-			conditionArray2 = self.gains[1] <= threshold
-			conditionArray3 = self.gains[2] <= threshold
+		queries = chainQueries(len(self.gains)) if mode == 'chain' else independentQueries(len(self.gains))
 
-		return np.array([np.sum(conditionArray1)/self.events , np.sum(conditionArray2)/self.events, np.sum(conditionArray3)/self.events])
+		return self.getCoincidences(threshold).fractions(queries)
 
 	def getAverageGains(self):
 
@@ -335,17 +635,26 @@ class TTGEM():
 
 	def setMuonTracks(self):
 		
-		self.idTGEMArray = getAttrVectObj(self.TGEMS, "idArray")
+		self.idTGEMArray = np.ma.masked_array(np.broadcast_to(self.join.ids, self.join.rows.shape), mask = ~self.join.present)
+
+		# Centroids do not exist for missing events, numpy statistics on the masked arrays skip them
 
-		self.x = getAttrVectObj(self.TGEMS, "x")
-		self.y = getAttrVectObj(self.TGEMS, "y")
+		self.xMeasured = self.join.masked([TGEM.x for TGEM in self.TGEMS])
+		self.yMeasured = self.join.masked([TGEM.y for TGEM in self.TGEMS])
+
+		# Alignment constants (offsets and rotations of every plane) correct the measured centroids
+
+		if(self.alignment):
+			self.x, self.y = self.alignment.apply(self.xMeasured, self.yMeasured)
+		else:
+			self.x, self.y = self.xMeasured, self.yMeasured
 
 		self.xDifferences = self.x - self.xMuon.reshape(-1,1)
 		self.yDifferences = self.y - self.yMuon.reshape(-1,1)
 
 		self.differences = np.sqrt(self.xDifferences**2 + self.yDifferences**2) 
 
-		self.allDifferences = np.matrix.flatten(self.differences)
+		self.allDifferences = self.differences.compressed()
 
 		self.getAverageCoordinates()
 
@@ -372,18 +681,87 @@ class TTGEM():
 
 		self.allDifferencesDev = np.std(self.allDifferences)/np.sqrt(len(self.allDifferences))
 
-	def graphTrayectory(self):
+	def getOccupancies(self, bins = OCCUPANCY_BINS):
+		return [TGEM.getOccupancy(bins) for TGEM in self.TGEMS]
+
+	def getMuonTimes(self):
+
+		# Time (ns) at which the muon crosses every plane after the first one, straight path between the entry points
+
+		steps = np.sqrt(np.diff(self.xMuon)**2 + np.diff(self.yMuon)**2 + np.diff(np.array(self.TTGEMdataFrame['z']))**2)
+
+		return np.concatenate([[0], np.cumsum(steps)])/(np.array(self.TTGEMdataFrame['v'])[0]*SPEED_OF_LIGHT*1E-7)
+
+	def getTimeOfFlight(self):
+
+		# Measured time between consecutive planes per event: muon flight time plus the difference of the first arrivals
+
+		timings = [TGEM.getTiming() for TGEM in self.TGEMS]
+
+		self.timingJoin = EventJoin([np.array(timing['event']) for timing in timings])
 
-		x1, x2, x3 = self.x
-		y1, y2, y3 = self.y
+		self.tFirst = self.timingJoin.padded([np.array(timing['tFirst']) for timing in timings], np.nan)
 
-		z1, z2, z3 = 0, -1*INTER_GEM_DISTANCE, -2*INTER_GEM_DISTANCE
+		return np.diff(self.tFirst + self.getMuonTimes().reshape(-1, 1), axis = 0)
+
+	def getCentroidDifferences(self, estimators = None):
+
+		# (xDifferences, yDifferences) of every estimator against the muon entry points, masked where a plane missed the event
+
+		estimators = list(CENTROID_ESTIMATORS) if estimators is None else estimators
+
+		centroids = [TGEM.getCentroids(estimators) for TGEM in self.TGEMS]
+
+		join = EventJoin([np.array(planeCentroids['event']) for planeCentroids in centroids])
+
+		differences = {}
+
+		for estimator in estimators:
+
+			x = join.masked([np.array(planeCentroids['x' + estimator.capitalize()]) for planeCentroids in centroids])
+			y = join.masked([np.array(planeCentroids['y' + estimator.capitalize()]) for planeCentroids in centroids])
+
+			if(self.alignment):
+				x, y = self.alignment.apply(x, y)
+
+			differences[estimator] = (x - self.xMuon.reshape(-1, 1), y - self.yMuon.reshape(-1, 1))
+
+		return differences
+
+	def getElectronEvents(self):
+
+		# Electrons of every plane with times from the start of the track, every plane holds the events of any plane (empty where it has none)
+
+		planeEvents = [RaggedEvents.fromDataFrame(TGEM.readElectronsData(), 'step', ['x', 'y', 'z', 't', 'e']) for TGEM in self.TGEMS]
+
+		join = EventJoin([events.ids for events in planeEvents])
+
+		return [relativeTimes(events.take(rows, join.ids)) for events, rows in zip(planeEvents, join.rows)]
+
+	def getMapColumns(self, coordinates = 'position'):
+
+		# One row per (plane, event): plane index, muon coordinates of the plane and the per-event quantities
+
+		shape = self.gains.shape
+
+		xAxis, yAxis = MAP_COORDINATES[coordinates]
+
+		return {
+			'plane': np.broadcast_to(np.arange(shape[0]).reshape(-1, 1), shape).ravel(),
+			'x': np.broadcast_to(getattr(self, xAxis).reshape(-1, 1), shape).ravel(),
+			'y': np.broadcast_to(getattr(self, yAxis).reshape(-1, 1), shape).ravel(),
+			'gain': self.gains.ravel(),
+			'difference': np.ma.filled(self.differences, np.nan).ravel(),
+			'xDifference': np.ma.filled(self.xDifferences, np.nan).ravel(),
+			'yDifference': np.ma.filled(self.yDifferences, np.nan).ravel()}
+
+	def graphTrayectory(self, bins = OCCUPANCY_BINS):
 
 		fig = plt.figure()
 		ax  = fig.add_subplot(111, projection='3d')
-		ax.scatter(x1, y1, z1, color = 'blue', s = 3)
-		ax.scatter(x2, y2, z2, color = 'red', s = 3)
-		ax.scatter(x3, y3, z3, color = 'black', s = 3)
+
+		occupancyPlot(ax, self.getOccupancies(bins), self.zMuon)
+
 		ax.set_xlabel('x(cm)')
 		ax.set_ylabel('y(cm)')
 		ax.set_zlabel('z(m)')
@@ -456,8 +834,71 @@ class TTGEMGroup():
 		self.TTGEMArray = np.array(TTGEMArray, dtype = np.dtype('O')) 
 		self.tag = tag
 
+		self.cache 		= {}
+		self.cacheStats = {}
+
+		self.registerTTGEMs()
+
+		self.getJointDataFrame()
+
+	def registerTTGEMs(self):
+
+		for TTGEM in self.TTGEMArray:
+			TTGEM.groups.add(self)
+
+	def addTTGEMs(self, TTGEMArray):
+
+		self.TTGEMArray = np.append(self.TTGEMArray, np.array(TTGEMArray, dtype = np.dtype('O')))
+
+		self.registerTTGEMs()
+
+		self.invalidate()
+
 		self.getJointDataFrame()
 
+	def invalidate(self):
+
+		# Every derived quantity depends on TTGEMArray, the hit and miss counters are kept
+
+		self.cache.clear()
+
+	def getAlignmentChunks(self):
+
+		# Measured centroids and muon entry points of one run at a time, NaN where a plane missed the event
+
+		for TTGEM in self.TTGEMArray:
+			yield np.ma.filled(TTGEM.xMeasured, np.nan), np.ma.filled(TTGEM.yMeasured, np.nan), TTGEM.xMuon, TTGEM.yMuon
+
+	@memoized
+	def getAlignment(self, reference = 'muon', fixedPlanes = None, cut = ALIGNMENT_CUT):
+
+		planes = len(self.TTGEMArray[0].zMuon)
+
+		return Alignment(planes = planes).fit(self.getAlignmentChunks, self.TTGEMArray[0].zMuon, reference, fixedPlanes, cut)
+
+	def setAlignment(self, alignment):
+
+		# TTGEMs shared with other groups (subgroups, parents) are realigned too, so every group holding one of them is invalidated
+
+		groups = set()
+
+		for TTGEM in self.TTGEMArray:
+			TTGEM.alignment = alignment
+			TTGEM.setMuonTracks()
+
+			groups.update(TTGEM.groups)
+
+		for group in groups:
+			group.invalidate()
+
+	def getCacheStats(self):
+
+		stats = pd.DataFrame([[name, hits, misses] for name, (hits, misses) in self.cacheStats.items()], columns = ['method', 'hits', 'misses'])
+
+		stats['hitRate'] = stats['hits']/(stats['hits'] + stats['misses'])
+
+		return stats.sort_values('method', ignore_index = True)
+
 	def histGains(self):
 		pass
 
@@ -603,80 +1044,300 @@ class TTGEMGroup():
 
 		#plt.show()
 
+	def getOccupancies(self, bins = OCCUPANCY_BINS):
+
+		# One occupancy per plane, summed over every TTGEM of the group
+
+		occupancies = [TTGEM.getOccupancies(bins) for TTGEM in self.TTGEMArray]
+
+		return [mergeOccupancies(planeOccupancies) for planeOccupancies in zip(*occupancies)]
+
+	def graphOccupancies(self, bins = OCCUPANCY_BINS):
+
+		fig = plt.figure()
+
+		ax  = fig.add_subplot(111, projection='3d')
+
+		occupancyPlot(ax, self.getOccupancies(bins), [0, -1*INTER_GEM_DISTANCE, -2*INTER_GEM_DISTANCE])
+
+		ax.set_xlabel('x(cm)')
+		ax.set_ylabel('y(cm)')
+		ax.set_zlabel('z(cm)')
+
+		plt.title('Ocupación por TGEM {}'.format(self.tag))
+
+		plt.savefig(TTGEM_GRAPHS_PATH + 'occupancy{}.eps'.format(self.tag))
+
+	@memoized
+	def getStatisticsMap(self, coordinates = 'position', bins = MAP_BINS):
+
+		# Rows of every run stacked and accumulated in a single pass, bins is a number or a pair of edge arrays (or lists)
+
+		columnsList = [TTGEM.getMapColumns(coordinates) for TTGEM in self.TTGEMArray]
+
+		columns = {name: np.concatenate([TTGEMColumns[name] for TTGEMColumns in columnsList]) for name in columnsList[0]}
+
+		xBins, yBins = (bins, bins) if np.ndim(bins) == 0 else bins
+
+		statistics = BinnedStatistics(binEdges(columns['x'], xBins), binEdges(columns['y'], yBins), len(self.TTGEMArray[0].gains), MAP_QUANTITIES)
+
+		return statistics.fill(columns['plane'], columns['x'], columns['y'], columns)
+
+	def graphStatisticsMap(self, quantity = 'gain', coordinates = 'position', statistic = 'mean', bins = MAP_BINS):
+
+		statistics = self.getStatisticsMap(coordinates, bins)
+
+		fig, axes = plt.subplots(1, statistics.planes, figsize = (4*statistics.planes, 4), sharey = True)
+
+		meshes = statistics.plot(axes, quantity, statistic)
+
+		xLabel, yLabel = MAP_COORDINATE_LABELS[coordinates]
+
+		for plane, ax in enumerate(axes):
+			ax.set_title('TGEM {}'.format(plane + 1))
+			ax.set_xlabel(xLabel)
+
+		axes[0].set_ylabel(yLabel)
+
+		fig.colorbar(meshes[0], ax = axes, label = MAP_QUANTITY_LABELS[quantity] if statistic != 'count' else 'Eventos')
+
+		fig.suptitle('{} ({}) por TGEM para muones {}'.format(MAP_QUANTITY_LABELS[quantity], statistic, self.tag))
+
+		plt.savefig(TTGEM_GRAPHS_PATH + 'map{}{}{}{}.eps'.format(quantity, coordinates, statistic, self.tag), format = 'eps')
+
+		return fig
+
+	@memoized
+	def getTimeOfFlight(self):
+
+		return np.concatenate([TTGEM.getTimeOfFlight() for TTGEM in self.TTGEMArray], axis = 1)
+
+	@memoized
+	def getTimingResolution(self):
+
+		# Mean and spread of the time of flight of every pair of consecutive planes, the spread is the resolution of the pair
+
+		timeOfFlight = self.getTimeOfFlight()
+
+		return np.nanmean(timeOfFlight, axis = 1), np.nanstd(timeOfFlight, axis = 1)
+
+	@memoized
+	def getPileupPool(self):
+
+		# Events of every run on every plane, a background muon may come from any run
+
+		runs = [TTGEM.getElectronEvents() for TTGEM in self.TTGEMArray]
+
+		return [concatenateEvents([run[plane] for run in runs]) for plane in range(len(runs[0]))]
+
+	def getPileupEmulator(self, rate, window = PILEUP_WINDOW, seed = None):
+		return PileupEmulator(self.getPileupPool(), rate, window, seed)
+
+	def getPileupEventsData(self, rate, events, pileup = None, window = PILEUP_WINDOW, seed = None, readout = None, estimator = 'mean', chunkElectrons = PILEUP_CHUNK_ELECTRONS):
+
+		# Reconstructed overlaid events chunk by chunk: eventsData of every plane and the pool position of every trigger
+
+		emulator = self.getPileupEmulator(rate, window, seed)
+
+		for planeEvents, triggers in emulator.chunks(events, pileup, chunkElectrons):
+			yield [reconstructEvents(overlaid, readout, estimator) for overlaid in planeEvents], triggers
+
+	@memoized
+	def getPileupCoincidences(self, rate, events, devNum = 2, percentile = None, pileup = None, window = PILEUP_WINDOW, seed = PILEUP_SEED, chunkElectrons = PILEUP_CHUNK_ELECTRONS):
+
+		# Same threshold as without pile-up (the calibration of the detector), pattern counts added chunk by chunk
+
+		threshold = self.getThreshold(devNum, percentile)
+
+		coincidences = []
+
+		for eventsDataFrames, triggers in self.getPileupEventsData(rate, events, pileup, window, seed, chunkElectrons = chunkElectrons):
+
+			# Overlaid events are numbered 1..len(triggers), those without collected electrons have gain 0
+
+			gains = np.zeros((len(eventsDataFrames), len(triggers)))
+
+			for plane, eventsDataFrame in enumerate(eventsDataFrames):
+				gains[plane, np.array(eventsDataFrame['event']) - 1] = eventsDataFrame['collected']
+
+			coincidences.append(CoincidenceCounts.fromFlags(gains <= threshold))
+
+		return functools.reduce(lambda total, counts: total + counts, coincidences)
+
+	def getPileupEfficiencies(self, rates, events, devNum = 2, mode = 'chain', percentile = None, pileup = None, window = PILEUP_WINDOW, seed = PILEUP_SEED):
+
+		# (rates, planes) efficiencies, every rate with the same seed so the differences come from the pile-up only (seed None draws every rate apart)
+
+		planes = len(self.TTGEMArray[0].gains)
+
+		queries = chainQueries(planes) if mode == 'chain' else independentQueries(planes)
+
+		return np.array([self.getPileupCoincidences(rate, events, devNum, percentile, pileup, window, seed).fractions(queries) for rate in np.atleast_1d(rates)])
+
+	def getCentroidResolutions(self, estimators = None):
+
+		# Bias and spread of the centroid minus the muon entry point per estimator and plane, all runs together
+
+		rows = []
+
+		differencesByRun = [TTGEM.getCentroidDifferences(estimators) for TTGEM in self.TTGEMArray]
+
+		for estimator in differencesByRun[0]:
+
+			xDifferences = np.ma.concatenate([differences[estimator][0] for differences in differencesByRun], axis = 1)
+			yDifferences = np.ma.concatenate([differences[estimator][1] for differences in differencesByRun], axis = 1)
+
+			for plane in range(len(xDifferences)):
+				rows.append({
+					'estimator': estimator,
+					'plane': plane,
+					'events': int(np.ma.count(xDifferences[plane])),
+					'xBias': np.ma.mean(xDifferences[plane]),
+					'yBias': np.ma.mean(yDifferences[plane]),
+					'xResolution': np.ma.std(xDifferences[plane], ddof = 1),
+					'yResolution': np.ma.std(yDifferences[plane], ddof = 1),
+					'distance': np.ma.mean(np.sqrt(xDifferences[plane]**2 + yDifferences[plane]**2))})
+
+		return pd.DataFrame(rows)
+
+	@memoized
 	def getAxisMuonCoordinates(self, axis = 'x'):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, axis + 'Muon'))
 
+	@memoized
 	def getAxisAverageCoordinates(self, axis = 'x'):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, axis + 'Average'))
 
+	@memoized
 	def getAxisDevCoordinates(self, axis = 'x'):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, axis + 'Dev'))
 
+	@memoized
 	def getAllCoordinates(self, axis = 'x'):
 
 		return np.array(getAttrArrayVectObj(self.TTGEMArray, axis))
 
 
 
+	@memoized
 	def getAverageGains(self):
 
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'averageGain'))
 
+	@memoized
 	def getDevGains(self):
 
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'devGain')) 
 	
+	@memoized
 	def getAllGains(self):
 
-		return np.array(getAttrVectObj(self.TTGEMArray, 'allGains'))
+		# Runs may have different numbers of joined events
 
+		return np.concatenate([TTGEM.allGains for TTGEM in self.TTGEMArray])
+
+	@memoized
 	def getAverageGainsByTGEM(self):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, 'averageTGEMsGain'))
 	
+	@memoized
 	def getAllEventsNumber(self):
 
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'events'))
 
+	@memoized
 	def getTotalEvents(self):
 
 		return np.sum(self.getAllEventsNumber())
 
-	def getEfficiencyArray(self, devNum = 2, mode = 'chain'):
+	@memoized
+	def getGainStatistics(self):
+
+		allGains = self.getAllGains()
+
+		return np.mean(allGains), np.std(allGains)
+
+	@memoized
+	def getGainSketches(self, k = QUANTILE_SKETCH_K):
+
+		# One sketch per plane merged run by run, the gains of the group are never held together
+
+		sketches = [QuantileSketch(k) for plane in range(len(self.TTGEMArray[0].gains))]
+
+		for TTGEM in self.TTGEMArray:
+			for sketch, TTGEMSketch in zip(sketches, TTGEM.getGainSketches(k)):
+				sketch.merge(TTGEMSketch)
+
+		return sketches
+
+	@memoized
+	def getGainSketch(self, k = QUANTILE_SKETCH_K):
+
+		return functools.reduce(lambda total, sketch: total + sketch, self.getGainSketches(k))
+
+	@memoized
+	def getThreshold(self, devNum = 2, percentile = None):
+
+		# percentile of all gains from the sketch when given (robust to the avalanche tail), mean plus devNum deviations otherwise
+
+		if(percentile is not None):
+			return float(self.getGainSketch().percentile(percentile))
+
+		mu, std = self.getGainStatistics()
+
+		return mu + devNum*std
+
+	@memoized
+	def getEfficiencyArray(self, devNum = 2, mode = 'chain', percentile = None):
+
+		return np.array(getEfficienciesVect(self.TTGEMArray, self.getThreshold(devNum, percentile), mode))
+
+	@memoized
+	def getCoincidences(self, devNum = 2, percentile = None):
+
+		# Pattern counts of every run added up, same threshold as getEfficiencyArray
 
-		mu = np.mean(self.getAllGains())
+		threshold = self.getThreshold(devNum, percentile)
 
-		std = np.std(self.getAllGains())
+		return functools.reduce(lambda total, coincidences: total + coincidences, [TTGEM.getCoincidences(threshold) for TTGEM in self.TTGEMArray])
 
-		return np.array(getEfficienciesVect(self.TTGEMArray, mu + devNum*std, mode))
+	def getCoincidenceFractions(self, queries, devNum = 2, percentile = None):
+		return self.getCoincidences(devNum, percentile).fractions(queries)
 
-	def getAverageEfficiencyArray(self, devNum = 2, mode = 'chain'):
+	@memoized
+	def getAverageEfficiencyArray(self, devNum = 2, mode = 'chain', percentile = None):
 
-		efficiencyArray = self.getEfficiencyArray(devNum, mode)
+		efficiencyArray = self.getEfficiencyArray(devNum, mode, percentile)
 
 		return np.sum(((efficiencyArray*self.getAllEventsNumber().reshape(-1,1))/(self.getTotalEvents())), axis = 0 )
 
+	@memoized
 	def getDevGainsByTGEM(self):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, 'devTGEMsGain'))
 
 
 
+	@memoized
 	def getAverageDifferences(self):
 
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'allDifferencesAverage'))
 
+	@memoized
 	def getDevDifferences(self):
 
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'allDifferencesDev'))
 	
+	@memoized
 	def getAverageDifferencesByTGEM(self):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, 'differencesAverage'))
 	
+	@memoized
 	def getDevDifferencesByTGEM(self):
 
 		return np.array(getAttrVectObj(self.TTGEMArray, 'differencesDev'))
@@ -687,24 +1348,28 @@ class TTGEMGroup():
 		return np.array(getAttrSingleVectObj(self.TTGEMArray, 'totalGain'))
 	"""
 
+	@memoized
 	def getVertical(self):
 
 		index = getAttrSingleVectObj(self.TTGEMArray, 'areMuonsVertical')
 
 		return TTGEMGroup(self.TTGEMArray[index], tag = 'verticales')
 
+	@memoized
 	def getCentral(self):
 
 		index = getAttrSingleVectObj(self.TTGEMArray, 'areMuonsCentral')
 
 		return TTGEMGroup(self.TTGEMArray[index], tag = 'centrales')
 
+	@memoized
 	def getInclinated(self):
 
 		index = ~getAttrSingleVectObj(self.TTGEMArray, 'areMuonsVertical')
 
 		return TTGEMGroup(self.TTGEMArray[index], tag = 'inclinados')
 
+	@memoized
 	def getConstant(self, axis = 'x', value = 0):
 
 		coordinates = np.array(getAttrVectObj(self.TTGEMArray, axis + 'Muon'))
@@ -714,6 +1379,7 @@ class TTGEMGroup():
 		return TTGEMGroup(self.TTGEMArray[index], tag = self.tag)
 
 
+	@memoized
 	def getMovingIn(self, axis = 'x'):
 
 		coordinates = np.array(getAttrVectObj(self.TTGEMArray, axis + 'Muon'))
@@ -722,6 +1388,7 @@ class TTGEMGroup():
 
 		return TTGEMGroup(self.TTGEMArray[index], tag = self.tag)
 
+	@memoized
 	def getMovingTo(self, mode = '+x'):
 
 		sign = mode[0]
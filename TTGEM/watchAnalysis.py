@@ -0,0 +1,34 @@
+import sys
+import time
+import numpy as np
+from watchModule import *
+
+#	Watch mode: python watchAnalysis.py [seconds between polls]
+
+pollInterval = float(sys.argv[1]) if len(sys.argv) > 1 else POLL_INTERVAL
+
+liveGroup = LiveTTGEMGroup()
+
+def report():
+
+	summary = liveGroup.getSummary()
+
+	print('eventos {}\tganancia {:.1f} +- {:.1f}\teficiencia 1sigma {}\teficiencia 2sigma {}'.format(summary['events'], summary['averageGain'], summary['devGain'], np.round(summary['efficiencies'][0], 3), np.round(summary['efficiencies'][1], 3)))
+
+	liveGroup.graphMonitor()
+
+try:
+
+	while(True):
+
+		if(liveGroup.poll()):
+			report()
+
+		time.sleep(pollInterval)
+
+except KeyboardInterrupt:
+
+	# Stopped once the campaign is over, the events still pending in every run are joined
+
+	if(liveGroup.flush()):
+		report()
@@ -0,0 +1,405 @@
+import io
+import os
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from trackModule import EVENTS_DATA_PATH, TTGEM_DATA_PATH, TTGEM_GRAPHS_PATH, EventJoin
+from quantileModule import QuantileSketch
+
+#	Watch
+
+POLL_INTERVAL 		= 10
+
+TTGEM_PLANES 		= 3
+
+GAIN_BINS 			= np.linspace(0, 40000, 81)
+
+MONITOR_DEV_NUMS 	= [1, 2]
+
+# Polls without new rows after which a run is taken as finished and its pending events are joined (None never)
+
+RUN_IDLE_POLLS 		= 30
+
+#	Functions (Moments)
+
+def mergeMoments(countA, meanA, m2A, countB, meanB, m2B):
+
+	# Chan et al. pairwise update of (count, mean, sum of squared deviations)
+
+	count = countA + countB
+
+	if(count == 0):
+		return 0, 0.0, 0.0
+
+	delta = meanB - meanA
+
+	return count, meanA + delta*countB/count, m2A + m2B + delta**2*countA*countB/count
+
+def arrayMoments(values):
+
+	if(len(values) == 0):
+		return 0, 0.0, 0.0
+
+	mean = np.mean(values)
+
+	return len(values), mean, np.sum((values - mean)**2)
+
+#	Functions (Counts)
+
+def addCounts(counts, values):
+
+	# Counts of every integer gain (collected electrons) of every plane, grown up to the largest gain seen
+
+	size = max(counts.shape[1], int(np.max(values)) + 1)
+
+	counts = np.pad(counts, ((0, 0), (0, size - counts.shape[1])))
+
+	flat = (np.arange(len(values)).reshape(-1, 1)*size + values).ravel()
+
+	return counts + np.bincount(flat, minlength = counts.size).reshape(counts.shape)
+
+def countsFraction(counts, threshold):
+
+	# Fraction of the values not above the threshold, exact since the gains are integers
+
+	if(np.isnan(threshold)):
+		return np.full(len(counts), np.nan)
+
+	index = int(np.clip(np.floor(threshold), -1, counts.shape[1] - 1))
+
+	return np.sum(counts[:, :index + 1], axis = 1)/np.sum(counts, axis = 1)
+
+# Classes
+
+class CsvTail():
+
+	# Reads only the complete lines appended since the last call, a partially written last line waits for the next one
+
+	def __init__(self, filePath):
+
+		self.filePath 	= filePath
+		self.offset 	= 0
+		self.header 	= None
+
+	def read(self):
+
+		try:
+			size = os.path.getsize(self.filePath)
+
+		except OSError:
+			return self.empty()
+
+		if(size < self.offset):
+
+			# Rewritten from scratch
+
+			self.offset = 0
+			self.header = None
+
+		if(size == self.offset):
+			return self.empty()
+
+		with open(self.filePath, 'rb') as csvFile:
+			csvFile.seek(self.offset)
+			data = csvFile.read(size - self.offset)
+
+		end = data.rfind(b'\n')
+
+		if(end < 0):
+			return self.empty()
+
+		data = data[:end + 1]
+
+		self.offset += len(data)
+
+		if(self.header is None):
+
+			headerEnd 	= data.index(b'\n')
+			self.header = data[:headerEnd].decode().strip().split(',')
+			data 		= data[headerEnd + 1:]
+
+		if(len(data.strip()) == 0):
+			return self.empty()
+
+		return pd.read_csv(io.BytesIO(data), names = self.header, header = None)
+
+	def empty(self):
+		return pd.DataFrame(columns = [] if self.header is None else self.header)
+
+
+class LiveTTGEM():
+
+	# Growing TTGEMData/<serial>.csv and the eventsData of its planes, joined as TTGEM.getGains (a plane without the event has gain 0)
+
+	def __init__(self, serial):
+
+		self.serial = serial
+
+		self.planesTail = CsvTail(TTGEM_DATA_PATH + '{}.csv'.format(serial))
+
+		self.names 		= []
+		self.eventTails = []
+
+		# Rows of every plane not joined yet, kept only until the other planes catch up
+
+		self.ids 	= []
+		self.gains 	= []
+
+		# Every id up to this one is joined
+
+		self.joinedUpTo = 0
+
+		self.idlePolls = 0
+
+	def poll(self):
+
+		# Returns the per-plane gains of the new rows and the (planes, events) gains of the newly joined events
+
+		planes = self.planesTail.read()
+
+		for name in planes.get('name', []):
+
+			self.names.append(int(name))
+			self.eventTails.append(CsvTail(EVENTS_DATA_PATH + '{}.csv'.format(int(name))))
+
+			self.ids.append(np.array([], dtype = np.int64))
+			self.gains.append(np.array([], dtype = np.int64))
+
+		newGains = []
+
+		for i, eventTail in enumerate(self.eventTails):
+
+			events = eventTail.read()
+
+			if(len(events) > 0):
+
+				ids 	= np.array(events['event'], dtype = np.int64)
+				gains 	= np.array(events['collected'], dtype = np.int64)
+
+				# Rows of events already joined (written after a flush) only count in the plane gains
+
+				late = ids <= self.joinedUpTo
+
+				self.ids[i] 	= np.concatenate([self.ids[i], ids[~late]])
+				self.gains[i] 	= np.concatenate([self.gains[i], gains[~late]])
+
+			newGains.append(np.array(events['collected'], dtype = np.int64) if len(events) > 0 else np.array([], dtype = np.int64))
+
+		self.idlePolls = 0 if any(len(gains) > 0 for gains in newGains) else self.idlePolls + 1
+
+		if(len(self.ids) < TTGEM_PLANES or any(len(ids) == 0 for ids in self.ids)):
+			return newGains, np.empty((TTGEM_PLANES, 0), dtype = np.int64)
+
+		# Planes write their events in increasing id, so an event is final once every plane has written it or a later one
+
+		return newGains, self.joinPending(min(int(np.max(ids)) for ids in self.ids))
+
+	def flush(self):
+
+		# A finished run: a plane without a row for its last events never writes a later one, so every pending event is joined
+
+		if(len(self.ids) < TTGEM_PLANES or all(len(ids) == 0 for ids in self.ids)):
+			return np.empty((TTGEM_PLANES, 0), dtype = np.int64)
+
+		return self.joinPending(max(int(np.max(ids)) for ids in self.ids if len(ids) > 0))
+
+	def joinPending(self, joinedUpTo):
+
+		# (planes, events) gains of the pending events up to joinedUpTo, a plane without the event has gain 0
+
+		if(joinedUpTo <= self.joinedUpTo):
+			return np.empty((TTGEM_PLANES, 0), dtype = np.int64)
+
+		ready = [ids <= joinedUpTo for ids in self.ids]
+
+		join = EventJoin([ids[planeReady] for ids, planeReady in zip(self.ids, ready)])
+
+		joinedGains = join.padded([gains[planeReady] for gains, planeReady in zip(self.gains, ready)], fill = 0)
+
+		self.ids 	= [ids[~planeReady] for ids, planeReady in zip(self.ids, ready)]
+		self.gains 	= [gains[~planeReady] for gains, planeReady in zip(self.gains, ready)]
+
+		self.joinedUpTo = joinedUpTo
+
+		return joinedGains
+
+
+class LiveTTGEMGroup():
+
+	# Mergeable aggregates of every watched TTGEM: gain moments, gain histograms and the per-event chain statistics
+
+	def __init__(self, tag = '', idlePolls = RUN_IDLE_POLLS):
+
+		self.tag 		= tag
+		self.idlePolls 	= idlePolls
+
+		self.TTGEMs = {}
+
+		self.planeMoments 	= [(0, 0.0, 0.0) for plane in range(TTGEM_PLANES)]
+		self.planeHistogram = np.zeros((TTGEM_PLANES, len(GAIN_BINS) - 1), dtype = np.int64)
+
+		# Moments of the joined gains (the getAllGains of TTGEMGroup) and of the TTGEM gains
+
+		self.allMoments 	= (0, 0.0, 0.0)
+		self.TTGEMMoments 	= (0, 0.0, 0.0)
+
+		# Bounded memory quantiles of the plane gains and of the joined gains, for percentile thresholds
+
+		self.planeSketches 	= [QuantileSketch() for plane in range(TTGEM_PLANES)]
+		self.allSketch 		= QuantileSketch()
+
+		# Exact efficiencies at any threshold come from these counts per integer gain: chain uses running maxima, independent the plane gains
+
+		self.events = 0
+
+		self.chainCounts 		= np.zeros((TTGEM_PLANES, 0), dtype = np.int64)
+		self.independentCounts 	= np.zeros((TTGEM_PLANES, 0), dtype = np.int64)
+
+		self.history = []
+
+	def discover(self):
+
+		for fileName in sorted(os.listdir(TTGEM_DATA_PATH)):
+
+			if(fileName.endswith('.csv') and fileName[:-4] not in self.TTGEMs):
+				self.TTGEMs[fileName[:-4]] = LiveTTGEM(int(fileName[:-4]))
+
+	def poll(self):
+
+		# Returns True when something new was read
+
+		self.discover()
+
+		changed = False
+
+		for liveTTGEM in self.TTGEMs.values():
+
+			newGains, joinedGains = liveTTGEM.poll()
+
+			for plane, gains in enumerate(newGains[:TTGEM_PLANES]):
+
+				if(len(gains) > 0):
+
+					changed = True
+
+					self.planeMoments[plane] = mergeMoments(*self.planeMoments[plane], *arrayMoments(gains))
+					self.planeHistogram[plane] += np.histogram(gains, bins = GAIN_BINS)[0]
+
+					self.planeSketches[plane].update(gains)
+
+			if(self.idlePolls is not None and liveTTGEM.idlePolls >= self.idlePolls):
+				joinedGains = np.concatenate([joinedGains, liveTTGEM.flush()], axis = 1)
+
+			changed = self.addJoined(joinedGains) or changed
+
+		if(changed):
+			self.history.append(self.getSummary())
+
+		return changed
+
+	def flush(self):
+
+		# Joins the pending events of every run, for runs known to be finished
+
+		changed = False
+
+		for liveTTGEM in self.TTGEMs.values():
+			changed = self.addJoined(liveTTGEM.flush()) or changed
+
+		if(changed):
+			self.history.append(self.getSummary())
+
+		return changed
+
+	def addJoined(self, joinedGains):
+
+		if(joinedGains.shape[1] == 0):
+			return False
+
+		self.allMoments 	= mergeMoments(*self.allMoments, *arrayMoments(np.ravel(joinedGains)))
+		self.TTGEMMoments 	= mergeMoments(*self.TTGEMMoments, *arrayMoments(np.sum(joinedGains, axis = 0)))
+
+		self.allSketch.update(joinedGains)
+
+		self.events += joinedGains.shape[1]
+
+		self.chainCounts 		= addCounts(self.chainCounts, np.maximum.accumulate(joinedGains, axis = 0))
+		self.independentCounts 	= addCounts(self.independentCounts, joinedGains)
+
+		return True
+
+	def getTotalEvents(self):
+		return self.events
+
+	def getThreshold(self, devNum = 2, percentile = None):
+
+		# Same threshold as TTGEMGroup.getEfficiencyArray: percentile of all gains or mean plus devNum population deviations
+
+		if(percentile is not None):
+			return float(self.allSketch.percentile(percentile))
+
+		count, mean, m2 = self.allMoments
+
+		return mean + devNum*np.sqrt(m2/count) if count > 0 else np.nan
+
+	def getAverageEfficiencyArray(self, devNum = 2, mode = 'chain', percentile = None):
+
+		if(self.events == 0):
+			return np.full(TTGEM_PLANES, np.nan)
+
+		return countsFraction(self.chainCounts if mode == 'chain' else self.independentCounts, self.getThreshold(devNum, percentile))
+
+	def getAverageGains(self):
+
+		count, mean, m2 = self.TTGEMMoments
+
+		return mean, (np.sqrt(m2/count)/np.sqrt(count) if count > 0 else np.nan)
+
+	def getSummary(self):
+
+		averageGain, devGain = self.getAverageGains()
+
+		return {
+			'events': self.getTotalEvents(),
+			'averageGain': averageGain,
+			'devGain': devGain,
+			'planeGains': np.array([moments[1] for moments in self.planeMoments]),
+			'efficiencies': np.array([self.getAverageEfficiencyArray(devNum, 'chain') for devNum in MONITOR_DEV_NUMS])}
+
+	def graphMonitor(self, filePath = None):
+
+		# Gain and efficiency against the number of joined events, plus the gain histograms, redrawn from the aggregates only
+
+		filePath = TTGEM_GRAPHS_PATH + 'monitor{}.eps'.format(self.tag) if filePath is None else filePath
+
+		fig = Figure(figsize = (12, 4))
+		axes = fig.subplots(1, 3)
+
+		events = np.array([summary['events'] for summary in self.history])
+
+		axes[0].errorbar(events, [summary['averageGain'] for summary in self.history], yerr = [summary['devGain'] for summary in self.history], fmt = '.-', color = 'blue')
+		axes[0].set_xlabel('Eventos')
+		axes[0].set_ylabel('Ganancia TTGEM')
+
+		colors = ['blue', 'red', 'black']
+
+		for i, devNum in enumerate(MONITOR_DEV_NUMS):
+			for plane in range(TTGEM_PLANES):
+				axes[1].plot(events, [summary['efficiencies'][i][plane] for summary in self.history], color = colors[plane], linestyle = ['-', '--'][i % 2], label = 'TGEM {} ({}$\\sigma$)'.format(plane + 1, devNum))
+
+		axes[1].set_xlabel('Eventos')
+		axes[1].set_ylabel('Eficiencia apilada')
+		axes[1].legend()
+
+		for plane in range(TTGEM_PLANES):
+			axes[2].stairs(self.planeHistogram[plane], GAIN_BINS, color = colors[plane], label = 'TGEM {}'.format(plane + 1))
+
+		axes[2].set_xlabel('Ganancia')
+		axes[2].set_ylabel('Conteos')
+		axes[2].legend()
+
+		fig.tight_layout()
+		fig.savefig(filePath, format = 'eps')
+
+		return filePath